@@ -265,3 +265,69 @@ WAGTAILSEARCH_BACKENDS = {
         "INDEX_SETTINGS": {},
     }
 }
+
+# Meetup API client
+# ------------------------------------------------------------------------------
+# number of keep-alive connections held in the http pool of a MeetupApiClient
+MEETUP_API_POOL_SIZE = env.int("MEETUP_API_POOL_SIZE", default=10)
+# seconds to wait for a connection to api.meetup.com
+MEETUP_API_CONNECT_TIMEOUT = env.float("MEETUP_API_CONNECT_TIMEOUT", default=5.0)
+# seconds to wait for the server to send the response
+MEETUP_API_READ_TIMEOUT = env.float("MEETUP_API_READ_TIMEOUT", default=30.0)
+# requests which can be send at once, the others are spread evenly over the rate limit window
+MEETUP_API_RATE_LIMIT_BURST = env.int("MEETUP_API_RATE_LIMIT_BURST", default=1)
+# storage of the rate limit state, all api clients using the same storage share one budget
+# LocalRateLimitBackend: every thread of the process
+# FileRateLimitBackend: every process of the host, MEETUP_API_RATE_LIMIT_LOCATION is the path of the state file
+# RedisRateLimitBackend: every host, MEETUP_API_RATE_LIMIT_LOCATION is the alias of a django-redis cache
+MEETUP_API_RATE_LIMIT_BACKEND = env(
+    "MEETUP_API_RATE_LIMIT_BACKEND",
+    default="meetup_data_scraper.meetup_scraper.meetup_api_client.rate_limit_backends.LocalRateLimitBackend",
+)
+MEETUP_API_RATE_LIMIT_LOCATION = env("MEETUP_API_RATE_LIMIT_LOCATION", default="")
+# backoff of failed requests, the wait time is random between base & 3 times the last wait time up to max
+MEETUP_API_RETRY_BASE_DELAY = env.float("MEETUP_API_RETRY_BASE_DELAY", default=1.0)
+MEETUP_API_RETRY_MAX_DELAY = env.float("MEETUP_API_RETRY_MAX_DELAY", default=60.0)
+# max retries of all requests of a command, empty for no limit
+MEETUP_API_RETRY_BUDGET = env.int("MEETUP_API_RETRY_BUDGET", default=None)
+# path of a sqlite file to cache responses & revalidate them with conditional requests, empty to disable the cache
+MEETUP_API_RESPONSE_CACHE = env("MEETUP_API_RESPONSE_CACHE", default="")
+# max requests in flight of an AsyncMeetupApiClient
+MEETUP_API_CONCURRENCY = env.int("MEETUP_API_CONCURRENCY", default=10)
+# request the full group & event payloads instead of only the fields which are parsed
+MEETUP_API_FULL_PAYLOAD = env.bool("MEETUP_API_FULL_PAYLOAD", default=False)
+# circuit breaker per endpoint family (group, events & find): opens when the failure rate of the last window
+# requests is reached, fails fast while open & sends one probe request after the open time in seconds
+MEETUP_API_CIRCUIT_FAILURE_RATE = env.float(
+    "MEETUP_API_CIRCUIT_FAILURE_RATE", default=0.5
+)
+MEETUP_API_CIRCUIT_WINDOW = env.int("MEETUP_API_CIRCUIT_WINDOW", default=20)
+MEETUP_API_CIRCUIT_OPEN_TIME = env.float("MEETUP_API_CIRCUIT_OPEN_TIME", default=60.0)
+# create a wagtail revision for every scraped group & event, without revisions the pages are saved live directly
+# & the events are added in bulk
+MEETUP_API_PAGE_REVISIONS = env.bool("MEETUP_API_PAGE_REVISIONS", default=False)
+# how many venues, members, photos, categories & topics are cached per run
+MEETUP_API_IDENTITY_MAP_SIZE = env.int("MEETUP_API_IDENTITY_MAP_SIZE", default=10000)
+# json decoder of the responses: "auto" uses orjson when it is installed, "orjson" or "json" for the standard library
+MEETUP_API_JSON_DECODER = env("MEETUP_API_JSON_DECODER", default="auto")
+# decode the events pages while they are downloaded & add the events in batches of this size, 0 to load whole pages
+MEETUP_API_STREAM_BATCH_SIZE = env.int("MEETUP_API_STREAM_BATCH_SIZE", default=0)
+# seconds without heartbeat until the crawl job of a crawl_worker is queued again
+MEETUP_API_CRAWL_LEASE_TIMEOUT = env.float(
+    "MEETUP_API_CRAWL_LEASE_TIMEOUT", default=300.0
+)
+# how many times a crawl job is claimed by a crawl_worker before it fails
+MEETUP_API_CRAWL_MAX_ATTEMPTS = env.int("MEETUP_API_CRAWL_MAX_ATTEMPTS", default=3)
+# days between the updates of a group in update_groups, it follows the median gap of the latest events within min &
+# max, groups with less than 2 events use the default
+MEETUP_API_SCHEDULE_MIN_INTERVAL = env.float(
+    "MEETUP_API_SCHEDULE_MIN_INTERVAL", default=1.0
+)
+MEETUP_API_SCHEDULE_MAX_INTERVAL = env.float(
+    "MEETUP_API_SCHEDULE_MAX_INTERVAL", default=90.0
+)
+MEETUP_API_SCHEDULE_DEFAULT_INTERVAL = env.float(
+    "MEETUP_API_SCHEDULE_DEFAULT_INTERVAL", default=7.0
+)
+# max requests of one update_groups run, 0 for no limit
+MEETUP_API_SCHEDULE_BUDGET = env.int("MEETUP_API_SCHEDULE_BUDGET", default=0)
@@ -37,6 +37,11 @@ CACHES = {
         },
     }
 }
+# share one meetup api rate limit between every crawler of the cluster
+MEETUP_API_RATE_LIMIT_BACKEND = env(
+    "MEETUP_API_RATE_LIMIT_BACKEND",
+    default="meetup_data_scraper.meetup_scraper.meetup_api_client.rate_limit_backends.RedisRateLimitBackend",
+)
 
 # SECURITY
 # ------------------------------------------------------------------------------
@@ -49,3 +49,5 @@ EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
 # Your stuff...
 # ------------------------------------------------------------------------------
+MEETUP_API_RETRY_BASE_DELAY = 0.01
+MEETUP_API_RETRY_MAX_DELAY = 0.1
@@ -0,0 +1,38 @@
+import pytest
+import requests_mock
+from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
+    MeetupApiClient,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.rate_limit_backends import (
+    get_rate_limit_backend,
+)
+
+
+@pytest.fixture(autouse=True)
+def rate_limit_backend():
+    """
+    every test starts with an empty shared rate limit
+    """
+    backend = get_rate_limit_backend()
+    backend.clear()
+    yield backend
+    backend.clear()
+
+
+@pytest.fixture
+def mock_api_client():
+    """
+    create a MeetupApiClient, which sends the requests to a requests_mock adapter on mock://api.meetup.com/, the
+    keyword arguments are passed to the MeetupApiClient
+
+    return -> function, which returns (MeetupApiClient, requests_mock.Adapter)
+    """
+
+    def create_mock_api_client(**kwargs) -> (MeetupApiClient, requests_mock.Adapter):
+        api_client: MeetupApiClient = MeetupApiClient(**kwargs)
+        adapter: requests_mock.Adapter = requests_mock.Adapter()
+        api_client.session.mount("mock://", adapter)
+        api_client.base_url = "mock://api.meetup.com/"
+        return api_client, adapter
+
+    return create_mock_api_client
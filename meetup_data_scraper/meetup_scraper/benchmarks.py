@@ -0,0 +1,544 @@
+import gzip
+import json
+import multiprocessing
+import resource
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.db.models import Sum
+from django.db.models.functions import Length
+from django.test.utils import override_settings
+from django.utils import timezone
+from wagtail.core.models import PageRevision
+from wagtail.search.backends import get_search_backend_config
+
+from meetup_data_scraper.meetup_scraper.meetup_api_client.bulk_pages import (
+    bulk_add_children,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.cassette import (
+    get_entry_body,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.json_parser import (
+    get_event_from_response,
+    get_events_from_response,
+    parse_event_from_response,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.identity_map import (
+    IdentityMap,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.json_decoder import (
+    JSON_DECODERS,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
+    MeetupApiClient,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.session import (
+    create_session,
+)
+from meetup_data_scraper.meetup_scraper.models import EventPage, GroupPage, HomePage
+
+
+class StubMeetupHandler(BaseHTTPRequestHandler):
+    """
+    answer every GET request with a small json body & meetup rate limit headers
+    """
+
+    # HTTP/1.1 is needed to keep the connection alive between requests
+    protocol_version = "HTTP/1.1"
+
+    # send headers & body without waiting for the delayed ack of the client
+    disable_nagle_algorithm = True
+
+    # response body for every request, set by StubMeetupServer
+    body: bytes = b"{}"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json;charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.send_header("X-RateLimit-Limit", "1000000")
+        self.send_header("X-RateLimit-Remaining", "1000000")
+        self.send_header("X-RateLimit-Reset", "10")
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        # keep benchmark output clean
+        pass
+
+
+class StubMeetupServer:
+    """
+    local http server which simulates api.meetup.com for benchmarks
+    """
+
+    def __init__(self, body: dict = None):
+        """
+        Keyword arguments:
+        body -- json response for every request (default: {"id": 1})
+        """
+        super().__init__()
+
+        handler = type(
+            "Handler",
+            (StubMeetupHandler,),
+            {"body": json.dumps(body or {"id": 1}).encode("utf-8")},
+        )
+        self.server: ThreadingHTTPServer = ThreadingHTTPServer(
+            ("127.0.0.1", 0), handler
+        )
+        self.thread: threading.Thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        """
+        return the url of the server with a tailing slash
+        """
+        host, port = self.server.server_address
+        return "http://{}:{}/".format(host, port)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def requests_per_second(request, requests_count: int) -> float:
+    """
+    call request requests_count times and return the reached requests per second
+
+    Keyword arguments:
+    request -- function without arguments which sends a single request
+    requests_count -- how many requests to send
+
+    return -> requests per second
+    """
+    start: float = time.perf_counter()
+    for _ in range(requests_count):
+        request()
+    return requests_count / (time.perf_counter() - start)
+
+
+def benchmark_http_pool(requests_count: int = 500) -> dict:
+    """
+    compare requests per second against a local stub server with & without connection pooling
+
+    Keyword arguments:
+    requests_count -- requests per run (default 500)
+
+    return -> dict with the requests per second for "without_pool" & "with_pool"
+    """
+    with StubMeetupServer() as server:
+        url: str = "{}Meetup-API-Testing".format(server.base_url)
+
+        # new connection for every request, like the module-level requests.get
+        without_pool: float = requests_per_second(
+            lambda: requests.get(url, headers={"Connection": "close"}).json(),
+            requests_count,
+        )
+
+        session: requests.Session = create_session()
+        with_pool: float = requests_per_second(
+            lambda: session.get(url).json(), requests_count
+        )
+        session.close()
+
+    return {"without_pool": without_pool, "with_pool": with_pool}
+
+
+def get_benchmark_event_response(meetup_id: str) -> dict:
+    """
+    create an event response with venue, host & long description like a real events page
+
+    Keyword arguments:
+    meetup_id -- meetup id of the event
+
+    return -> event dict
+    """
+    return {
+        "id": meetup_id,
+        "name": "benchmark event {}".format(meetup_id),
+        "time": 1560639600000,
+        "link": "https://www.meetup.com/Meetup-API-Testing/events/{}/".format(
+            meetup_id
+        ),
+        "created": 1560639600000,
+        "description": "<p>{}</p>".format("benchmark description " * 100),
+        "duration": 7200000,
+        "event_hosts": [{"id": 1, "name": "benchmark host", "host_count": 1}],
+        "status": "past",
+        "updated": 1560639600000,
+        "utc_offset": 7200000,
+        "venue": {"id": 1, "name": "benchmark venue", "lat": 52.52, "lon": 13.4},
+        "visibility": "public",
+    }
+
+
+@contextmanager
+def without_search_index():
+    """
+    turn off the auto update of the search backends, so the benchmark pages are not added to a search index which
+    is not rolled back with the database & only the database is measured
+    """
+    search_backends: dict = {
+        name: {**params, "AUTO_UPDATE": False}
+        for name, params in get_search_backend_config().items()
+    }
+    with override_settings(WAGTAILSEARCH_BACKENDS=search_backends):
+        yield
+
+
+def measure_ingestion(ingest) -> dict:
+    """
+    run an ingestion once & measure it
+
+    Keyword arguments:
+    ingest -- function without arguments
+
+    return -> dict with "seconds", "queries", the new "revisions" & their "revision_bytes"
+    """
+    queries: [str] = []
+
+    def count_revisions() -> (int, int):
+        revisions: dict = PageRevision.objects.aggregate(
+            bytes=Sum(Length("content_json"))
+        )
+        return PageRevision.objects.count(), revisions["bytes"] or 0
+
+    revisions_before, revision_bytes_before = count_revisions()
+
+    def count_query(execute, sql, params, many, context):
+        queries.append(sql)
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count_query):
+        started: float = time.perf_counter()
+        ingest()
+        seconds: float = time.perf_counter() - started
+
+    revisions_after, revision_bytes_after = count_revisions()
+    return {
+        "seconds": seconds,
+        "queries": len(queries),
+        "revisions": revisions_after - revisions_before,
+        "revision_bytes": revision_bytes_after - revision_bytes_before,
+    }
+
+
+def create_benchmark_group(
+    urlname: str = "benchmark-group", meetup_id: int = 0
+) -> GroupPage:
+    """
+    create a GroupPage for the benchmark events, only create it in a transaction which is rolled back
+
+    Keyword arguments:
+    urlname -- urlname & slug of the group (default benchmark-group)
+    meetup_id -- meetup id of the group (default 0)
+
+    return -> new GroupPage
+    """
+    home_page: HomePage = HomePage.objects.all()[:1].get()
+    return home_page.add_child(
+        instance=GroupPage(
+            title="benchmark",
+            slug=urlname,
+            urlname=urlname,
+            meetup_id=meetup_id,
+            name="benchmark",
+            link="https://www.meetup.com/benchmark-group/",
+            members=0,
+            status="active",
+            timezone="UTC",
+            visibility="public",
+        )
+    )
+
+
+def benchmark_event_ingestion(events_count: int = 200) -> dict:
+    """
+    compare adding one events page event by event with & without revisions & as batch, everything is rolled back
+    at the end
+
+    Keyword arguments:
+    events_count -- events of the page (default 200)
+
+    return -> dict with the measure_ingestion result for "per_event_revisions", "per_event" & "batch"
+    """
+    with without_search_index(), transaction.atomic():
+        group: GroupPage = create_benchmark_group()
+
+        per_event_revisions_responses: [dict] = [
+            get_benchmark_event_response("benchmark-revisions-{}".format(number))
+            for number in range(events_count)
+        ]
+        per_event_responses: [dict] = [
+            get_benchmark_event_response("benchmark-per-event-{}".format(number))
+            for number in range(events_count)
+        ]
+        batch_responses: [dict] = [
+            get_benchmark_event_response("benchmark-batch-{}".format(number))
+            for number in range(events_count)
+        ]
+
+        def add_per_event_revisions():
+            for event_response in per_event_revisions_responses:
+                get_event_from_response(
+                    response=event_response, group=group, revisions=True
+                )
+
+        def add_per_event():
+            for event_response in per_event_responses:
+                get_event_from_response(response=event_response, group=group)
+
+        result: dict = {
+            "per_event_revisions": measure_ingestion(add_per_event_revisions),
+            "per_event": measure_ingestion(add_per_event),
+            "batch": measure_ingestion(
+                lambda: get_events_from_response(response=batch_responses, group=group)
+            ),
+        }
+
+        transaction.set_rollback(True)
+
+    return result
+
+
+def benchmark_event_parsing(events_count: int = 10000) -> dict:
+    """
+    measure the parser throughput of event responses to unsaved EventPages on one cpu core, the venues, members &
+    photos are cached in an identity map, so no query is sent while measuring
+
+    Keyword arguments:
+    events_count -- parsed events (default 10000)
+
+    return -> dict with the parsed "events_per_second" of cpu time
+    """
+    with without_search_index(), transaction.atomic():
+        group: GroupPage = create_benchmark_group()
+        identity_map: IdentityMap = IdentityMap()
+        event_responses: [dict] = [
+            get_benchmark_event_response("benchmark-parse-{}".format(number))
+            for number in range(events_count)
+        ]
+        parse_event_from_response(
+            response=event_responses[0], group=group, identity_map=identity_map
+        )
+
+        started: float = time.process_time()
+        for event_response in event_responses:
+            parse_event_from_response(
+                response=event_response, group=group, identity_map=identity_map
+            )
+        seconds: float = time.process_time() - started
+
+        transaction.set_rollback(True)
+
+    return {"events_per_second": events_count / seconds}
+
+
+def get_benchmark_bodies(cassette: str = None, pages: int = 20) -> [bytes]:
+    """
+    get json response bodies for the decode benchmark
+
+    Keyword arguments:
+    cassette -- archive recorded with --record, when None events pages of benchmark events are created
+    pages -- events pages with 200 events each, when no cassette is used (default 20)
+
+    return -> [bytes] raw json bodies
+    """
+    if cassette:
+        bodies: [bytes] = []
+        with gzip.open(cassette, "rt", encoding="utf-8") as archive:
+            for line in archive:
+                if not line.strip():
+                    continue
+                entry: dict = json.loads(line)
+                if entry["status"] == 200:
+                    bodies.append(get_entry_body(entry))
+        return bodies
+
+    return [
+        json.dumps(
+            [
+                get_benchmark_event_response("benchmark-{}-{}".format(page, number))
+                for number in range(200)
+            ]
+        ).encode("utf-8")
+        for page in range(pages)
+    ]
+
+
+def benchmark_json_decoding(bodies: [bytes], repeat: int = 5) -> dict:
+    """
+    compare the decode speed of response bodies with response.json() of requests & the available json decoders
+
+    Keyword arguments:
+    bodies -- raw json bodies
+    repeat -- how often every body is decoded (default 5)
+
+    return -> dict with the decoded megabytes per second by decoder name
+    """
+    megabytes: float = sum(len(body) for body in bodies) * repeat / 1024 / 1024
+
+    # requests decodes the bytes to text before the json module parses them
+    decoders: dict = {"requests": lambda body: json.loads(body.decode("utf-8"))}
+    decoders.update(JSON_DECODERS)
+
+    result: dict = {}
+    for name, decoder in decoders.items():
+        started: float = time.perf_counter()
+        for _ in range(repeat):
+            for body in bodies:
+                decoder(body)
+        result[name] = megabytes / (time.perf_counter() - started)
+    return result
+
+
+def measure_peak_rss(function) -> int:
+    """
+    run a function in a forked process & measure how much the peak resident memory grows, the peak of the forked
+    process starts at the current memory of this process
+
+    Keyword arguments:
+    function -- function without arguments
+
+    return -> peak rss growth in bytes
+    """
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+
+    def run():
+        peak_before: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        function()
+        peak_after: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in kilobytes on linux
+        sender.send((peak_after - peak_before) * 1024)
+
+    process = context.Process(target=run)
+    process.start()
+    peak_rss: int = receiver.recv()
+    process.join()
+    return peak_rss
+
+
+def benchmark_event_streaming(events_count: int = 200) -> dict:
+    """
+    compare the peak memory to download & decode one events page as whole & streamed from a local stub server
+
+    Keyword arguments:
+    events_count -- events of the page (default 200)
+
+    return -> dict with the "page_bytes" & the peak rss growth in bytes for "buffered" & "streamed"
+    """
+    events: [dict] = [
+        get_benchmark_event_response("benchmark-stream-{}".format(number))
+        for number in range(events_count)
+    ]
+    for event in events:
+        event["description"] = event["description"] * 20
+
+    with StubMeetupServer(body=events) as server:
+
+        def load_events(stream: bool):
+            api_client: MeetupApiClient = MeetupApiClient()
+            api_client.base_url = server.base_url
+            response, links = api_client.get_with_links(
+                "benchmark-group/events", stream=stream
+            )
+            for event in response:
+                pass
+
+        result: dict = {
+            "buffered": measure_peak_rss(lambda: load_events(stream=False)),
+            "streamed": measure_peak_rss(lambda: load_events(stream=True)),
+        }
+        result["page_bytes"] = len(json.dumps(events))
+
+    return result
+
+
+def benchmark_last_event(
+    events_count: int = 1000000, groups_count: int = 100, repeat: int = 100
+) -> dict:
+    """
+    compare the last event lookup of a group by the page path of its events & by the indexed group & time, the
+    events are spread over many groups & everything is rolled back at the end
+
+    Keyword arguments:
+    events_count -- events of all groups (default 1000000)
+    groups_count -- groups of the events (default 100)
+    repeat -- lookups per measure (default 100)
+
+    return -> dict with the milliseconds per lookup for "path" & "group" & the "plan" of both queries
+    """
+    with without_search_index(), transaction.atomic():
+        groups: [GroupPage] = [
+            create_benchmark_group(
+                urlname="benchmark-group-{}".format(number), meetup_id=-number - 1
+            )
+            for number in range(groups_count)
+        ]
+
+        # the events of a group are added in batches, with times in random order
+        batch_size: int = 5000
+        for group_number, group in enumerate(groups):
+            group_events: int = events_count // groups_count + (
+                1 if group_number < events_count % groups_count else 0
+            )
+            for start in range(0, group_events, batch_size):
+                bulk_add_children(
+                    group,
+                    [
+                        EventPage(
+                            title="benchmark",
+                            slug="benchmark-{}-{}".format(group_number, number),
+                            meetup_id="benchmark-{}-{}".format(group_number, number),
+                            name="benchmark",
+                            link="https://www.meetup.com/benchmark-group/",
+                            time=datetime.fromtimestamp(
+                                1262304000 + (number * 7919 % group_events) * 3600,
+                                timezone.utc,
+                            ),
+                            group=group,
+                        )
+                        for number in range(
+                            start, min(start + batch_size, group_events)
+                        )
+                    ],
+                )
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+        group: GroupPage = groups[len(groups) // 2]
+        queries: dict = {
+            "path": EventPage.objects.live()
+            .descendant_of(group)
+            .order_by("-time")[:1],
+            "group": group.events()[:1],
+        }
+
+        result: dict = {"plan": {}}
+        for name, query in queries.items():
+            if query.get().time != queries["path"].get().time:
+                raise CommandError("The {} query found another last event".format(name))
+            started: float = time.perf_counter()
+            for _ in range(repeat):
+                query.get()
+            result[name] = (time.perf_counter() - started) / repeat * 1000
+            result["plan"][name] = query.explain()
+
+        transaction.set_rollback(True)
+
+    return result
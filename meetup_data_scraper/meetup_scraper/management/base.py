@@ -0,0 +1,101 @@
+from django.core.management.base import BaseCommand, CommandError
+from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
+    MeetupApiClient,
+)
+from meetup_data_scraper.meetup_scraper.models import CrawlState
+
+# crawl states which are loaded per query
+CRAWL_STATE_BATCH_SIZE: int = 500
+
+
+class ApiClientCommand(BaseCommand):
+    """
+    base command for commands which load data with the MeetupApiClient
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--record",
+            type=str,
+            help="Append every response to this cassette archive",
+        )
+        parser.add_argument(
+            "--replay",
+            type=str,
+            help="Load every response from this cassette archive instead of the Meetup API",
+        )
+        parser.add_argument(
+            "--full_payload",
+            action="store_true",
+            help="Request all fields of groups & events instead of only the parsed ones",
+        )
+
+    def get_api_client(self, options: dict) -> MeetupApiClient:
+        """
+        create a MeetupApiClient which records or replays responses when the options are set
+
+        Keyword arguments:
+        options -- command options
+
+        return -> MeetupApiClient
+        """
+        if options.get("record") and options.get("replay"):
+            raise CommandError("--record and --replay can not be used together")
+
+        api_client: MeetupApiClient = MeetupApiClient(
+            full_payload=options.get("full_payload") or None
+        )
+        if options.get("record"):
+            api_client.record(options["record"])
+        if options.get("replay"):
+            api_client.replay(options["replay"])
+        return api_client
+
+    def get_crawl_states(
+        self, crawl: str, urlnames: [str], resume: bool
+    ) -> {str: CrawlState}:
+        """
+        get the crawl states of groups, missing states are created as pending
+
+        Keyword arguments:
+        crawl -- name of the command
+        urlnames -- Meetup group urlnames
+        resume -- keep the states of an earlier run, else they are reset to pending
+
+        return -> {urlname: CrawlState}
+        """
+        crawl_states: {str: CrawlState} = {}
+
+        # query in batches, so a big groups file stays below the query parameter limit of sqlite
+        for start in range(0, len(urlnames), CRAWL_STATE_BATCH_SIZE):
+            batch: [str] = urlnames[start : start + CRAWL_STATE_BATCH_SIZE]
+            if not resume:
+                CrawlState.objects.filter(crawl=crawl, urlname__in=batch).delete()
+
+            CrawlState.objects.bulk_create(
+                [CrawlState(crawl=crawl, urlname=urlname) for urlname in batch],
+                ignore_conflicts=True,
+            )
+            for crawl_state in CrawlState.objects.filter(
+                crawl=crawl, urlname__in=batch
+            ):
+                crawl_states[crawl_state.urlname] = crawl_state
+
+        return crawl_states
+
+    def print_api_client_report(self, api_client: MeetupApiClient):
+        """
+        print the rate limit, retry, circuit breaker, identity map & cache metrics of the api client
+
+        Keyword arguments:
+        api_client -- MeetupApiClient of the command
+        """
+        print("Rate limit: {}".format(api_client.rate_limit.report()))
+        print("Retries: {}".format(api_client.retry_policy.report()))
+        print("Circuit breakers: {}".format(api_client.circuit_breakers.report()))
+        print("Downloaded: {}".format(api_client.download_report()))
+        print("Identity map: {}".format(api_client.identity_map.report()))
+        if api_client.response_cache:
+            print("Response cache: {}".format(api_client.response_cache.report()))
+        if api_client.recorder:
+            print("Recorded: {} responses".format(api_client.recorder.responses))
@@ -0,0 +1,108 @@
+from django.core.management.base import BaseCommand
+from meetup_data_scraper.meetup_scraper.benchmarks import (
+    benchmark_event_ingestion,
+    benchmark_event_parsing,
+    benchmark_event_streaming,
+    benchmark_json_decoding,
+    get_benchmark_bodies,
+    benchmark_http_pool,
+    benchmark_last_event,
+)
+
+
+class Command(BaseCommand):
+    help = "run performance benchmarks against a local stub server"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--suite",
+            type=str,
+            choices=["http", "ingest", "parse", "decode", "stream", "last_event"],
+            default="http",
+            help="Which benchmark to run",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=500,
+            help="How many requests to send per run",
+        )
+        parser.add_argument(
+            "--events",
+            type=int,
+            default=200,
+            help="How many events the ingested events page has",
+        )
+        parser.add_argument(
+            "--parsed_events",
+            type=int,
+            default=10000,
+            help="How many events are parsed by the parse suite",
+        )
+        parser.add_argument(
+            "--stored_events",
+            type=int,
+            default=1000000,
+            help="How many events are in the database for the last_event suite",
+        )
+        parser.add_argument(
+            "--cassette",
+            type=str,
+            help="Decode the responses of this cassette archive in the decode suite",
+        )
+
+    def handle(self, *args, **options):
+        if options["suite"] == "http":
+            result: dict = benchmark_http_pool(requests_count=options["requests"])
+            print(
+                "without pool: {:.1f} requests/sec\nwith pool: {:.1f} requests/sec".format(
+                    result["without_pool"], result["with_pool"]
+                )
+            )
+
+        if options["suite"] == "ingest":
+            result: dict = benchmark_event_ingestion(events_count=options["events"])
+            for name in ["per_event_revisions", "per_event", "batch"]:
+                print(
+                    "{}: {:.2f} sec, {} queries, {:.1f} events/sec, "
+                    "{:.0f} revisions & {:.1f} MB revisions per 10k events".format(
+                        name,
+                        result[name]["seconds"],
+                        result[name]["queries"],
+                        options["events"] / result[name]["seconds"],
+                        result[name]["revisions"] * 10000 / options["events"],
+                        result[name]["revision_bytes"]
+                        * 10000
+                        / options["events"]
+                        / 1024
+                        / 1024,
+                    )
+                )
+
+        if options["suite"] == "parse":
+            result: dict = benchmark_event_parsing(
+                events_count=options["parsed_events"]
+            )
+            print(
+                "parse: {:.0f} events/sec per core".format(result["events_per_second"])
+            )
+
+        if options["suite"] == "decode":
+            bodies: [bytes] = get_benchmark_bodies(cassette=options["cassette"])
+            result: dict = benchmark_json_decoding(bodies)
+            for name, megabytes_per_second in result.items():
+                print("{}: {:.1f} MB/s".format(name, megabytes_per_second))
+
+        if options["suite"] == "stream":
+            result: dict = benchmark_event_streaming(events_count=options["events"])
+            print("page: {:.1f} MB".format(result["page_bytes"] / 1024 / 1024))
+            for name in ["buffered", "streamed"]:
+                print(
+                    "{}: peak rss +{:.1f} MB".format(name, result[name] / 1024 / 1024)
+                )
+
+        if options["suite"] == "last_event":
+            result: dict = benchmark_last_event(events_count=options["stored_events"])
+            for name in ["path", "group"]:
+                print("{}: {:.3f} ms per lookup".format(name, result[name]))
+                print("  {}".format(result["plan"][name].replace("\n", "\n  ")))
@@ -0,0 +1,161 @@
+from django.conf import settings
+from meetup_data_scraper.meetup_scraper.management.base import ApiClientCommand
+from meetup_data_scraper.meetup_scraper.management.commands.get_groups import (
+    get_group_with_events,
+)
+from meetup_data_scraper.meetup_scraper.management.commands.update_groups import (
+    update_group_events,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.crawl_queue import (
+    JobHeartbeat,
+    claim_job,
+    finish_job,
+    requeue_expired_jobs,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
+    MeetupApiClient,
+)
+from meetup_data_scraper.meetup_scraper.models import (
+    CrawlJob,
+    CrawlState,
+    EventPage,
+    GroupPage,
+)
+import os
+import socket
+import time
+
+
+class Command(ApiClientCommand):
+    help = "Crawl the groups which were queued by get_groups --enqueue & update_groups --enqueue"
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--worker",
+            type=str,
+            default="{}-{}".format(socket.gethostname(), os.getpid()),
+            help="Name of the worker, which leases the jobs",
+        )
+        parser.add_argument(
+            "--lease_timeout",
+            type=float,
+            default=settings.MEETUP_API_CRAWL_LEASE_TIMEOUT,
+            help="Seconds without heartbeat until a job of a worker is queued again",
+        )
+        parser.add_argument(
+            "--max_attempts",
+            type=int,
+            default=settings.MEETUP_API_CRAWL_MAX_ATTEMPTS,
+            help="How many times a job is claimed before it fails",
+        )
+        parser.add_argument(
+            "--max_jobs",
+            type=int,
+            default=0,
+            help="Stop after this many jobs, 0 for no limit",
+        )
+        parser.add_argument(
+            "--poll",
+            type=float,
+            default=0,
+            help="Seconds to wait for new jobs when the queue is empty, 0 to stop",
+        )
+
+    def run_job(
+        self, api_client: MeetupApiClient, job: CrawlJob
+    ) -> (GroupPage, [EventPage]):
+        """
+        crawl the group of a job, a job which was claimed before continues at the event cursor of its crawl state
+
+        Keyword arguments:
+        api_client -- MeetupApiClient of the worker
+        job -- running CrawlJob
+
+        return -> (GroupPage, [EventPage]), GroupPage is None when the group does not exist
+        """
+        crawl_state: CrawlState = self.get_crawl_states(
+            crawl=job.crawl, urlnames=[job.urlname], resume=True
+        )[job.urlname]
+
+        if job.crawl == "get_groups":
+            return get_group_with_events(
+                api_client=api_client,
+                group_urlname=job.urlname,
+                crawl_state=crawl_state,
+            )
+
+        try:
+            group: GroupPage = GroupPage.objects.get(urlname=job.urlname)
+        except GroupPage.DoesNotExist:
+            crawl_state.finish(CrawlState.GONE)
+            return None, []
+        return (
+            group,
+            update_group_events(
+                api_client=api_client, group=group, crawl_state=crawl_state
+            ),
+        )
+
+    def handle(self, *args, **options):
+        api_client: MeetupApiClient = self.get_api_client(options)
+
+        job_counter: int = 0
+        failed_counter: int = 0
+        event_counter: int = 0
+
+        while not options["max_jobs"] or job_counter < options["max_jobs"]:
+            requeue_expired_jobs(
+                lease_timeout=options["lease_timeout"],
+                max_attempts=options["max_attempts"],
+            )
+            job: CrawlJob = claim_job(worker=options["worker"])
+            if not job:
+                if options["poll"] > 0:
+                    time.sleep(options["poll"])
+                    continue
+                break
+            job_counter = job_counter + 1
+
+            heartbeat: JobHeartbeat = JobHeartbeat(
+                job=job, interval=options["lease_timeout"] / 3
+            )
+            error: Exception = None
+            try:
+                with heartbeat:
+                    group, group_events = self.run_job(api_client=api_client, job=job)
+            except Exception as e:
+                error = e
+
+            # the job was queued again & may run on another worker, so its result is abandoned
+            if heartbeat.lost:
+                print(
+                    "The lease of job {} was lost, the job is abandoned".format(job.pk)
+                )
+                continue
+
+            if error:
+                print("Job {} of {} failed: {!r}".format(job.pk, job.urlname, error))
+                failed_counter = failed_counter + 1
+                finish_job(
+                    job=job, error=repr(error), max_attempts=options["max_attempts"]
+                )
+                continue
+
+            if not finish_job(job=job):
+                print("The lease of job {} expired before it was done".format(job.pk))
+            event_counter = event_counter + len(group_events)
+            if group:
+                print(
+                    "Group {} was updatet with {} events".format(
+                        group.name, len(group_events)
+                    )
+                )
+
+        print(
+            "{} jobs was crawled with {} new events & {} failed".format(
+                job_counter, event_counter, failed_counter
+            )
+        )
+        self.print_api_client_report(api_client)
+        api_client.close()
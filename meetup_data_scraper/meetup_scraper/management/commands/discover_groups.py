@@ -0,0 +1,114 @@
+from meetup_data_scraper.meetup_scraper.management.base import ApiClientCommand
+from meetup_data_scraper.meetup_scraper.meetup_api_client.crawl_queue import (
+    enqueue_jobs,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.discovery import (
+    GroupDiscovery,
+    get_grid_cells,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.json_stream import (
+    iter_batches,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
+    MeetupApiClient,
+)
+from meetup_data_scraper.meetup_scraper.models import GroupPage
+
+# discovered groups which are queued at once
+DISCOVERY_BATCH_SIZE: int = 500
+
+
+class Command(ApiClientCommand):
+    help = "Find new groups around a location with Meetup find/groups & add them to the work queue of crawl_worker"
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--lat", type=float, required=True, help="Latitude of the center"
+        )
+        parser.add_argument(
+            "--lon", type=float, required=True, help="Longitude of the center"
+        )
+        parser.add_argument(
+            "--radius",
+            type=float,
+            default=50,
+            help="Miles from the center to the sides of the searched square",
+        )
+        parser.add_argument(
+            "--cell_size",
+            type=float,
+            default=25,
+            help="Side length in miles of the grid cells",
+        )
+        parser.add_argument(
+            "--min_cell_size",
+            type=float,
+            default=1,
+            help="Side length in miles of the smallest cell, when a cell has more groups than --max_pages it is split",
+        )
+        parser.add_argument(
+            "--categories",
+            type=str,
+            default="",
+            help="Comma separated meetup category ids, every cell is searched per category",
+        )
+        parser.add_argument(
+            "--page_size", type=int, default=200, help="Groups per request"
+        )
+        parser.add_argument(
+            "--max_pages",
+            type=int,
+            default=5,
+            help="Pages per cell & category until the cell is split",
+        )
+
+    def handle(self, *args, **options):
+        api_client: MeetupApiClient = self.get_api_client(options)
+
+        discovery: GroupDiscovery = GroupDiscovery(
+            api_client=api_client,
+            cells=get_grid_cells(
+                lat=options["lat"],
+                lon=options["lon"],
+                radius=options["radius"],
+                size=options["cell_size"],
+            ),
+            categories=[
+                int(category)
+                for category in options["categories"].split(",")
+                if category.strip()
+            ],
+            page_size=options["page_size"],
+            max_pages=options["max_pages"],
+            min_size=options["min_cell_size"],
+        )
+
+        known_counter: int = 0
+        job_counter: int = 0
+
+        for groups in iter_batches(discovery.iter_groups(), DISCOVERY_BATCH_SIZE):
+            # groups which are already in the database are updated by update_groups
+            known_meetup_ids: set = set(
+                GroupPage.objects.filter(
+                    meetup_id__in=[group["id"] for group in groups]
+                ).values_list("meetup_id", flat=True)
+            )
+            known_counter = known_counter + len(known_meetup_ids)
+            job_counter = job_counter + enqueue_jobs(
+                crawl="get_groups",
+                urlnames=[
+                    group["urlname"]
+                    for group in groups
+                    if group["id"] not in known_meetup_ids
+                ],
+            )
+
+        print(
+            "{} new groups was queued & {} are already known".format(
+                job_counter, known_counter
+            )
+        )
+        print("Discovery: {}".format(discovery.report()))
+        self.print_api_client_report(api_client)
+        api_client.close()
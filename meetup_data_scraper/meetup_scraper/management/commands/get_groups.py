@@ -1,49 +1,307 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from meetup_data_scraper.meetup_scraper.management.base import ApiClientCommand
 from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
     MeetupApiClient,
 )
-from meetup_data_scraper.meetup_scraper.models import GroupPage, EventPage
-import json
-import glob
+from meetup_data_scraper.meetup_scraper.meetup_api_client.async_meetup_api_client import (
+    AsyncMeetupApiClient,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.crawl_queue import (
+    enqueue_jobs,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.exceptions import (
+    TRANSIENT_ERRORS,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.group_files import (
+    get_group_files,
+    iter_group_urlnames,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.json_stream import (
+    iter_batches,
+)
+from meetup_data_scraper.meetup_scraper.models import (
+    CrawlState,
+    GroupPage,
+    EventPage,
+)
+from django.db import connection
+import asyncio
+import queue
+import threading
+
+# groups which are loaded per batch of the group files
+GROUP_BATCH_SIZE: int = 500
+
+
+async def get_groups_async(
+    group_urlnames: [str], concurrency: int, api_client: MeetupApiClient
+) -> [(GroupPage, [EventPage])]:
+    """
+    load the groups with the AsyncMeetupApiClient, the rate limit, retry policy, circuit breakers & identity map of
+    api_client are shared
+
+    Keyword arguments:
+    group_urlnames -- Meetup group urlnames
+    concurrency -- max requests in flight
+    api_client -- MeetupApiClient of the command, the downloaded bytes of the async api client are added to it
+
+    return -> [(GroupPage, [EventPage])] GroupPage is None when the group does not exist, a failed group is its
+              error
+    """
+    async with AsyncMeetupApiClient(
+        concurrency=concurrency,
+        rate_limit=api_client.rate_limit,
+        retry_policy=api_client.retry_policy,
+        full_payload=api_client.full_payload,
+        circuit_breakers=api_client.circuit_breakers,
+        identity_map=api_client.identity_map,
+    ) as async_api_client:
+        async_api_client.base_url = api_client.base_url
+        try:
+            return await async_api_client.get_groups(
+                group_urlnames, return_exceptions=True
+            )
+        finally:
+            api_client.bytes_downloaded = (
+                api_client.bytes_downloaded + async_api_client.bytes_downloaded
+            )
+
+
+def get_group_with_events(
+    api_client: MeetupApiClient,
+    group_urlname: str,
+    crawl_state: CrawlState = None,
+) -> (GroupPage, [EventPage]):
+    """
+    load a group & all its new events, the crawl state is pending while the group is loaded & done, gone or failed
+    afterwards, only a 404 or 410 of the group is gone & errors are raised after the crawl state failed
+
+    Keyword arguments:
+    api_client -- MeetupApiClient
+    group_urlname -- Meetup group urlname
+    crawl_state -- CrawlState of the group (default None)
+
+    return -> (GroupPage, [EventPage]), GroupPage is None when the group does not exist
+    """
+    if crawl_state:
+        crawl_state.start()
+
+    try:
+        group: GroupPage = api_client.get_group(group_urlname)
+        group_events: [EventPage] = []
+        if group:
+            group_events = api_client.update_all_group_events(
+                group=group, crawl_state=crawl_state
+            )
+    except Exception:
+        if crawl_state:
+            crawl_state.finish(CrawlState.FAILED)
+        raise
+
+    if crawl_state:
+        crawl_state.finish(CrawlState.DONE if group else CrawlState.GONE)
+    return group, group_events
+
+
+def get_groups_with_workers(
+    group_urlnames: [str],
+    workers: int,
+    api_client: MeetupApiClient,
+    crawl_states: {str: CrawlState} = None,
+) -> [(GroupPage, [EventPage])]:
+    """
+    load the groups & their events with a pool of worker threads, every worker has an own MeetupApiClient & db
+    connection, the rate limit, retry policy, circuit breakers & response cache of api_client are shared
+
+    Keyword arguments:
+    group_urlnames -- Meetup group urlnames
+    workers -- number of worker threads
+    api_client -- MeetupApiClient of the command, the metrics of the workers are added to it
+    crawl_states -- {urlname: CrawlState} of the groups (default None)
+
+    return -> [(GroupPage, [EventPage])] in the order of group_urlnames, GroupPage is None when the group does not
+              exist, a group which failed by one of the TRANSIENT_ERRORS is its error
+    """
+    tasks: queue.Queue = queue.Queue()
+    for task in enumerate(group_urlnames):
+        tasks.put(task)
+
+    results: [(GroupPage, [EventPage])] = [(None, [])] * len(group_urlnames)
+    errors: [Exception] = []
+    worker_api_clients: [MeetupApiClient] = []
+    lock: threading.Lock = threading.Lock()
+
+    def work():
+        worker_api_client: MeetupApiClient = MeetupApiClient(
+            retry_policy=api_client.retry_policy,
+            response_cache=api_client.response_cache,
+            full_payload=api_client.full_payload,
+            circuit_breakers=api_client.circuit_breakers,
+            rate_limit=api_client.rate_limit,
+        )
+        with lock:
+            worker_api_clients.append(worker_api_client)
+
+        try:
+            while not errors:
+                try:
+                    index, group_urlname = tasks.get_nowait()
+                except queue.Empty:
+                    break
+
+                try:
+                    results[index] = get_group_with_events(
+                        api_client=worker_api_client,
+                        group_urlname=group_urlname,
+                        crawl_state=(crawl_states or {}).get(group_urlname),
+                    )
+                except TRANSIENT_ERRORS as e:
+                    results[index] = e
+        except Exception as e:
+            with lock:
+                errors.append(e)
+        finally:
+            worker_api_client.session.close()
+            connection.close()
+
+    threads: [threading.Thread] = [
+        threading.Thread(target=work) for _ in range(max(1, workers))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for worker_api_client in worker_api_clients:
+        api_client.add_metrics(worker_api_client)
 
+    if errors:
+        raise errors[0]
+    return results
 
-class Command(BaseCommand):
+
+class Command(ApiClientCommand):
     help = "load all groups from json files stored in /meetup_groups/*.json"
 
     def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--json_path",
+            type=str,
+            help="Path of the meetup group files (json, ndjson, jsonl or csv)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="How many requests are send at the same time, more than 1 uses the async api client",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="How many groups are loaded at the same time by worker threads with own api clients",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip the groups which were finished by an earlier run & continue at their last events page",
+        )
         parser.add_argument(
-            "--json_path", type=str, help="Path of the meetup groups jsons",
+            "--enqueue",
+            action="store_true",
+            help="Add the groups to the work queue of crawl_worker instead of loading them",
         )
 
     def handle(self, *args, **options):
-        api_client: MeetupApiClient = MeetupApiClient()
+        if options["concurrency"] > 1 and (options["record"] or options["replay"]):
+            raise CommandError(
+                "--record and --replay only work with the sync api client, use --concurrency 1"
+            )
+        if options["workers"] > 1 and (options["record"] or options["replay"]):
+            raise CommandError(
+                "--record and --replay only work with one api client, use --workers 1"
+            )
+        if options["workers"] > 1 and options["concurrency"] > 1:
+            raise CommandError("use either --workers or --concurrency")
+
+        if not options["enqueue"]:
+            api_client: MeetupApiClient = self.get_api_client(options)
 
         if not options["json_path"]:
             options["json_path"] = "/app/meetup_groups"
 
-        mettup_groups_files: [] = glob.glob("{}/*.json".format(options["json_path"]))
-
         group_counter: int = 0
         group_not_exists_counter: int = 0
+        group_failed_counter: int = 0
         event_counter: int = 0
+        job_counter: int = 0
 
-        for mettup_groups_file in mettup_groups_files:
-            with open(mettup_groups_file) as json_file:
-                data = json.load(json_file)
-
-                for group_data in data:
-                    group: GroupPage = api_client.get_group(data[group_data]["urlname"])
+        # the urlnames are read lazily & loaded in batches, so the memory does not grow with the size of the files
+        for batch_urlnames in iter_batches(
+            iter_group_urlnames(get_group_files(options["json_path"])),
+            GROUP_BATCH_SIZE,
+        ):
+            crawl_states: {str: CrawlState} = self.get_crawl_states(
+                crawl="get_groups", urlnames=batch_urlnames, resume=options["resume"]
+            )
 
-                    #  break if group not exists
-                    if not group:
-                        group_not_exists_counter = group_not_exists_counter + 1
-                        break
+            # groups which were finished by an earlier run are only counted
+            group_urlnames: [str] = []
+            for group_urlname in batch_urlnames:
+                if crawl_states[group_urlname].status == CrawlState.DONE:
                     group_counter = group_counter + 1
+                elif crawl_states[group_urlname].status == CrawlState.GONE:
+                    group_not_exists_counter = group_not_exists_counter + 1
+                else:
+                    group_urlnames.append(group_urlname)
+
+            if options["enqueue"]:
+                job_counter = job_counter + enqueue_jobs(
+                    crawl="get_groups", urlnames=group_urlnames
+                )
+                continue
 
-                    group_events: [EventPage] = api_client.update_all_group_events(
-                        group=group
+            if options["concurrency"] > 1 or options["workers"] > 1:
+                if options["concurrency"] > 1:
+                    results: [(GroupPage, [EventPage])] = asyncio.run(
+                        get_groups_async(
+                            group_urlnames=group_urlnames,
+                            concurrency=options["concurrency"],
+                            api_client=api_client,
+                        )
+                    )
+                else:
+                    results: [(GroupPage, [EventPage])] = get_groups_with_workers(
+                        group_urlnames=group_urlnames,
+                        workers=options["workers"],
+                        api_client=api_client,
+                        crawl_states=crawl_states,
                     )
 
+                for group_urlname, result in zip(group_urlnames, results):
+                    # the async api client loads all groups before their crawl states are finished
+                    if options["concurrency"] > 1:
+                        if isinstance(result, Exception):
+                            crawl_states[group_urlname].finish(CrawlState.FAILED)
+                        else:
+                            crawl_states[group_urlname].finish(
+                                CrawlState.DONE if result[0] else CrawlState.GONE
+                            )
+
+                    # the failed group is tried again by the next run with --resume
+                    if isinstance(result, TRANSIENT_ERRORS):
+                        print("Group {} failed: {!r}".format(group_urlname, result))
+                        group_failed_counter = group_failed_counter + 1
+                        continue
+                    if isinstance(result, Exception):
+                        raise result
+
+                    group, group_events = result
+                    if not group:
+                        group_not_exists_counter = group_not_exists_counter + 1
+                        continue
+                    group_counter = group_counter + 1
                     event_counter = event_counter + len(group_events)
 
                     print(
@@ -51,9 +309,45 @@ class Command(BaseCommand):
                             group.name, len(group_events)
                         )
                     )
+                continue
+
+            for group_urlname in group_urlnames:
+                try:
+                    group, group_events = get_group_with_events(
+                        api_client=api_client,
+                        group_urlname=group_urlname,
+                        crawl_state=crawl_states[group_urlname],
+                    )
+                except TRANSIENT_ERRORS as e:
+                    # the failed group is tried again by the next run with --resume
+                    print("Group {} failed: {!r}".format(group_urlname, e))
+                    group_failed_counter = group_failed_counter + 1
+                    continue
+
+                #  skip the group if it not exists
+                if not group:
+                    group_not_exists_counter = group_not_exists_counter + 1
+                    continue
+                group_counter = group_counter + 1
+                event_counter = event_counter + len(group_events)
+
+                print(
+                    "Group {} was updatet with {} events".format(
+                        group.name, len(group_events)
+                    )
+                )
+
+        if options["enqueue"]:
+            print("{} groups was queued".format(job_counter))
+            return
 
         print(
-            "{} groups was updatet with {} new events & {} do not exists anymore".format(
-                group_counter, event_counter, group_not_exists_counter
+            "{} groups was updatet with {} new events, {} do not exists anymore & {} failed".format(
+                group_counter,
+                event_counter,
+                group_not_exists_counter,
+                group_failed_counter,
             )
         )
+        self.print_api_client_report(api_client)
+        api_client.close()
@@ -0,0 +1,64 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from meetup_data_scraper.meetup_scraper.models import EventPage, GroupPage
+from wagtail.core.models import PageRevision
+
+
+class Command(BaseCommand):
+    help = "delete the wagtail revisions of scraped groups & events"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--keep",
+            type=int,
+            default=0,
+            help="How many of the latest revisions per page are kept",
+        )
+        parser.add_argument(
+            "--batch_size",
+            type=int,
+            default=1000,
+            help="How many revisions are deleted per query",
+        )
+        parser.add_argument(
+            "--dry_run",
+            action="store_true",
+            help="Only print how many revisions would be deleted",
+        )
+
+    def handle(self, *args, **options):
+        revisions = PageRevision.objects.filter(
+            page__content_type__in=ContentType.objects.get_for_models(
+                GroupPage, EventPage
+            ).values()
+        )
+
+        # the latest revisions of every page are first
+        page_revisions: dict = {}
+        revision_ids: [int] = []
+        for page_id, revision_id in revisions.order_by(
+            "page_id", "-created_at", "-id"
+        ).values_list("page_id", "id"):
+            page_revisions[page_id] = page_revisions.get(page_id, 0) + 1
+            if page_revisions[page_id] > options["keep"]:
+                revision_ids.append(revision_id)
+
+        if options["dry_run"]:
+            print(
+                "{} of {} revisions would be deleted".format(
+                    len(revision_ids), sum(page_revisions.values())
+                )
+            )
+            return
+
+        batch_size: int = max(1, options["batch_size"])
+        for start in range(0, len(revision_ids), batch_size):
+            PageRevision.objects.filter(
+                id__in=revision_ids[start : start + batch_size]
+            ).delete()
+
+        print(
+            "Deleted {} revisions of {} pages".format(
+                len(revision_ids), len(page_revisions)
+            )
+        )
@@ -1,14 +1,19 @@
-from django.core.management.base import BaseCommand, CommandError
+from django.core.management.base import CommandError
+from meetup_data_scraper.meetup_scraper.management.base import ApiClientCommand
+from meetup_data_scraper.meetup_scraper.meetup_api_client.exceptions import (
+    TRANSIENT_ERRORS,
+)
 from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
     MeetupApiClient,
 )
 from meetup_data_scraper.meetup_scraper.models import GroupPage, EventPage
 
 
-class Command(BaseCommand):
+class Command(ApiClientCommand):
     help = "update singe group & add new past events"
 
     def add_arguments(self, parser):
+        super().add_arguments(parser)
         parser.add_argument(
             "--group_urlname",
             type=str,
@@ -20,7 +25,7 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
-        api_client: MeetupApiClient = MeetupApiClient()
+        api_client: MeetupApiClient = self.get_api_client(options)
 
         if options["sandbox"]:
             options["group_urlname"] = "Meetup-API-Testing"
@@ -30,13 +35,24 @@ class Command(BaseCommand):
                 "No group_urlname was given, add a group by --group_urlname GroupUrl or use the sandbox group by --sandbox"
             )
 
-        group: GroupPage = api_client.get_group(options["group_urlname"])
+        try:
+            group: GroupPage = api_client.get_group(options["group_urlname"])
+
+            if not group:
+                raise CommandError(
+                    "Group with urlname {} does not exists".format(
+                        options["group_urlname"]
+                    )
+                )
 
-        if not group:
+            group_events: [EventPage] = api_client.update_all_group_events(group=group)
+        except TRANSIENT_ERRORS as e:
             raise CommandError(
-                "Group with urlname {} does not exists".format(options["group_urlname"])
+                "Group with urlname {} could not be loaded: {!r}".format(
+                    options["group_urlname"], e
+                )
             )
 
-        group_events: [EventPage] = api_client.update_all_group_events(group=group)
-
         print("{} has been {} events added!".format(group.name, len(group_events)))
+        self.print_api_client_report(api_client)
+        api_client.close()
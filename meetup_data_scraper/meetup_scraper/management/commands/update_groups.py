@@ -1,24 +1,140 @@
-from django.core.management.base import BaseCommand
+from django.conf import settings
+from meetup_data_scraper.meetup_scraper.management.base import ApiClientCommand
 from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
     MeetupApiClient,
 )
-from meetup_data_scraper.meetup_scraper.models import GroupPage, EventPage
+from meetup_data_scraper.meetup_scraper.meetup_api_client.crawl_queue import (
+    enqueue_jobs,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.exceptions import (
+    TRANSIENT_ERRORS,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.scheduler import (
+    get_due_groups,
+)
+from meetup_data_scraper.meetup_scraper.models import (
+    CrawlState,
+    GroupPage,
+    EventPage,
+)
+
+
+def update_group_events(
+    api_client: MeetupApiClient, group: GroupPage, crawl_state: CrawlState
+) -> [EventPage]:
+    """
+    load all new events of a group, the crawl state is pending while the events are loaded & done or failed
+    afterwards, a failed crawl state keeps the cursor of the failed events page & the error is raised
+
+    Keyword arguments:
+    api_client -- MeetupApiClient
+    group -- GroupPage
+    crawl_state -- CrawlState of the group
+
+    return -> [EventPage] new events
+    """
+    crawl_state.start()
+    try:
+        group_events: [EventPage] = api_client.update_all_group_events(
+            group=group, crawl_state=crawl_state
+        )
+    except Exception:
+        crawl_state.finish(CrawlState.FAILED)
+        raise
+    crawl_state.finish(CrawlState.DONE)
+    return group_events
+
 
+class Command(ApiClientCommand):
+    help = "Update the due groups from Meetup Rest & add every new event fro groups"
 
-class Command(BaseCommand):
-    help = "Update all groups from Meetup Rest & add every new event fro groups"
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip the groups which were updated by an earlier run & continue at their last events page",
+        )
+        parser.add_argument(
+            "--enqueue",
+            action="store_true",
+            help="Add the groups to the work queue of crawl_worker instead of updating them",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Update every group instead of the groups which are due by their event cadence",
+        )
+        parser.add_argument(
+            "--budget",
+            type=int,
+            default=settings.MEETUP_API_SCHEDULE_BUDGET,
+            help="Max requests of the run, the most overdue groups are updated first, 0 for no limit",
+        )
 
     def handle(self, *args, **options):
-        api_client: MeetupApiClient = MeetupApiClient()
-        group: GroupPage = api_client.get_group("Meetup-API-Testing")
+        if options["all"]:
+            groups: [GroupPage] = list(GroupPage.objects.all())
+        else:
+            groups: [GroupPage] = get_due_groups()
+
+        crawl_states: {str: CrawlState} = self.get_crawl_states(
+            crawl="update_groups",
+            urlnames=[group.urlname for group in groups],
+            resume=options["resume"],
+        )
+
+        # groups which were updated by an earlier run are skipped
+        groups = [
+            group
+            for group in groups
+            if crawl_states[group.urlname].status != CrawlState.DONE
+        ]
+
+        if options["enqueue"]:
+            job_counter: int = enqueue_jobs(
+                crawl="update_groups", urlnames=[group.urlname for group in groups]
+            )
+            print("{} groups was queued".format(job_counter))
+            return
 
-        groups: [GroupPage] = GroupPage.objects.all()
+        api_client: MeetupApiClient = self.get_api_client(options)
+
+        group_counter: int = 0
+        group_failed_counter: int = 0
         event_counter: int = 0
 
         for group in groups:
-            group_events: [EventPage] = api_client.update_all_group_events(group=group)
+            if (
+                options["budget"]
+                and api_client.rate_limit.requests >= options["budget"]
+            ):
+                print(
+                    "The budget of {} requests is used, {} due groups are left".format(
+                        options["budget"],
+                        len(groups) - group_counter - group_failed_counter,
+                    )
+                )
+                break
+
+            try:
+                group_events: [EventPage] = update_group_events(
+                    api_client=api_client,
+                    group=group,
+                    crawl_state=crawl_states[group.urlname],
+                )
+            except TRANSIENT_ERRORS as e:
+                # the failed group continues at its cursor in the next run with --resume
+                print("Group {} failed: {!r}".format(group.urlname, e))
+                group_failed_counter = group_failed_counter + 1
+                continue
+            group_counter = group_counter + 1
             event_counter = event_counter + len(group_events)
 
         print(
-            "{} groups was updated & {} events added".format(len(groups), event_counter)
+            "{} groups was updated & {} events added, {} groups failed".format(
+                group_counter, event_counter, group_failed_counter
+            )
         )
+        self.print_api_client_report(api_client)
+        api_client.close()
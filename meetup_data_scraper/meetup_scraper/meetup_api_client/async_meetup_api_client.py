@@ -0,0 +1,494 @@
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+
+import aiohttp
+import pytz
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+from meetup_data_scraper.meetup_scraper.models import (
+    EventPage,
+    GroupPage,
+    HomePage,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.exceptions import (
+    CircuitOpenError,
+    HttpNoSuccess,
+    HttpNotFoundError,
+    HttpNotAccessibleError,
+    HttpNoXRateLimitHeader,
+)
+from .circuit_breaker import CircuitBreaker, CircuitBreakers
+from .identity_map import IdentityMap
+from .json_decoder import get_json_decoder
+from .json_parser import (
+    EVENT_FIELDS,
+    EVENT_OPTIONAL_FIELDS,
+    GROUP_FIELDS,
+    GROUP_OPTIONAL_FIELDS,
+    get_group_from_response,
+    get_events_from_response,
+)
+from .meetup_api_client import (
+    RateLimit,
+    add_projection,
+    create_circuit_breakers,
+    create_retry_policy,
+    get_events_url_path,
+    get_url,
+)
+from .retry import RetryPolicy
+from .rate_limit_backends import get_rate_limit_backend
+
+
+def delete_group(group_urlname: str):
+    """
+    delete the group with the group_urlname, if exists
+
+    Keyword arguments:
+    group_urlname -- Meetup group the urlname as string
+    """
+    GroupPage.objects.filter(urlname=group_urlname).delete()
+
+
+def set_events_updated(group: GroupPage):
+    """
+    save the time of the last complete events update of the group, which is used by the scheduler
+
+    Keyword arguments:
+    group -- GroupPage
+    """
+    GroupPage.objects.filter(pk=group.pk).update(events_updated=timezone.now())
+
+
+class AsyncMeetupApiClient:
+    """
+    asyncio sibling of the MeetupApiClient which sends up to concurrency requests at the same time,
+    every database access runs in a single sync worker thread so the event loop never waits for the ORM
+
+    use it as async context manager:
+
+        async with AsyncMeetupApiClient() as api_client:
+            groups = await api_client.get_groups(["Meetup-API-Testing"])
+    """
+
+    def __init__(
+        self,
+        concurrency: int = None,
+        rate_limit: RateLimit = None,
+        db_executor: Executor = None,
+        retry_policy: RetryPolicy = None,
+        full_payload: bool = None,
+        circuit_breakers: CircuitBreakers = None,
+        identity_map: IdentityMap = None,
+    ):
+        """
+        Keyword arguments:
+        concurrency -- max requests in flight (default: settings.MEETUP_API_CONCURRENCY)
+        rate_limit -- RateLimit to share with other clients, when None a new one on the configured backend is created
+        retry_policy -- when & how long to wait for retries, when None the policy is created from the settings
+        db_executor -- executor for the database access (default: ThreadPoolExecutor with one thread)
+        full_payload -- request all fields instead of only the parsed ones, when None
+                        settings.MEETUP_API_FULL_PAYLOAD is used
+        circuit_breakers -- circuit breakers to share with other clients, when None they are created from the settings
+        identity_map -- cache of the run to share with other clients, when None a new one is created
+        """
+        super().__init__()
+
+        if not concurrency:
+            concurrency = settings.MEETUP_API_CONCURRENCY
+        self.concurrency: int = max(1, concurrency)
+
+        self.rate_limit: RateLimit = rate_limit or RateLimit(
+            burst=settings.MEETUP_API_RATE_LIMIT_BURST,
+            backend=get_rate_limit_backend(),
+        )
+
+        # meetup apir url
+        self.base_url: str = "https://api.meetup.com/"
+
+        # backoff & retry budget of this client
+        self.retry_policy: RetryPolicy = retry_policy or create_retry_policy()
+
+        # fail fast while an endpoint family mostly fails
+        self.circuit_breakers: CircuitBreakers = (
+            circuit_breakers or create_circuit_breakers()
+        )
+
+        # only request the fields which are parsed
+        if full_payload is None:
+            full_payload = settings.MEETUP_API_FULL_PAYLOAD
+        self.full_payload: bool = full_payload
+
+        # response body bytes of the run
+        self.bytes_downloaded: int = 0
+
+        # snippets like venues & members which were already loaded in this run, only used by the db worker
+        self.identity_map: IdentityMap = identity_map or IdentityMap(
+            max_size=settings.MEETUP_API_IDENTITY_MAP_SIZE
+        )
+
+        # decodes the raw response bytes, orjson when it is installed
+        self.json_decoder = get_json_decoder(settings.MEETUP_API_JSON_DECODER)
+
+        # default homepage, page will created automatically on migrate
+        self.home_page: HomePage = None
+
+        # ORM calls are blocking, so run them outside of the event loop
+        self.own_db_executor: bool = db_executor is None
+        self.db_executor: Executor = db_executor or ThreadPoolExecutor(max_workers=1)
+
+        # created inside the event loop by __aenter__
+        self.session: aiohttp.ClientSession = None
+        self.semaphore: asyncio.Semaphore = None
+        self.rate_limit_lock: asyncio.Lock = None
+
+        # set timezone
+        timezone.activate(pytz.timezone("UTC"))
+
+    async def __aenter__(self):
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.rate_limit_lock = asyncio.Lock()
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.concurrency),
+            timeout=aiohttp.ClientTimeout(
+                connect=settings.MEETUP_API_CONNECT_TIMEOUT,
+                sock_read=settings.MEETUP_API_READ_TIMEOUT,
+            ),
+            headers={"Accept-Encoding": "gzip, deflate"},
+        )
+        return self
+
+    async def __aexit__(self, *args):
+        await self.session.close()
+
+        if self.own_db_executor:
+            # close the database connection of the sync worker thread
+            await self.run_db(connections.close_all)
+            self.db_executor.shutdown(wait=True)
+
+    async def run_db(self, func, *args, **kwargs):
+        """
+        run a blocking database function in the sync worker
+
+        Keyword arguments:
+        func -- function to run with args & kwargs
+
+        return -> result of func
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self.db_executor, partial(func, *args, **kwargs)
+        )
+
+    async def run_rate_limit(self, func, *args, **kwargs):
+        """
+        run a blocking function of the rate limit in the default executor, the shared rate limit backends lock a
+        file or ask redis
+
+        Keyword arguments:
+        func -- function to run with args & kwargs
+
+        return -> result of func
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+    async def wait_for_next_request(self):
+        """
+        wait until the shared rate limit allows the next request & reserve it
+        """
+        async with self.rate_limit_lock:
+            delay: float = await self.run_rate_limit(self.rate_limit.reserve)
+            while delay > 0:
+                await asyncio.sleep(delay)
+                self.rate_limit.record_wait(delay)
+                delay = await self.run_rate_limit(self.rate_limit.reserve)
+
+    def project(self, url_path: str, fields: [str], optional_fields: [str]) -> str:
+        """
+        add the projection query to an url path, unless the client requests full payloads
+
+        Keyword arguments:
+        url_path -- url path with or without query
+        fields -- top level fields of the response which should be send
+        optional_fields -- fields which the meetup api only sends on request
+
+        return -> url path
+        """
+        if self.full_payload:
+            return url_path
+        return add_projection(
+            url_path=url_path, fields=fields, optional_fields=optional_fields
+        )
+
+    async def get_home_page(self) -> HomePage:
+        """
+        get the default homepage wich will created on migration
+
+        return -> default HomePage
+        """
+        if not self.home_page:
+            self.home_page = await self.run_db(
+                lambda: HomePage.objects.all()[:1].get()
+            )
+        return self.home_page
+
+    async def get(
+        self,
+        url_path: str,
+        retry: int = 0,
+        max_retry: int = None,
+        reset_time: int = 60,
+    ) -> dict:
+        """
+        meetup http request on the url_path, failed requests are retried by the retry policy
+
+        Keyword arguments:
+        url_path -- url path without domain example for url https://api.meetup.com/find/groups is the url_path
+                    find/groups
+        retry -- how many times the url was already tried
+        max_retry -- max retries bevor raise an error, None to use the max retries of the retry policy
+        reset_time -- wait time in seconds (default: 60)
+
+        return -> json as python dict
+        """
+        response, links = await self.get_with_links(
+            url_path=url_path, retry=retry, max_retry=max_retry, reset_time=reset_time
+        )
+        return response
+
+    async def get_with_links(
+        self,
+        url_path: str,
+        retry: int = 0,
+        max_retry: int = None,
+        reset_time: int = 60,
+    ) -> (dict, dict):
+        """
+        meetup http request like get, which also returns the parsed Link header for the pagination
+
+        Keyword arguments:
+        url_path -- url path without domain or a full url of a Link header
+        retry -- how many times the url was already tried
+        max_retry -- max retries bevor raise an error, None to use the max retries of the retry policy
+        reset_time -- wait time in seconds (default: 60)
+
+        return -> (json as python dict, links by rel) example links {"next": {"url": "..."}}
+        """
+        circuit_breaker: CircuitBreaker = self.circuit_breakers.get_breaker(url_path)
+        circuit_breaker.before_request()
+
+        try:
+            response, links = await self.request(
+                url_path=url_path,
+                circuit_breaker=circuit_breaker,
+                retry=retry,
+                max_retry=max_retry,
+                reset_time=reset_time,
+            )
+        except (HttpNotFoundError, HttpNotAccessibleError):
+            # the server answered
+            circuit_breaker.record_success()
+            raise
+        except Exception:
+            circuit_breaker.record_failure()
+            raise
+
+        circuit_breaker.record_success()
+        return response, links
+
+    async def request(
+        self,
+        url_path: str,
+        circuit_breaker: CircuitBreaker,
+        retry: int = 0,
+        max_retry: int = None,
+        reset_time: int = 60,
+    ) -> (dict, dict):
+        """
+        send the request of get_with_links & retry it until it succeeds, the retry policy gives up or the circuit
+        breaker opens
+
+        Keyword arguments:
+        url_path -- url path without domain or a full url of a Link header
+        circuit_breaker -- CircuitBreaker of the endpoint family
+        retry -- how many times the url was already tried
+        max_retry -- max retries bevor raise an error, None to use the max retries of the retry policy
+        reset_time -- wait time in seconds (default: 60)
+
+        return -> (json as python dict, links by rel)
+        """
+        url: str = get_url(base_url=self.base_url, url_path=url_path)
+        delay: float = 0
+
+        while True:
+            retry_after: float = None
+
+            async with self.semaphore:
+                await self.wait_for_next_request()
+
+                try:
+                    async with self.session.get(url) as response:
+                        body: bytes = await response.read()
+                        self.bytes_downloaded = self.bytes_downloaded + len(body)
+
+                        if response.status == 404:
+                            raise HttpNotFoundError
+                        if response.status == 410:
+                            raise HttpNotAccessibleError
+
+                        if response.status == 200:
+                            try:
+                                await self.run_rate_limit(
+                                    self.rate_limit.update_rate_limit,
+                                    response=response,
+                                    reset_time=reset_time,
+                                )
+                                links: dict = {
+                                    rel: {"url": str(link["url"])}
+                                    for rel, link in response.links.items()
+                                }
+                                return self.json_decoder(body), links
+                            except HttpNoXRateLimitHeader:
+                                failure: str = "no_rate_limit_header"
+                        else:
+                            failure: str = RetryPolicy.failure_class(response.status)
+                            retry_after = RetryPolicy.retry_after(response)
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    failure: str = "connection"
+
+            # wait for the retry after the semaphore is released
+            if not self.retry_policy.should_retry(
+                failure=failure, retry=retry, max_retry=max_retry
+            ):
+                if failure == "no_rate_limit_header":
+                    raise HttpNoXRateLimitHeader("There is no XRateLimit Header!")
+                raise HttpNoSuccess
+
+            delay = self.retry_policy.next_delay(previous_delay=delay)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            await asyncio.sleep(delay)
+            retry = retry + 1
+
+            # other requests of the endpoint family opened the circuit while waiting
+            if circuit_breaker.is_open():
+                raise CircuitOpenError(
+                    "Circuit breaker of {} requests is open".format(circuit_breaker.name)
+                )
+
+    async def get_group(self, group_urlname: str) -> GroupPage:
+        """
+        get or create a GroupPage based on the group_urlname and fill / update the object from meetup rest api, the
+        TRANSIENT_ERRORS are raised so the group can be tried again
+
+        Keyword arguments:
+        group_urlname -- Meetup group the urlname as string
+
+        return -> GroupPage based on the group_urlname, None when the group is gone
+        """
+        try:
+            response: dict = await self.get(
+                self.project(
+                    "{}".format(group_urlname), GROUP_FIELDS, GROUP_OPTIONAL_FIELDS
+                )
+            )
+        except (HttpNotFoundError, HttpNotAccessibleError) as e:
+            await self.run_db(delete_group, group_urlname=group_urlname)
+            print(e)
+            return
+
+        home_page: HomePage = await self.get_home_page()
+        return await self.run_db(
+            get_group_from_response,
+            response=response,
+            home_page=home_page,
+            identity_map=self.identity_map,
+            revisions=settings.MEETUP_API_PAGE_REVISIONS,
+        )
+
+    async def update_all_group_events(
+        self, group: GroupPage, max_entries_per_page: int = 200
+    ) -> [EventPage]:
+        """
+        get all past events from meetup rest api & add it as child pages to the group
+
+        Keyword arguments:
+        group -- GroupPage
+        max_entries_per_page -- how much events get from the meetup rest api per request (default 200, min 10, max 200)
+
+        return -> [EventPage] every new Events wich wasn't in the database, the TRANSIENT_ERRORS of a page are raised
+        """
+
+        # set max_entries_per_page between 10 to 200
+        max_entries_per_page = min(max(max_entries_per_page, 10), 200)
+
+        # return [EventPage], init empty
+        events: [EventPage] = []
+
+        last_event: EventPage = await self.run_db(group.last_event)
+        url_path: str = self.project(
+            get_events_url_path(
+                group=group, last_event=last_event, max_entries=max_entries_per_page
+            ),
+            EVENT_FIELDS,
+            EVENT_OPTIONAL_FIELDS,
+        )
+
+        # follow the next cursors, the pages of one group depend on each other so they are loaded in order
+        requested_urls: set = set()
+        while url_path and url_path not in requested_urls:
+            requested_urls.add(url_path)
+
+            try:
+                response, links = await self.get_with_links(url_path)
+            except (HttpNotFoundError, HttpNotAccessibleError) as e:
+                print(e)
+                return events
+
+            group_events: [EventPage] = await self.run_db(
+                get_events_from_response,
+                response=response,
+                group=group,
+                revisions=settings.MEETUP_API_PAGE_REVISIONS,
+                identity_map=self.identity_map,
+            )
+            events.extend(group_events)
+            url_path = links.get("next", {}).get("url")
+
+        # the scheduler only counts an update which reached the last page
+        await self.run_db(set_events_updated, group=group)
+        return events
+
+    async def update_group(self, group_urlname: str) -> (GroupPage, [EventPage]):
+        """
+        get or create a group & add all its new past events
+
+        Keyword arguments:
+        group_urlname -- Meetup group the urlname as string
+
+        return -> (GroupPage, [EventPage]) GroupPage is None when the group does not exist
+        """
+        group: GroupPage = await self.get_group(group_urlname)
+        if not group:
+            return None, []
+        return group, await self.update_all_group_events(group=group)
+
+    async def get_groups(
+        self, group_urlnames: [str], return_exceptions: bool = False
+    ) -> [(GroupPage, [EventPage])]:
+        """
+        update many groups concurrently, limited by the concurrency of the client
+
+        Keyword arguments:
+        group_urlnames -- Meetup group urlnames
+        return_exceptions -- return the error of a failed group instead of raising it (default False)
+
+        return -> [(GroupPage, [EventPage])] in the order of group_urlnames
+        """
+        return await asyncio.gather(
+            *[self.update_group(group_urlname) for group_urlname in group_urlnames],
+            return_exceptions=return_exceptions,
+        )
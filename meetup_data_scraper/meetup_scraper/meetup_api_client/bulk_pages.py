@@ -0,0 +1,168 @@
+from django.db import connections, router, transaction
+from django.db.models import AutoField, F
+from django.utils import timezone
+from modelcluster.models import get_all_child_relations
+from treebeard.exceptions import PathOverflow
+from wagtail.core.models import Page
+from wagtail.search import index
+from wagtail.search.backends import get_search_backends
+
+
+def insert_rows(model, objs: list, fields: list):
+    """
+    insert the table rows of one model in batches, without the save signals
+
+    Keyword arguments:
+    model -- model of the table, for multi table inheritance every parent table is inserted on its own
+    objs -- model instances
+    fields -- concrete fields of the table
+    """
+    db: str = router.db_for_write(model)
+    batch_size: int = max(
+        1, connections[db].ops.bulk_batch_size(fields, objs) or len(objs)
+    )
+    for start in range(0, len(objs), batch_size):
+        model._base_manager.db_manager(db)._insert(
+            objs[start : start + batch_size], fields=fields
+        )
+
+
+def set_live(page: Page, now=None):
+    """
+    set the fields of a page like revision.publish() does, without creating a revision
+
+    Keyword arguments:
+    page -- page to publish, it is not saved
+    now -- publish time (default timezone.now())
+    """
+    now = now or timezone.now()
+    page.draft_title = page.title
+    page.live = True
+    page.has_unpublished_changes = False
+    page.first_published_at = page.first_published_at or now
+    page.last_published_at = now
+
+
+def publish_page(page: Page, revisions: bool = False) -> Page:
+    """
+    save & publish a page, scraped pages are never edited in the admin, so the revision is optional
+
+    Keyword arguments:
+    page -- saved page
+    revisions -- create & publish a wagtail revision (default False)
+
+    return -> Page the published page
+    """
+    if revisions:
+        page.save_revision().publish()
+    else:
+        set_live(page)
+        page.save()
+    return page
+
+
+def bulk_add_children(parent: Page, children: [Page], revisions: bool = False) -> [Page]:
+    """
+    add many new pages as last children of the parent with a few bulk queries instead of add_child & publish
+    for every page, the pages are live like after save_revision().publish()
+
+    Keyword arguments:
+    parent -- parent page
+    children -- unsaved pages of the same model, child relations like EventPage.event_hosts are saved too
+    revisions -- create & publish a wagtail revision for every page (default False)
+
+    return -> [Page] the saved children
+    """
+    if not children:
+        return children
+
+    model = type(children[0])
+    db: str = router.db_for_write(Page)
+
+    # child relations are only in memory until the pages have a primary key
+    child_relations: [(object, [(Page, list)])] = [
+        (
+            relation,
+            [
+                (child, list(getattr(child, relation.get_accessor_name()).all()))
+                for child in children
+            ],
+        )
+        for relation in get_all_child_relations(model)
+    ]
+
+    with transaction.atomic(using=db):
+        # lock the parent, so the paths of parallel inserts can not collide
+        locked_parent: Page = Page.objects.using(db).select_for_update().get(
+            pk=parent.pk
+        )
+
+        depth: int = locked_parent.depth + 1
+        step: int = 0
+        if locked_parent.numchild:
+            step = Page._str2int(locked_parent.get_last_child().path[-Page.steplen :])
+
+        path_length: int = Page._meta.get_field("path").max_length
+        now = timezone.now()
+        for position, child in enumerate(children, start=1):
+            child.depth = depth
+            child.path = Page._get_path(locked_parent.path, depth, step + position)
+            if len(child.path) > path_length:
+                raise PathOverflow(
+                    "The new node is too deep in the tree, try increasing the path.max_length property"
+                )
+            child.numchild = 0
+            child.set_url_path(locked_parent)
+            set_live(child, now=now)
+
+        # page table first, the ids are resolved by the unique path
+        insert_rows(
+            Page,
+            children,
+            [
+                field
+                for field in Page._meta.local_concrete_fields
+                if not isinstance(field, AutoField)
+            ],
+        )
+        page_ids: dict = dict(
+            Page.objects.using(db)
+            .filter(path__in=[child.path for child in children])
+            .values_list("path", "id")
+        )
+
+        # then the tables of the page models, which are linked by the parent pointer
+        parent_models: list = list(reversed(model._meta.get_parent_list()))
+        for child in children:
+            child.id = page_ids[child.path]
+            for parent_model in parent_models[1:] + [model]:
+                setattr(child, parent_model._meta.pk.attname, child.id)
+            child._state.adding = False
+            child._state.db = db
+
+        for table_model in parent_models[1:] + [model]:
+            insert_rows(table_model, children, table_model._meta.local_concrete_fields)
+
+        for relation, related in child_relations:
+            related_objs: list = []
+            for child, child_related_objs in related:
+                for related_obj in child_related_objs:
+                    setattr(related_obj, relation.field.attname, child.pk)
+                    related_objs.append(related_obj)
+            relation.related_model._base_manager.using(db).bulk_create(related_objs)
+
+        Page.objects.using(db).filter(pk=parent.pk).update(
+            numchild=F("numchild") + len(children)
+        )
+        parent.numchild = locked_parent.numchild + len(children)
+
+        if revisions:
+            for child in children:
+                child.save_revision().publish()
+
+    # the bulk insert skips the post_save signal of the search index
+    if index.class_is_indexed(model):
+        for backend in get_search_backends(with_auto_update=True):
+            backend.add_bulk(model, children)
+
+    return children
@@ -0,0 +1,183 @@
+import sqlite3
+
+from django.db import connections, models, router, transaction
+from wagtail.search import index
+from wagtail.search.backends import get_search_backends
+
+
+def supports_upsert(vendor: str) -> bool:
+    """
+    check if the database supports INSERT ... ON CONFLICT ... DO UPDATE
+
+    Keyword arguments:
+    vendor -- django database vendor
+
+    return -> True for postgresql & sqlite 3.24 or newer
+    """
+    if vendor == "postgresql":
+        return True
+    if vendor == "sqlite":
+        return sqlite3.sqlite_version_info >= (3, 24, 0)
+    return False
+
+
+def get_db_value(field: models.Field, value):
+    """
+    Keyword arguments:
+    field -- model field of the value
+    value -- parsed value
+
+    return -> value of the database column, related objects are replaced by the primary key
+    """
+    if field.is_relation and isinstance(value, models.Model):
+        return value.pk
+    return value
+
+
+def bulk_upsert(
+    model, rows: [dict], unique_field: str = "meetup_id", native: bool = None
+) -> dict:
+    """
+    insert or update many objects of a model keyed by a unique field, with one INSERT ... ON CONFLICT ... DO UPDATE
+    statement per batch, on databases without upsert the existing objects are loaded & updated in bulk
+
+    Keyword arguments:
+    model -- snippet model like Photo, Member, Category, Topic, Venue or MetaCategory
+    rows -- parsed field values by field name, every row needs the unique field, when a key is in many rows the
+            fields are merged & the last value wins
+    unique_field -- unique field of the model (default meetup_id)
+    native -- use ON CONFLICT, when None it is used if the database supports it
+
+    return -> {unique value: object} all saved objects
+    """
+    db: str = router.db_for_write(model)
+    connection = connections[db]
+    if native is None:
+        native = supports_upsert(connection.vendor)
+
+    # merge the rows of the same object, the same row can not be updated twice in one statement
+    merged_rows: dict = {}
+    for row in rows:
+        merged_rows.setdefault(row[unique_field], {}).update(row)
+    if not merged_rows:
+        return {}
+
+    # rows with the same fields are written together
+    row_groups: dict = {}
+    for row in merged_rows.values():
+        row_groups.setdefault(tuple(sorted(row)), []).append(row)
+
+    with transaction.atomic(using=db):
+        for field_names, group_rows in row_groups.items():
+            fields: [models.Field] = [
+                model._meta.get_field(field_name) for field_name in field_names
+            ]
+            if native:
+                upsert_rows(model, connection, fields, group_rows, unique_field)
+            else:
+                update_or_create_rows(model, db, fields, group_rows, unique_field)
+
+    objs: dict = model._base_manager.using(db).in_bulk(
+        list(merged_rows), field_name=unique_field
+    )
+
+    # the raw queries skip the post_save signal of the search index
+    if index.class_is_indexed(model):
+        for backend in get_search_backends(with_auto_update=True):
+            backend.add_bulk(model, list(objs.values()))
+
+    return objs
+
+
+def upsert_rows(
+    model, connection, fields: [models.Field], rows: [dict], unique_field: str
+):
+    """
+    write rows with INSERT ... ON CONFLICT ... DO UPDATE in batches
+
+    Keyword arguments:
+    model -- model of the table
+    connection -- database connection
+    fields -- fields of every row
+    rows -- field values by field name
+    unique_field -- conflict field of the model
+    """
+    quote_name = connection.ops.quote_name
+    columns: str = ", ".join(quote_name(field.column) for field in fields)
+    conflict_column: str = quote_name(model._meta.get_field(unique_field).column)
+    update_columns: [str] = [
+        quote_name(field.column) for field in fields if field.name != unique_field
+    ]
+    if update_columns:
+        on_conflict: str = "DO UPDATE SET {}".format(
+            ", ".join(
+                "{0} = EXCLUDED.{0}".format(column) for column in update_columns
+            )
+        )
+    else:
+        on_conflict: str = "DO NOTHING"
+    row_placeholder: str = "({})".format(", ".join(["%s"] * len(fields)))
+
+    batch_size: int = max(
+        1, connection.ops.bulk_batch_size(fields, rows) or len(rows)
+    )
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            batch: [dict] = rows[start : start + batch_size]
+            params: list = []
+            for row in batch:
+                params.extend(
+                    field.get_db_prep_save(
+                        get_db_value(field, row[field.name]), connection
+                    )
+                    for field in fields
+                )
+            cursor.execute(
+                "INSERT INTO {} ({}) VALUES {} ON CONFLICT ({}) {}".format(
+                    quote_name(model._meta.db_table),
+                    columns,
+                    ", ".join([row_placeholder] * len(batch)),
+                    conflict_column,
+                    on_conflict,
+                ),
+                params,
+            )
+
+
+def update_or_create_rows(
+    model, db: str, fields: [models.Field], rows: [dict], unique_field: str
+):
+    """
+    fallback of upsert_rows for databases without ON CONFLICT, loads the existing objects with one query,
+    updates them with bulk_update & creates the missing with bulk_create
+
+    Keyword arguments:
+    model -- model of the table
+    db -- database alias
+    fields -- fields of every row
+    rows -- field values by field name
+    unique_field -- unique field of the model
+    """
+    existing_objs: dict = model._base_manager.using(db).in_bulk(
+        [row[unique_field] for row in rows], field_name=unique_field
+    )
+
+    update_objs: list = []
+    create_objs: list = []
+    for row in rows:
+        obj = existing_objs.get(row[unique_field])
+        if obj is None:
+            obj = model()
+            create_objs.append(obj)
+        else:
+            update_objs.append(obj)
+        for field in fields:
+            setattr(obj, field.attname, get_db_value(field, row[field.name]))
+
+    update_fields: [str] = [
+        field.name for field in fields if field.name != unique_field
+    ]
+    if update_objs and update_fields:
+        model._base_manager.using(db).bulk_update(update_objs, update_fields)
+    if create_objs:
+        model._base_manager.using(db).bulk_create(create_objs)
@@ -0,0 +1,167 @@
+import base64
+import gzip
+import json
+import threading
+from collections import deque
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.models import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+# headers which describe the transfer & not the decoded body
+TRANSFER_HEADERS: [str] = ["content-encoding", "content-length", "transfer-encoding"]
+
+
+def get_cassette_key(url: str) -> str:
+    """
+    get the key of a request without the host, so a cassette can be replayed on any base_url
+
+    Keyword arguments:
+    url -- full request url
+
+    return -> url path with query, for https://api.meetup.com/find/groups?page=1 it is find/groups?page=1
+    """
+    split_url = urlsplit(url)
+    key: str = split_url.path.lstrip("/")
+    if split_url.query:
+        key = "{}?{}".format(key, split_url.query)
+    return key
+
+
+def get_entry_body(entry: dict) -> bytes:
+    """
+    get the raw body of an archive entry, archives of older versions stored the body as utf-8 text
+
+    Keyword arguments:
+    entry -- recorded response
+
+    return -> body bytes as they were received
+    """
+    if "body_base64" in entry:
+        return base64.b64decode(entry["body_base64"])
+    return entry["body"].encode("utf-8")
+
+
+class CassetteRecorder:
+    """
+    append every raw response (status, headers & body) to a gzip compressed json lines archive
+    """
+
+    def __init__(self, path: str):
+        """
+        Keyword arguments:
+        path -- path of the archive, new responses are appended to an existing archive
+        """
+        super().__init__()
+        self.lock: threading.Lock = threading.Lock()
+        self.file = gzip.open(path, "at", encoding="utf-8")
+        self.responses: int = 0
+
+    def record(self, response: Response, *args, **kwargs):
+        """
+        store a response, can be used as requests response hook
+
+        Keyword arguments:
+        response -- http response
+        """
+        entry: dict = {
+            "key": get_cassette_key(response.url),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in TRANSFER_HEADERS
+            },
+            # the raw bytes, so a body which is no valid utf-8 is replayed unchanged
+            "body_base64": base64.b64encode(response.content).decode("ascii"),
+        }
+
+        with self.lock:
+            self.file.write(json.dumps(entry))
+            self.file.write("\n")
+            # keep every finished response, even when the crawl gets killed
+            self.file.flush()
+            self.responses = self.responses + 1
+
+        return response
+
+    def close(self):
+        """
+        close the archive
+        """
+        with self.lock:
+            self.file.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    requests transport adapter which serves the responses of an archive instead of sending requests,
+    when a url was requested many times the responses are replayed in the recorded order & the last one is repeated
+    """
+
+    def __init__(self, path: str, throttle: bool = False):
+        """
+        Keyword arguments:
+        path -- path of an archive created by CassetteRecorder
+        throttle -- keep the recorded X-RateLimit headers, when False the replay runs at full speed
+        """
+        super().__init__()
+        self.lock: threading.Lock = threading.Lock()
+        self.throttle: bool = throttle
+        self.entries: dict = {}
+
+        with gzip.open(path, "rt", encoding="utf-8") as archive:
+            for line in archive:
+                if not line.strip():
+                    continue
+                entry: dict = json.loads(line)
+                self.entries.setdefault(entry["key"], deque()).append(entry)
+
+    def get_entry(self, key: str) -> dict:
+        """
+        get the next recorded response of a key
+
+        Keyword arguments:
+        key -- cassette key of the request
+
+        return -> entry dict, None when the key was not recorded
+        """
+        with self.lock:
+            entries: deque = self.entries.get(key)
+            if not entries:
+                return None
+            if len(entries) > 1:
+                return entries.popleft()
+            return entries[0]
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        entry: dict = self.get_entry(get_cassette_key(request.url))
+        if not entry:
+            raise requests.ConnectionError(
+                "{} is not in the cassette".format(request.url), request=request
+            )
+
+        response: Response = Response()
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = get_entry_body(entry)
+        response._content_consumed = True
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+
+        if not self.throttle and "X-RateLimit-Limit" in response.headers:
+            # a window which is always over, so the rate limit never waits
+            response.headers["X-RateLimit-Remaining"] = response.headers[
+                "X-RateLimit-Limit"
+            ]
+            response.headers["X-RateLimit-Reset"] = "0"
+
+        return response
+
+    def close(self):
+        pass
@@ -0,0 +1,179 @@
+import threading
+import time
+from collections import deque
+
+from .exceptions import CircuitOpenError
+
+
+def get_endpoint_family(url_path: str) -> str:
+    """
+    get the endpoint family of an url path, every family has its own circuit breaker
+
+    Keyword arguments:
+    url_path -- url path without domain or full url
+
+    return -> find, events or group
+    """
+    path: str = url_path.split("?", 1)[0]
+    if "://" in path:
+        path = path.split("://", 1)[1].split("/", 1)[-1]
+    path = path.strip("/")
+
+    if path.startswith("find/"):
+        return "find"
+    if path.endswith("/events") or "/events/" in path:
+        return "events"
+    return "group"
+
+
+class CircuitBreaker:
+    """
+    stop sending requests to an endpoint family which mostly fails
+
+    closed -- requests are send, the outcome of the last window requests is counted
+    open -- the failure rate of the window was over failure_rate, every request fails fast with CircuitOpenError
+    half_open -- after open_time one probe request is send, on success the circuit closes & on failure it opens again
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        open_time: float = 60,
+    ):
+        """
+        Keyword arguments:
+        name -- endpoint family
+        failure_rate -- failed part of the window to open the circuit (default 0.5)
+        window -- how many of the last requests are counted, at least half of it is needed to open (default 20)
+        open_time -- seconds until a probe request is send (default 60)
+        """
+        super().__init__()
+        self.name: str = name
+        self.failure_rate: float = failure_rate
+        self.window: int = max(1, window)
+        self.open_time: float = open_time
+
+        self.lock: threading.Lock = threading.Lock()
+        self.state: str = "closed"
+        self.outcomes: deque = deque(maxlen=self.window)
+        self.opened_at: float = None
+        self.probe_in_flight: bool = False
+
+        # metrics
+        self.opened: int = 0
+        self.fast_failures: int = 0
+
+    def before_request(self):
+        """
+        check if a request can be send, an open circuit turns half open after open_time & lets one probe through
+        """
+        with self.lock:
+            if self.state == "open" and time.time() - self.opened_at >= self.open_time:
+                self.state = "half_open"
+                self.probe_in_flight = False
+
+            if self.state == "half_open" and not self.probe_in_flight:
+                self.probe_in_flight = True
+                return
+
+            if self.state != "closed":
+                self.fast_failures = self.fast_failures + 1
+                raise CircuitOpenError(
+                    "Circuit breaker of {} requests is open".format(self.name)
+                )
+
+    def is_open(self) -> bool:
+        """
+        return -> True when the circuit is open, so running retries can stop
+        """
+        return self.state == "open"
+
+    def record_success(self):
+        """
+        count a request which got an answer of the server
+        """
+        with self.lock:
+            if self.state == "half_open":
+                self.state = "closed"
+                self.outcomes.clear()
+            self.outcomes.append(True)
+
+    def record_failure(self):
+        """
+        count a request which failed after all retries & open the circuit if the failure rate is reached
+        """
+        with self.lock:
+            if self.state == "half_open":
+                self.open()
+                return
+            if self.state == "open":
+                return
+
+            self.outcomes.append(False)
+            if len(self.outcomes) < max(1, self.window // 2):
+                return
+
+            failures: int = self.outcomes.count(False)
+            if failures / len(self.outcomes) >= self.failure_rate:
+                self.open()
+
+    def open(self):
+        """
+        open the circuit, call it only with the lock
+        """
+        self.state = "open"
+        self.opened_at = time.time()
+        self.probe_in_flight = False
+        self.outcomes.clear()
+        self.opened = self.opened + 1
+
+    def report(self) -> str:
+        """
+        return -> state & metrics as human readable string
+        """
+        return "{} {} (opened {} times, {} fast failures)".format(
+            self.name, self.state, self.opened, self.fast_failures
+        )
+
+
+class CircuitBreakers:
+    """
+    one CircuitBreaker per endpoint family (group, events & find)
+    """
+
+    def __init__(self, failure_rate: float = 0.5, window: int = 20, open_time: float = 60):
+        """
+        Keyword arguments:
+        failure_rate -- failed part of the window to open a circuit (default 0.5)
+        window -- how many of the last requests are counted (default 20)
+        open_time -- seconds until a probe request is send (default 60)
+        """
+        super().__init__()
+        self.breakers: dict = {
+            name: CircuitBreaker(
+                name=name,
+                failure_rate=failure_rate,
+                window=window,
+                open_time=open_time,
+            )
+            for name in ["group", "events", "find"]
+        }
+
+    def get_breaker(self, url_path: str) -> CircuitBreaker:
+        """
+        get the circuit breaker of an url path
+
+        Keyword arguments:
+        url_path -- url path without domain or full url
+
+        return -> CircuitBreaker of the endpoint family
+        """
+        return self.breakers[get_endpoint_family(url_path)]
+
+    def report(self) -> str:
+        """
+        return -> state of every circuit breaker as human readable string
+        """
+        return ", ".join(breaker.report() for breaker in self.breakers.values())
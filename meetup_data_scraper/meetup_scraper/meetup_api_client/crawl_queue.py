@@ -0,0 +1,177 @@
+import threading
+from datetime import timedelta
+
+from django.db import DatabaseError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from meetup_data_scraper.meetup_scraper.models import CrawlJob
+
+
+def enqueue_jobs(crawl: str, urlnames: [str]) -> int:
+    """
+    add groups to the work queue, groups which are already queued or running for the crawl are skipped by the unique
+    constraint of the active jobs
+
+    Keyword arguments:
+    crawl -- name of the command which queues the groups
+    urlnames -- Meetup group urlnames
+
+    return -> number of new jobs
+    """
+    active_jobs = CrawlJob.objects.filter(
+        crawl=crawl, status__in=[CrawlJob.QUEUED, CrawlJob.RUNNING]
+    )
+    active_counter: int = active_jobs.count()
+    CrawlJob.objects.bulk_create(
+        [
+            CrawlJob(crawl=crawl, urlname=urlname)
+            for urlname in dict.fromkeys(urlnames)
+        ],
+        batch_size=500,
+        ignore_conflicts=True,
+    )
+    # bulk_create does not tell which rows were skipped, so the new jobs are counted, jobs which a worker finishes in
+    # the meantime lower the count
+    return max(active_jobs.count() - active_counter, 0)
+
+
+def requeue_expired_jobs(lease_timeout: float, max_attempts: int) -> int:
+    """
+    queue running jobs again, when their worker sent no heartbeat within the lease timeout, jobs without attempts
+    left fail
+
+    Keyword arguments:
+    lease_timeout -- seconds after the last heartbeat until a job is expired
+    max_attempts -- how many times a job is claimed before it fails
+
+    return -> number of queued jobs
+    """
+    expired_jobs = CrawlJob.objects.filter(
+        status=CrawlJob.RUNNING,
+        heartbeat__lt=timezone.now() - timedelta(seconds=lease_timeout),
+    )
+    expired_jobs.filter(attempts__gte=max_attempts).update(
+        status=CrawlJob.FAILED,
+        worker=None,
+        error="lease expired",
+        updated=timezone.now(),
+    )
+    return expired_jobs.update(
+        status=CrawlJob.QUEUED, worker=None, updated=timezone.now()
+    )
+
+
+def claim_job(worker: str) -> CrawlJob:
+    """
+    lease the oldest queued job, concurrent workers skip the rows which are locked by another worker with SELECT ...
+    FOR UPDATE SKIP LOCKED instead of waiting for them
+
+    Keyword arguments:
+    worker -- name of the worker
+
+    return -> running CrawlJob, None when the queue is empty
+    """
+    while True:
+        with transaction.atomic():
+            job: CrawlJob = (
+                CrawlJob.objects.select_for_update(skip_locked=True)
+                .filter(status=CrawlJob.QUEUED)
+                .order_by("id")
+                .first()
+            )
+            if not job:
+                return None
+
+            # the status check keeps the claim safe on databases without row locks like sqlite
+            claimed: int = CrawlJob.objects.filter(
+                pk=job.pk, status=CrawlJob.QUEUED
+            ).update(
+                status=CrawlJob.RUNNING,
+                worker=worker,
+                heartbeat=timezone.now(),
+                attempts=F("attempts") + 1,
+                updated=timezone.now(),
+            )
+
+        if claimed:
+            job.refresh_from_db()
+            return job
+
+
+def send_heartbeat(job: CrawlJob) -> bool:
+    """
+    extend the lease of a running job
+
+    Keyword arguments:
+    job -- CrawlJob of the worker
+
+    return -> False, when the lease expired & the job was queued again
+    """
+    return (
+        CrawlJob.objects.filter(
+            pk=job.pk, status=CrawlJob.RUNNING, worker=job.worker
+        ).update(heartbeat=timezone.now(), updated=timezone.now())
+        == 1
+    )
+
+
+def finish_job(job: CrawlJob, error: str = None, max_attempts: int = 1) -> bool:
+    """
+    finish a running job, a failed job is queued again while it has attempts left
+
+    Keyword arguments:
+    job -- CrawlJob of the worker
+    error -- error message, None when the job is done (default None)
+    max_attempts -- how many times a job is claimed before it fails (default 1)
+
+    return -> False, when the lease expired & the job belongs to another worker
+    """
+    status: str = CrawlJob.DONE
+    if error:
+        status = CrawlJob.QUEUED if job.attempts < max_attempts else CrawlJob.FAILED
+
+    return (
+        CrawlJob.objects.filter(
+            pk=job.pk, status=CrawlJob.RUNNING, worker=job.worker
+        ).update(status=status, error=error, updated=timezone.now())
+        == 1
+    )
+
+
+class JobHeartbeat:
+    """
+    send the heartbeats of a running job from a background thread, while the job is crawled in the with block
+    """
+
+    def __init__(self, job: CrawlJob, interval: float):
+        """
+        Keyword arguments:
+        job -- running CrawlJob
+        interval -- seconds between heartbeats, lower than the lease timeout
+        """
+        self.job: CrawlJob = job
+        self.interval: float = interval
+        self.lost: bool = False
+        self.stopped: threading.Event = threading.Event()
+        self.thread: threading.Thread = threading.Thread(target=self.run, daemon=True)
+
+    def run(self):
+        try:
+            while not self.stopped.wait(self.interval):
+                try:
+                    if not send_heartbeat(self.job):
+                        self.lost = True
+                        return
+                except DatabaseError as e:
+                    # a busy database skips one heartbeat, the lease timeout is longer than the interval
+                    print(e)
+        finally:
+            connection.close()
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stopped.set()
+        self.thread.join()
@@ -0,0 +1,211 @@
+import math
+from collections import deque
+
+from .exceptions import (
+    CircuitOpenError,
+    HttpNoSuccess,
+    HttpNotAccessibleError,
+    HttpNotFoundError,
+    HttpNoXRateLimitHeader,
+)
+
+# miles per degree latitude
+MILES_PER_DEGREE: float = 69.0
+
+# max search radius of the find/groups endpoint in miles
+MAX_RADIUS: float = 100.0
+
+
+class GridCell:
+    """
+    square search area of the group discovery, it is requested as the circle around the square
+    """
+
+    def __init__(self, lat: float, lon: float, size: float):
+        """
+        Keyword arguments:
+        lat -- latitude of the center
+        lon -- longitude of the center
+        size -- side length in miles
+        """
+        self.lat: float = lat
+        self.lon: float = lon
+        self.size: float = size
+
+    @property
+    def radius(self) -> float:
+        """
+        return -> miles from the center to the corners
+        """
+        return min(self.size * math.sqrt(2) / 2, MAX_RADIUS)
+
+    def split(self) -> ["GridCell"]:
+        """
+        return -> [GridCell] the 4 quarters of the cell
+        """
+        lat_offset: float = self.size / 4 / MILES_PER_DEGREE
+        lon_offset: float = lat_offset / max(math.cos(math.radians(self.lat)), 0.01)
+        return [
+            GridCell(
+                self.lat + lat_sign * lat_offset,
+                self.lon + lon_sign * lon_offset,
+                self.size / 2,
+            )
+            for lat_sign in [1, -1]
+            for lon_sign in [-1, 1]
+        ]
+
+    def __repr__(self) -> str:
+        return "GridCell({:.4f}, {:.4f}, {:.2f} miles)".format(
+            self.lat, self.lon, self.size
+        )
+
+
+def get_grid_cells(lat: float, lon: float, radius: float, size: float) -> [GridCell]:
+    """
+    cover the square around a location with cells
+
+    Keyword arguments:
+    lat -- latitude of the center
+    lon -- longitude of the center
+    radius -- miles from the center to the sides of the square
+    size -- side length of a cell in miles
+
+    return -> [GridCell] from north west to south east
+    """
+    count: int = max(1, math.ceil(2 * radius / size))
+    size = 2 * radius / count
+    lat_step: float = size / MILES_PER_DEGREE
+    lon_step: float = lat_step / max(math.cos(math.radians(lat)), 0.01)
+    lat_start: float = lat + (count - 1) / 2 * lat_step
+    lon_start: float = lon - (count - 1) / 2 * lon_step
+    return [
+        GridCell(lat_start - row * lat_step, lon_start + column * lon_step, size)
+        for row in range(count)
+        for column in range(count)
+    ]
+
+
+def get_find_groups_url_path(
+    cell: GridCell, category: int = None, page_size: int = 200, offset: int = 0
+) -> str:
+    """
+    Keyword arguments:
+    cell -- GridCell of the search
+    category -- meetup category id, None for all categories (default None)
+    page_size -- groups per page (default 200)
+    offset -- page number (default 0)
+
+    return -> url path of a find/groups page, which only has the id & urlname of the groups
+    """
+    url_path: str = "find/groups?lat={:.6f}&lon={:.6f}&radius={:.2f}&page={}&offset={}&only=id,urlname".format(
+        cell.lat, cell.lon, cell.radius, page_size, offset,
+    )
+    if category:
+        url_path = "{}&category={}".format(url_path, category)
+    return url_path
+
+
+class GroupDiscovery:
+    """
+    find groups with the find/groups endpoint cell by cell, a cell which has more groups than max_pages pages is
+    split into 4 smaller cells, every group is only returned once by its meetup id
+    """
+
+    def __init__(
+        self,
+        api_client,
+        cells: [GridCell],
+        categories: [int] = None,
+        page_size: int = 200,
+        max_pages: int = 5,
+        min_size: float = 1.0,
+    ):
+        """
+        Keyword arguments:
+        api_client -- MeetupApiClient, which sends the requests within its rate limit
+        cells -- [GridCell] search areas
+        categories -- meetup category ids, every cell is searched per category, None for all categories
+        page_size -- groups per page (default 200)
+        max_pages -- pages per cell & category until the cell is split (default 5)
+        min_size -- side length in miles of the smallest cell, which is not split anymore (default 1.0)
+        """
+        self.api_client = api_client
+        self.cells: [GridCell] = cells
+        self.categories: [int] = categories or [None]
+        self.page_size: int = page_size
+        self.max_pages: int = max(1, max_pages)
+        self.min_size: float = min_size
+        self.meetup_ids: set = set()
+
+        # metrics
+        self.searched_cells: int = 0
+        self.split_cells: int = 0
+        self.saturated_cells: int = 0
+        self.duplicates: int = 0
+
+    def iter_groups(self):
+        """
+        search every cell & category page by page
+
+        return -> iterator of {"id": meetup id, "urlname": urlname} for every new group
+        """
+        searches: deque = deque(
+            (cell, category) for category in self.categories for cell in self.cells
+        )
+        while searches:
+            cell, category = searches.popleft()
+            self.searched_cells = self.searched_cells + 1
+
+            saturated: bool = True
+            groups: [dict] = []
+            for offset in range(self.max_pages):
+                try:
+                    page: [dict] = self.api_client.get(
+                        get_find_groups_url_path(
+                            cell=cell,
+                            category=category,
+                            page_size=self.page_size,
+                            offset=offset,
+                        )
+                    )
+                except (
+                    CircuitOpenError,
+                    HttpNotFoundError,
+                    HttpNotAccessibleError,
+                    HttpNoSuccess,
+                    HttpNoXRateLimitHeader,
+                ) as e:
+                    print(e)
+                    saturated = False
+                    break
+                groups.extend(page)
+                if len(page) < self.page_size:
+                    saturated = False
+                    break
+
+            for group in groups:
+                if group["id"] in self.meetup_ids:
+                    self.duplicates = self.duplicates + 1
+                    continue
+                self.meetup_ids.add(group["id"])
+                yield group
+
+            # the groups of a saturated cell beyond the max pages are searched in its quarters
+            if saturated and cell.size / 2 >= self.min_size:
+                self.split_cells = self.split_cells + 1
+                searches.extend((quarter, category) for quarter in cell.split())
+            elif saturated:
+                self.saturated_cells = self.saturated_cells + 1
+
+    def report(self) -> str:
+        """
+        return -> discovery metrics as human readable string
+        """
+        return "{} cells searched, {} split, {} saturated at the min size, {} groups found, {} duplicates".format(
+            self.searched_cells,
+            self.split_cells,
+            self.saturated_cells,
+            len(self.meetup_ids),
+            self.duplicates,
+        )
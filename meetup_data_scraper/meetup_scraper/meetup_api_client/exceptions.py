@@ -20,3 +20,20 @@ class HttpNoXRateLimitHeader(Exception):
     """
     Called when a response has no X-RateLimit header
     """
+
+
+class HttpNotModified(Exception):
+    """
+    Called when the server sends a 304, the cached response is still up to date.
+    """
+
+
+class CircuitOpenError(Exception):
+    """
+    Called when the circuit breaker of an endpoint family is open, the request was not send.
+    It is no HttpNoSuccess, the server was not asked, so callers have to handle it on its own.
+    """
+
+
+# errors after which a later request can succeed, unlike the 404 or 410 of a group which is gone
+TRANSIENT_ERRORS: tuple = (CircuitOpenError, HttpNoSuccess, HttpNoXRateLimitHeader)
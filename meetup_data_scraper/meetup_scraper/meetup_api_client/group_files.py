@@ -0,0 +1,73 @@
+import csv
+import glob
+import json
+import os
+
+from .json_stream import STREAM_CHUNK_SIZE, iter_json_object
+
+# file extensions of the group files, which are loaded by get_groups
+GROUP_FILE_EXTENSIONS: [str] = ["json", "ndjson", "jsonl", "csv"]
+
+
+def get_group_files(path: str) -> [str]:
+    """
+    Keyword arguments:
+    path -- directory of the group files
+
+    return -> sorted paths of the json, ndjson, jsonl & csv files in the directory
+    """
+    return sorted(
+        file_path
+        for extension in GROUP_FILE_EXTENSIONS
+        for file_path in glob.glob("{}/*.{}".format(path, extension))
+    )
+
+
+def iter_file_urlnames(file_path: str):
+    """
+    read the group urlnames of a file while it is read, so only one group is in memory:
+    a json object like {"0": {"urlname": "..."}}, json lines like {"urlname": "..."} or a csv file with an urlname
+    column
+
+    Keyword arguments:
+    file_path -- path of a json, ndjson, jsonl or csv file
+
+    return -> iterator of urlnames
+    """
+    extension: str = os.path.splitext(file_path)[1].lower()
+
+    if extension == ".csv":
+        with open(file_path, newline="") as csv_file:
+            for row in csv.DictReader(csv_file):
+                if row.get("urlname"):
+                    yield row["urlname"]
+        return
+
+    if extension in [".ndjson", ".jsonl"]:
+        with open(file_path, "rb") as json_file:
+            for line in json_file:
+                if line.strip():
+                    yield json.loads(line)["urlname"]
+        return
+
+    with open(file_path, "rb") as json_file:
+        chunks = iter(lambda: json_file.read(STREAM_CHUNK_SIZE), b"")
+        for key, group in iter_json_object(chunks):
+            yield group["urlname"]
+
+
+def iter_group_urlnames(file_paths: [str]):
+    """
+    read the group urlnames of many files lazily, an urlname which is in more than one file is only returned once
+
+    Keyword arguments:
+    file_paths -- paths of group files
+
+    return -> iterator of unique urlnames
+    """
+    urlnames: set = set()
+    for file_path in file_paths:
+        for urlname in iter_file_urlnames(file_path):
+            if urlname not in urlnames:
+                urlnames.add(urlname)
+                yield urlname
@@ -0,0 +1,126 @@
+from collections import OrderedDict
+
+from django.db import models
+
+
+class IdentityMap:
+    """
+    per run cache of the snippet models (Photo, Member, Category, Topic, Venue ...) by meetup_id, so an object
+    which is in many responses is only loaded once & only saved when a field changed, the least recently
+    used objects are evicted when max_size is reached
+    """
+
+    def __init__(self, max_size: int = 10000):
+        """
+        Keyword arguments:
+        max_size -- max cached objects, 0 to disable the cache (default 10000)
+        """
+        super().__init__()
+        self.max_size: int = max(0, max_size)
+        self.instances: OrderedDict = OrderedDict()
+
+        # metrics
+        self.hits: int = 0
+        self.misses: int = 0
+        self.saved_queries: int = 0
+
+    def get(self, model, meetup_id) -> models.Model:
+        """
+        get an object from the cache or the database
+
+        Keyword arguments:
+        model -- model with a unique meetup_id
+        meetup_id -- meetup id of the object
+
+        return -> object, None when it does not exists
+        """
+        key: tuple = (model, str(meetup_id))
+        if key in self.instances:
+            self.instances.move_to_end(key)
+            self.hits = self.hits + 1
+            self.saved_queries = self.saved_queries + 1
+            return self.instances[key]
+
+        self.misses = self.misses + 1
+        instance: models.Model = model.objects.filter(meetup_id=meetup_id).first()
+        if instance:
+            self.add(instance)
+        return instance
+
+    def get_or_create(self, model, meetup_id) -> (models.Model, bool):
+        """
+        get an object from the cache or the database & create it when it does not exists
+
+        Keyword arguments:
+        model -- model with a unique meetup_id
+        meetup_id -- meetup id of the object
+
+        return -> (object, created)
+        """
+        key: tuple = (model, str(meetup_id))
+        if key in self.instances:
+            self.instances.move_to_end(key)
+            self.hits = self.hits + 1
+            self.saved_queries = self.saved_queries + 1
+            return self.instances[key], False
+
+        self.misses = self.misses + 1
+        instance, created = model.objects.get_or_create(meetup_id=meetup_id)
+        self.add(instance)
+        return instance, created
+
+    def add(self, instance: models.Model):
+        """
+        cache a saved object
+
+        Keyword arguments:
+        instance -- object with a meetup_id
+        """
+        if not self.max_size:
+            return
+
+        key: tuple = (type(instance), str(instance.meetup_id))
+        self.instances[key] = instance
+        self.instances.move_to_end(key)
+        while len(self.instances) > self.max_size:
+            self.instances.popitem(last=False)
+
+    def update(self, instance: models.Model, fields: dict) -> bool:
+        """
+        set the fields of an object & save only the changed fields
+
+        Keyword arguments:
+        instance -- saved object
+        fields -- new field values by field name
+
+        return -> True when the object was saved
+        """
+        changed_fields: [str] = []
+        for name, value in fields.items():
+            field = instance._meta.get_field(name)
+            if field.is_relation:
+                # compare the foreign key without loading the related object
+                changed: bool = getattr(instance, field.attname) != (
+                    value.pk if value else None
+                )
+            else:
+                changed: bool = getattr(instance, name) != value
+
+            if changed:
+                setattr(instance, name, value)
+                changed_fields.append(name)
+
+        if not changed_fields:
+            self.saved_queries = self.saved_queries + 1
+            return False
+
+        instance.save(update_fields=changed_fields)
+        return True
+
+    def report(self) -> str:
+        """
+        return -> cache metrics as human readable string
+        """
+        return "{} hits, {} misses, {} queries saved".format(
+            self.hits, self.misses, self.saved_queries
+        )
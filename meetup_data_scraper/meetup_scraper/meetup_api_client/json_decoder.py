@@ -0,0 +1,46 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def stdlib_loads(body: bytes):
+    """
+    decode a json body with the json module of the standard library, bytes are decoded without the text encoding
+    guess of requests
+
+    Keyword arguments:
+    body -- raw json body
+
+    return -> decoded json
+    """
+    return json.loads(body)
+
+
+# json decoders by name, orjson is only available when it is installed
+JSON_DECODERS: dict = {"json": stdlib_loads}
+if orjson:
+    JSON_DECODERS["orjson"] = orjson.loads
+
+
+def get_json_decoder(name: str = "auto"):
+    """
+    get a function which decodes raw json bytes
+
+    Keyword arguments:
+    name -- "orjson", "json" or "auto" for orjson when it is installed & the standard library json otherwise
+            (default auto)
+
+    return -> function(body: bytes) -> decoded json
+    """
+    if name == "auto":
+        name = "orjson" if "orjson" in JSON_DECODERS else "json"
+    if name not in JSON_DECODERS:
+        raise ValueError(
+            "unknown json decoder {}, available: {}".format(
+                name, ", ".join(JSON_DECODERS)
+            )
+        )
+    return JSON_DECODERS[name]
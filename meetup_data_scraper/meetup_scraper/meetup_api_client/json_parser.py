@@ -1,5 +1,7 @@
-from datetime import datetime, timedelta
-from django.utils import timezone
+import hashlib
+import json
+from django.db import transaction
+from wagtail.core.models import Page
 from meetup_data_scraper.meetup_scraper.models import (
     Category,
     EventHost,
@@ -12,15 +14,254 @@ from meetup_data_scraper.meetup_scraper.models import (
     Topic,
     Venue,
 )
-from decimal import Decimal
+from .bulk_pages import bulk_add_children, publish_page, set_live
+from .bulk_upsert import bulk_upsert
+from .identity_map import IdentityMap
+from .mappers import (
+    FieldMapping,
+    compile_mapper,
+    is_set,
+    to_datetime,
+    to_decimal,
+    to_seconds,
+    to_timedelta,
+)
 
+# top level fields of the meetup api responses which are parsed, all other fields are not requested
+GROUP_FIELDS: [str] = [
+    "id",
+    "urlname",
+    "name",
+    "created",
+    "description",
+    "lat",
+    "lon",
+    "link",
+    "members",
+    "status",
+    "timezone",
+    "visibility",
+    "category",
+    "city",
+    "city_link",
+    "country",
+    "fee_options",
+    "group_photo",
+    "join_mode",
+    "key_photo",
+    "localized_country_name",
+    "localized_location",
+    "member_limit",
+    "meta_category",
+    "nomination_acceptable",
+    "organizer",
+    "short_link",
+    "state",
+    "topics",
+    "untranslated_city",
+    "welcome_message",
+    "who",
+]
+# parsed fields which the meetup api only sends on request
+GROUP_OPTIONAL_FIELDS: [str] = ["meta_category", "topics"]
+
+EVENT_FIELDS: [str] = [
+    "id",
+    "name",
+    "time",
+    "link",
+    "attendance_count",
+    "attendance_sample",
+    "attendee_sample",
+    "created",
+    "date_in_series_pattern",
+    "description",
+    "duration",
+    "event_hosts",
+    "fee",
+    "how_to_find_us",
+    "status",
+    "utc_offset",
+    "updated",
+    "venue",
+    "venue_visibility",
+    "visibility",
+]
+EVENT_OPTIONAL_FIELDS: [str] = [
+    "attendance_count",
+    "attendance_sample",
+    "attendee_sample",
+    "event_hosts",
+]
+
+# increase when the parser changes, so the content hashes of already parsed responses do not match anymore
+CONTENT_HASH_VERSION: int = 1
+
+
+def get_content_hash(response: dict) -> str:
+    """
+    hash a normalized meetup api response, to detect unchanged groups, meta categories & venues
 
-def get_event_from_response(response: dict, group: GroupPage) -> EventPage:
+    Keyword arguments:
+    response -- meetup api response in a dict
+
+    return -> sha1 hex digest of the response with sorted keys & the CONTENT_HASH_VERSION
+    """
+    normalized: str = json.dumps(
+        [CONTENT_HASH_VERSION, response],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+# field mappings of the responses to the model fields, relations are parsed by the get_*_from_response functions
+map_event = compile_mapper(
+    "map_event",
+    [
+        FieldMapping("meetup_id", "id", converter=str, required=True),
+        FieldMapping("slug", "id", required=True),
+        FieldMapping("name", required=True),
+        FieldMapping("time", converter=to_datetime, required=True),
+        FieldMapping("link", required=True),
+        FieldMapping("attendance_count"),
+        FieldMapping("attendance_sample"),
+        FieldMapping("attendee_sample"),
+        FieldMapping("created", converter=to_datetime),
+        FieldMapping("date_in_series_pattern"),
+        FieldMapping("description"),
+        FieldMapping("duration", converter=to_timedelta),
+        FieldMapping("fee_accepts", "fee.accepts"),
+        FieldMapping("fee_amount", "fee.amount"),
+        FieldMapping("fee_currency", "fee.currency"),
+        FieldMapping("fee_description", "fee.description"),
+        FieldMapping("fee_label", "fee.label"),
+        FieldMapping("how_to_find_us"),
+        FieldMapping("status"),
+        FieldMapping("utc_offset", converter=to_seconds),
+        FieldMapping("updated", converter=to_datetime),
+        FieldMapping("venue_visibility"),
+        FieldMapping("visibility"),
+    ],
+)
+
+map_group = compile_mapper(
+    "map_group",
+    [
+        FieldMapping("description", required=True),
+        FieldMapping("link", required=True),
+        FieldMapping("members", required=True),
+        FieldMapping("name", required=True),
+        FieldMapping("status", required=True),
+        FieldMapping("timezone", required=True),
+        FieldMapping("visibility", required=True),
+        FieldMapping("city"),
+        FieldMapping("city_link"),
+        FieldMapping("country"),
+        FieldMapping("fee_options_currencies_code", "fee_options.currencies.code"),
+        FieldMapping(
+            "fee_options_currencies_default",
+            "fee_options.currencies.default",
+            default=False,
+        ),
+        FieldMapping("fee_options_type", "fee_options.type"),
+        FieldMapping("join_mode"),
+        FieldMapping("lat", converter=to_decimal),
+        FieldMapping("lon", converter=to_decimal),
+        FieldMapping("localized_country_name"),
+        FieldMapping("localized_location"),
+        FieldMapping("member_limit"),
+        FieldMapping("nomination_acceptable", converter=is_set, default=False),
+        FieldMapping("short_link"),
+        FieldMapping("state"),
+        FieldMapping("untranslated_city"),
+        FieldMapping("welcome_message"),
+        FieldMapping("who"),
+    ],
+)
+
+map_photo = compile_mapper(
+    "map_photo",
+    [
+        FieldMapping("highres_link"),
+        FieldMapping("base_url"),
+        FieldMapping("photo_link"),
+        FieldMapping("thumb_link"),
+        FieldMapping("photo_type", "type"),
+    ],
+)
+
+map_member = compile_mapper(
+    "map_member", [FieldMapping("name"), FieldMapping("bio")]
+)
+
+map_event_host = compile_mapper(
+    "map_event_host",
+    [
+        FieldMapping("host_count"),
+        FieldMapping("intro"),
+        FieldMapping("join_date", converter=to_datetime),
+        FieldMapping("name"),
+    ],
+)
+
+map_category = compile_mapper(
+    "map_category",
+    [FieldMapping("name"), FieldMapping("shortname"), FieldMapping("sort_name")],
+)
+
+map_topic = compile_mapper(
+    "map_topic",
+    [
+        FieldMapping("lang", required=True),
+        FieldMapping("name", required=True),
+        FieldMapping("urlkey", required=True),
+    ],
+)
+
+map_meta_category = compile_mapper(
+    "map_meta_category",
+    [
+        FieldMapping("name", required=True),
+        FieldMapping("shortname", required=True),
+        FieldMapping("sort_name", required=True),
+    ],
+)
+
+map_venue = compile_mapper(
+    "map_venue",
+    [
+        FieldMapping("meetup_id", "id", required=True),
+        FieldMapping("address_1"),
+        FieldMapping("address_2"),
+        FieldMapping("address_3"),
+        FieldMapping("city"),
+        FieldMapping("country"),
+        FieldMapping("lat", converter=to_decimal),
+        FieldMapping("lon", converter=to_decimal),
+        FieldMapping("localized_country_name"),
+        FieldMapping("name"),
+        FieldMapping("phone"),
+        FieldMapping("zip_code"),
+    ],
+)
+
+
+def get_event_from_response(
+    response: dict,
+    group: GroupPage,
+    identity_map: IdentityMap = None,
+    revisions: bool = False,
+) -> EventPage:
     """
     parse json response and return an EventPage
 
     Keyword arguments:
     response -- meetup api response in a dict
+    group -- GroupPage parent of the event
+    identity_map -- cache of the run for venues, members & photos
+    revisions -- create & publish a wagtail revision for the event (default False)
 
     return -> EventPage when not already exists
     """
@@ -32,407 +273,456 @@ def get_event_from_response(response: dict, group: GroupPage) -> EventPage:
     except KeyError:
         return
 
-    try:
-        # create event
-        event: EventPage = EventPage(
-            meetup_id=str(response["id"]),
-            title="{}: {}".format(response["id"], response["name"]),
-            name=response["name"],
-            slug=response["id"],
-            time=timezone.make_aware(datetime.fromtimestamp(response["time"] / 1000)),
-            link=response["link"],
-        )
-    except KeyError:
+    event: EventPage = parse_event_from_response(
+        response=response, group=group, identity_map=identity_map
+    )
+    if not event:
         return
 
-    # add optional fields
-    if "attendance_count" in response:
-        event.attendance_count = response["attendance_count"]
-    if "attendance_sample" in response:
-        event.attendance_sample = response["attendance_sample"]
-    if "attendee_sample" in response:
-        event.attendee_sample = response["attendee_sample"]
-    if "created" in response:
-        event.created = timezone.make_aware(
-            datetime.fromtimestamp(response["created"] / 1000)
-        )
-    if "date_in_series_pattern" in response:
-        event.date_in_series_pattern = response["date_in_series_pattern"]
-    if "description" in response:
-        event.description = response["description"]
-    if "duration" in response:
-        event.duration = timedelta(seconds=response["duration"] / 1000)
-    if "event_hosts" in response:
-        event_hosts: [EventHost] = []
-        for event_host in response["event_hosts"]:
-            event_hosts.append(get_event_host_from_response(response=event_host))
-        event.event_hosts = event_hosts
+    if revisions:
+        group.add_child(instance=event)
+        event.save_revision().publish()
     else:
-        event.event_hosts = []
-    if "fee" in response:
-        event.fee_accepts = response["fee"]["accepts"]
-        event.fee_amount = response["fee"]["amount"]
-        event.fee_currency = response["fee"]["currency"]
-        event.fee_description = response["fee"]["description"]
-        event.fee_label = response["fee"]["label"]
-    if "how_to_find_us" in response:
-        event.how_to_find_us = response["how_to_find_us"]
-    if "status" in response:
-        event.status = response["status"]
-    if "utc_offset" in response:
-        event.utc_offset = response["utc_offset"] / 1000
-    if "updated" in response:
-        event.updated = timezone.make_aware(
-            datetime.fromtimestamp(response["updated"] / 1000)
+        set_live(event)
+        group.add_child(instance=event)
+    return event
+
+
+def get_events_from_response(
+    response: [dict],
+    group: GroupPage,
+    revisions: bool = False,
+    identity_map: IdentityMap = None,
+) -> [EventPage]:
+    """
+    parse a whole events response and add every new event in bulk, with the same result as
+    get_event_from_response for every event
+
+    Keyword arguments:
+    response -- meetup api events response in a list
+    group -- GroupPage parent of the events
+    revisions -- create & publish a wagtail revision for every new event (default False)
+    identity_map -- cache of the run for venues, members & photos
+
+    return -> [EventPage] new events wich wasn't in the database
+    """
+
+    # resolve the new events with one query
+    existing_meetup_ids: set = set(
+        EventPage.objects.filter(
+            meetup_id__in=[
+                str(event_response["id"])
+                for event_response in response
+                if "id" in event_response
+            ]
+        ).values_list("meetup_id", flat=True)
+    )
+
+    new_event_responses: [dict] = [
+        event_response
+        for event_response in response
+        if "id" in event_response
+        and str(event_response["id"]) not in existing_meetup_ids
+    ]
+
+    # upsert the changed venues, event host members & photos of the new events with one statement per model
+    identity_map = identity_map or IdentityMap()
+    venue_rows: [dict] = []
+    member_rows: [dict] = []
+    photo_rows: [dict] = []
+    for event_response in new_event_responses:
+        if "venue" in event_response:
+            venue_fields: dict = get_venue_fields(event_response["venue"])
+            venue: Venue = identity_map.instances.get(
+                (Venue, str(venue_fields["meetup_id"]))
+            )
+            if not venue or venue.content_hash != venue_fields["content_hash"]:
+                venue_rows.append(venue_fields)
+
+        for event_host in event_response.get("event_hosts", []):
+            # the members of the hosts have only an id, so missing members are created & existing ones are kept
+            if "id" in event_host:
+                member_fields: dict = {"meetup_id": event_host["id"]}
+                if not is_cached(identity_map, Member, member_fields):
+                    member_rows.append(member_fields)
+            if "photo" in event_host:
+                photo_fields: dict = map_photo(event_host["photo"])
+                photo_fields["meetup_id"] = event_host["photo"]["id"]
+                if not is_cached(identity_map, Photo, photo_fields):
+                    photo_rows.append(photo_fields)
+
+    for model, rows in [
+        (Venue, venue_rows),
+        (Member, member_rows),
+        (Photo, photo_rows),
+    ]:
+        for instance in bulk_upsert(model, rows).values():
+            identity_map.add(instance)
+
+    events: [EventPage] = []
+    for event_response in new_event_responses:
+        if str(event_response["id"]) in existing_meetup_ids:
+            continue
+
+        event: EventPage = parse_event_from_response(
+            response=event_response, group=group, identity_map=identity_map
         )
+        if event:
+            existing_meetup_ids.add(event.meetup_id)
+            events.append(event)
+
+    return bulk_add_children(parent=group, children=events, revisions=revisions)
+
+
+def is_cached(identity_map: IdentityMap, model, fields: dict) -> bool:
+    """
+    check if the identity map has an object with the same field values, so the object needs no upsert
+
+    Keyword arguments:
+    identity_map -- cache of the run
+    model -- model with a unique meetup_id
+    fields -- parsed field values by field name with the meetup_id
+
+    return -> True when the cached object has every field value
+    """
+    instance = identity_map.instances.get((model, str(fields["meetup_id"])))
+    return instance is not None and all(
+        getattr(instance, name) == value for name, value in fields.items()
+    )
+
+
+def parse_event_from_response(
+    response: dict, group: GroupPage, identity_map: IdentityMap = None
+) -> EventPage:
+    """
+    parse json response into an unsaved EventPage with its event hosts
+
+    Keyword arguments:
+    response -- meetup api response in a dict
+    group -- GroupPage parent of the event
+    identity_map -- cache of the run for venues, members & photos
+
+    return -> unsaved EventPage, None when a required field is missing
+    """
+    try:
+        fields: dict = map_event(response)
+    except KeyError:
+        return
+
+    # add relations
     if "venue" in response:
-        venue: Venue = get_venue_from_response(response=response["venue"])
-        event.venue = venue
-        event.lat = venue.lat
-        event.lon = venue.lon
+        venue: Venue = get_venue_from_response(
+            response=response["venue"], identity_map=identity_map
+        )
+        fields["venue"] = venue
+        fields["lat"] = venue.lat
+        fields["lon"] = venue.lon
     else:
-        event.lat = group.lat
-        event.lon = group.lon
-    if "venue_visibility" in response:
-        event.venue_visibility = response["venue_visibility"]
-    if "visibility" in response:
-        event.visibility = response["visibility"]
-
-    group.add_child(instance=event)
-    event.save_revision().publish()
+        fields["lat"] = group.lat
+        fields["lon"] = group.lon
+
+    # create event
+    event: EventPage = EventPage(
+        title="{}: {}".format(response["id"], response["name"]), group=group, **fields
+    )
+    event.event_hosts = [
+        get_event_host_from_response(response=event_host, identity_map=identity_map)
+        for event_host in response.get("event_hosts", [])
+    ]
+
     return event
 
 
-def get_group_from_response(response: dict, home_page: HomePage) -> GroupPage:
+def add_group_page(home_page: HomePage, group: GroupPage) -> GroupPage:
+    """
+    add a new group page as child of the home page, the home page row is locked like the parent of
+    bulk_add_children, so parallel crawlers can not add children with the same path
+
+    Keyword arguments:
+    home_page -- HomePage parent of GroupPage
+    group -- unsaved GroupPage
+
+    return -> the new GroupPage, or the GroupPage of the urlname which another crawler added meanwhile
+    """
+    with transaction.atomic():
+        locked_home_page: Page = Page.objects.select_for_update().get(pk=home_page.pk)
+
+        existing_group: GroupPage = GroupPage.objects.filter(
+            urlname=group.urlname
+        ).first()
+        if existing_group:
+            return existing_group
+
+        locked_home_page.add_child(instance=group)
+
+    return group
+
+
+def get_group_from_response(
+    response: dict,
+    home_page: HomePage,
+    identity_map: IdentityMap = None,
+    revisions: bool = False,
+) -> GroupPage:
     """
     parse json response and return an EventPage
 
     Keyword arguments:
     response -- meetup api response in a dict
     home_page -- HomePage parent of GroupPage
+    identity_map -- cache of the run for categories, photos, members & topics
+    revisions -- create & publish a wagtail revision for every change of the group (default False)
 
     return -> get or create GroupPage based on urlname
     """
+    content_hash: str = get_content_hash(response)
+    fields: dict = map_group(response)
 
     # get or create the group page
     try:
         group: GroupPage = GroupPage.objects.get(urlname=response["urlname"])
+
+        # skip the revision, topics & search index when the response did not change
+        if group.content_hash == content_hash:
+            return group
     except GroupPage.DoesNotExist:
         group: GroupPage = GroupPage(
             title=response["name"],
             slug=response["id"],
             urlname=response["urlname"],
             meetup_id=response["id"],
-            created=timezone.make_aware(
-                datetime.fromtimestamp(response["created"] / 1000)
-            ),
-            description=response["description"],
-            lat=Decimal("{0:.8f}".format(response["lat"])),
-            lon=Decimal("{0:.8f}".format(response["lon"])),
-            link=response["link"],
-            members=response["members"],
-            name=response["name"],
-            status=response["status"],
-            timezone=response["timezone"],
-            visibility=response["visibility"],
+            created=to_datetime(response["created"]),
+            **fields
         )
 
         # add group page as child of home page
-        home_page.add_child(instance=group)
+        group = add_group_page(home_page=home_page, group=group)
 
-    # update required fields
-    group.description = response["description"]
-    group.link = response["link"]
-    group.members = response["members"]
-    group.name = response["name"]
-    group.status = response["status"]
-    group.timezone = response["timezone"]
-    group.visibility = response["visibility"]
-
-    # add optional fields
+    # update fields
+    for field, value in fields.items():
+        setattr(group, field, value)
+
+    # add relations
     if "category" in response:
-        group.category = get_category_from_response(response=response["category"])
-    if "city" in response:
-        group.city = response["city"]
-    if "city_link" in response:
-        group.city_link = response["city_link"]
-    if "country" in response:
-        group.country = response["country"]
-    if "fee_options" in response:
-        if "currencies" in response["fee_options"]:
-            group.fee_options_currencies_code = response["fee_options"]["currencies"][
-                "code"
-            ]
-            if "default" in response["fee_options"]["currencies"]:
-                group.fee_options_currencies_default = response["fee_options"][
-                    "currencies"
-                ]["default"]
-            else:
-                group.fee_options_currencies_default = False
-        if "type" in response["fee_options"]:
-            group.fee_options_type = response["fee_options"]["type"]
+        group.category = get_category_from_response(
+            response=response["category"], identity_map=identity_map
+        )
     if "group_photo" in response:
-        group.group_photo = get_photo_from_response(response["group_photo"])
-    if "join_mode" in response:
-        group.join_mode = response["join_mode"]
-    if "join_mode" in response:
-        group.join_mode = response["join_mode"]
+        group.group_photo = get_photo_from_response(
+            response["group_photo"], identity_map=identity_map
+        )
     if "key_photo" in response:
-        group.key_photo = get_photo_from_response(response["key_photo"])
-    if "lat" in response:
-        group.lat = Decimal("{0:.8f}".format(response["lat"]))
-    if "lon" in response:
-        group.lon = Decimal("{0:.8f}".format(response["lon"]))
-    if "localized_country_name" in response:
-        group.localized_country_name = response["localized_country_name"]
-    if "localized_location" in response:
-        group.localized_location = response["localized_location"]
-    if "member_limit" in response:
-        group.member_limit = response["member_limit"]
+        group.key_photo = get_photo_from_response(
+            response["key_photo"], identity_map=identity_map
+        )
     if "meta_category" in response:
         group.meta_category = get_meta_category_from_response(
-            response=response["meta_category"]
+            response=response["meta_category"], identity_map=identity_map
         )
-    else:
-        group.nominated_member = False
-    if "nomination_acceptable" in response:
-        group.nomination_acceptable = True
-    else:
-        group.nomination_acceptable = False
     if "organizer" in response:
-        group.organizer = get_member_from_response(response=response["organizer"])
-    if "short_link" in response:
-        group.short_link = response["short_link"]
-    if "state" in response:
-        group.state = response["state"]
-    if "status" in response:
-        group.status = response["status"]
+        group.organizer = get_member_from_response(
+            response=response["organizer"], identity_map=identity_map
+        )
     if "topics" in response:
-        group.topics.clear()
-        for topic in response["topics"]:
-            group.topics.add(get_topic_from_response(response=topic))
-    if "untranslated_city" in response:
-        group.untranslated_city = response["untranslated_city"]
-    if "welcome_message" in response:
-        group.welcome_message = response["welcome_message"]
-    if "who" in response:
-        group.who = response["who"]
+        group.topics.set(
+            [
+                get_topic_from_response(response=topic, identity_map=identity_map)
+                for topic in response["topics"]
+            ]
+        )
 
     # save & publish group
-    group.save_revision().publish()
+    group.content_hash = content_hash
+    publish_page(group, revisions=revisions)
 
     return group
 
 
-def get_photo_from_response(response: dict):
+def get_photo_from_response(response: dict, identity_map: IdentityMap = None):
     """
     parse json response and return an Photo
 
     Keyword arguments:
     response -- meetup api response in a dict
+    identity_map -- cache of the run, when None the photo is loaded from the database
 
     return -> get or create Photo
     """
+    identity_map = identity_map or IdentityMap(max_size=0)
 
-    photo, create = Photo.objects.get_or_create(meetup_id=response["id"])
-
-    # add optional fields
-    if "highres_link" in response:
-        photo.highres_link = response["highres_link"]
-    if "base_url" in response:
-        photo.base_url = response["base_url"]
-    if "photo_link" in response:
-        photo.photo_link = response["photo_link"]
-    if "thumb_link" in response:
-        photo.thumb_link = response["thumb_link"]
-    if "type" in response:
-        photo.photo_type = response["type"]
-
-    photo.save()
+    photo, create = identity_map.get_or_create(Photo, meetup_id=response["id"])
+    identity_map.update(photo, map_photo(response))
     return photo
 
 
-def get_member_from_response(response: dict):
+def get_member_from_response(response: dict, identity_map: IdentityMap = None):
     """
     parse json response and return an Member
 
     Keyword arguments:
     response -- meetup api response in a dict
+    identity_map -- cache of the run, when None the member is loaded from the database
 
     return -> get or create Member
     """
+    identity_map = identity_map or IdentityMap(max_size=0)
 
-    member, create = Member.objects.get_or_create(meetup_id=response["id"])
+    member, create = identity_map.get_or_create(Member, meetup_id=response["id"])
 
-    # add optional fields
-    if "name" in response:
-        member.name = response["name"]
-    if "bio" in response:
-        member.bio = response["bio"]
+    fields: dict = map_member(response)
     if "photo" in response:
-        member.photo = get_photo_from_response(response=response["photo"])
+        fields["photo"] = get_photo_from_response(
+            response=response["photo"], identity_map=identity_map
+        )
 
-    member.save()
+    identity_map.update(member, fields)
     return member
 
 
-def get_event_host_from_response(response: dict):
+def get_event_host_from_response(response: dict, identity_map: IdentityMap = None):
     """
     parse json response and return an EventHost
 
     Keyword arguments:
     response -- meetup api response in a dict
+    identity_map -- cache of the run, when None members & photos are loaded from the database
 
     return -> get unsaved EventHost
     """
 
-    event_host: EventHost = EventHost()
+    fields: dict = map_event_host(response)
 
-    # add optional fields
-    if "host_count" in response:
-        event_host.host_count = response["host_count"]
+    # add relations
     if "id" in response:
-        event_host.member = get_member_from_response(response={"id": response["id"]})
-    if "intro" in response:
-        event_host.intro = response["intro"]
-    if "join_date" in response:
-        event_host.join_date = timezone.make_aware(
-            datetime.fromtimestamp(response["join_date"] / 1000)
+        fields["member"] = get_member_from_response(
+            response={"id": response["id"]}, identity_map=identity_map
         )
-    if "name" in response:
-        event_host.name = response["name"]
     if "photo" in response:
-        event_host.photo = get_photo_from_response(response=response["photo"])
+        fields["photo"] = get_photo_from_response(
+            response=response["photo"], identity_map=identity_map
+        )
 
-    return event_host
+    return EventHost(**fields)
 
 
-def get_category_from_response(response: dict):
+def get_category_from_response(response: dict, identity_map: IdentityMap = None):
     """
     parse json response and return an Category
 
     Keyword arguments:
     response -- meetup api response in a dict
+    identity_map -- cache of the run, when None the category is loaded from the database
 
     return -> get or create Category
     """
+    identity_map = identity_map or IdentityMap(max_size=0)
 
-    category, create = Category.objects.get_or_create(meetup_id=response["id"])
-
-    if "name" in response:
-        category.name = response["name"]
-    if "shortname" in response:
-        category.shortname = response["shortname"]
-    if "sort_name" in response:
-        category.sort_name = response["sort_name"]
-
-    category.save()
+    category, create = identity_map.get_or_create(Category, meetup_id=response["id"])
+    identity_map.update(category, map_category(response))
     return category
 
 
-def get_topic_from_response(response: dict):
+def get_topic_from_response(response: dict, identity_map: IdentityMap = None):
     """
     parse json response and return an Topic
 
     Keyword arguments:
     response -- meetup api response in a dict
+    identity_map -- cache of the run, when None the topic is loaded from the database
 
     return -> get or create Topic
     """
+    identity_map = identity_map or IdentityMap(max_size=0)
 
-    try:
-        topic: Topic = Topic.objects.get(meetup_id=response["id"])
-    except Topic.DoesNotExist:
-        topic: Topic = Topic(
-            meetup_id=response["id"],
-            lang=response["lang"],
-            name=response["name"],
-            urlkey=response["urlkey"],
-        )
+    fields: dict = map_topic(response)
 
-    # update required fields
-    topic.lang = response["lang"]
-    topic.name = response["name"]
-    topic.urlkey = response["urlkey"]
+    topic: Topic = identity_map.get(Topic, meetup_id=response["id"])
+    if not topic:
+        topic = Topic.objects.create(meetup_id=response["id"], **fields)
+        identity_map.add(topic)
+        return topic
 
-    topic.save()
+    identity_map.update(topic, fields)
     return topic
 
 
-def get_meta_category_from_response(response: dict):
+def get_meta_category_from_response(response: dict, identity_map: IdentityMap = None):
     """
     parse json response and return an MetaCategory
 
     Keyword arguments:
     response -- meetup api response in a dict
+    identity_map -- cache of the run, when None categories & photos are loaded from the database
 
     return -> get or create MetaCategory
     """
-
-    try:
-        meta_category: MetaCategory = MetaCategory.objects.get(meetup_id=response["id"])
-    except MetaCategory.DoesNotExist:
+    identity_map = identity_map or IdentityMap(max_size=0)
+    content_hash: str = get_content_hash(response)
+    fields: dict = map_meta_category(response)
+
+    meta_category: MetaCategory = identity_map.get(
+        MetaCategory, meetup_id=response["id"]
+    )
+    if not meta_category:
         meta_category: MetaCategory = MetaCategory.objects.create(
-            meetup_id=response["id"],
-            name=response["name"],
-            shortname=response["shortname"],
-            sort_name=response["sort_name"],
+            meetup_id=response["id"], **fields
         )
+        identity_map.add(meta_category)
+    elif meta_category.content_hash == content_hash:
+        return meta_category
 
     # update required fields
-    meta_category.name = response["name"]
-    meta_category.shortname = response["shortname"]
-    meta_category.sort_name = response["sort_name"]
+    for field, value in fields.items():
+        setattr(meta_category, field, value)
 
     # updte optional field
     if "photo" in response:
-        meta_category.photo = get_photo_from_response(response["photo"])
+        meta_category.photo = get_photo_from_response(
+            response["photo"], identity_map=identity_map
+        )
 
     # update categories
-    meta_category.categories.clear()
-    if "category_ids" in response:
-        for category_id in response["category_ids"]:
-            category, created = Category.objects.get_or_create(meetup_id=category_id)
-            meta_category.categories.add(category)
+    categories: [Category] = []
+    for category_id in response.get("category_ids", []):
+        category, created = identity_map.get_or_create(Category, meetup_id=category_id)
+        categories.append(category)
+    meta_category.categories.set(categories)
 
+    meta_category.content_hash = content_hash
     meta_category.save()
     return meta_category
 
 
-def get_venue_from_response(response: dict):
+def get_venue_from_response(response: dict, identity_map: IdentityMap = None):
     """
     parse json response and return an Venue
 
     Keyword arguments:
     response -- meetup api response in a dict
+    identity_map -- cache of the run, when None the venue is loaded from the database
 
     return -> get or create Venue
     """
+    identity_map = identity_map or IdentityMap(max_size=0)
+    fields: dict = get_venue_fields(response)
 
-    print(response)
-
-    venue, created = Venue.objects.get_or_create(meetup_id=response["id"])
-    if "address_1" in response:
-        venue.address_1 = response["address_1"]
-    if "address_2" in response:
-        venue.address_2 = response["address_2"]
-    if "address_3" in response:
-        venue.address_3 = response["address_3"]
-    if "city" in response:
-        venue.city = response["city"]
-    if "country" in response:
-        venue.country = response["country"]
-    if "lat" in response:
-        venue.lat = Decimal("{0:.8f}".format(response["lat"]))
-    if "lon" in response:
-        venue.lon = Decimal("{0:.8f}".format(response["lon"]))
-    if "localized_country_name" in response:
-        venue.localized_country_name = response["localized_country_name"]
-    if "name" in response:
-        venue.name = response["name"]
-    if "phone" in response:
-        venue.phone = response["phone"]
-    if "zip_code" in response:
-        venue.zip_code = response["zip_code"]
-    venue.save()
+    venue, created = identity_map.get_or_create(Venue, meetup_id=response["id"])
+    if venue.content_hash == fields["content_hash"]:
+        return venue
+
+    identity_map.update(venue, fields)
     return venue
+
+
+def get_venue_fields(response: dict) -> dict:
+    """
+    parse json response to the fields of a Venue
+
+    Keyword arguments:
+    response -- meetup api response in a dict
+
+    return -> {field name: value} with the meetup_id, content_hash & all fields of the response
+    """
+    fields: dict = map_venue(response)
+    fields["content_hash"] = get_content_hash(response)
+    return fields
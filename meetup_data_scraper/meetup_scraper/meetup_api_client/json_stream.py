@@ -0,0 +1,151 @@
+import codecs
+import json
+
+# characters between the items of a json array
+JSON_WHITESPACE: str = " \t\n\r"
+
+# bytes which are read at once from a streamed response
+STREAM_CHUNK_SIZE: int = 64 * 1024
+
+
+def iter_json_array(chunks):
+    """
+    decode the items of a json array one by one while the bytes are read, so only the current item & the unread
+    rest of the last chunk are in memory instead of the whole body
+
+    Keyword arguments:
+    chunks -- iterable of bytes like response.iter_content()
+
+    return -> iterator of the decoded items
+    """
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    json_decoder: json.JSONDecoder = json.JSONDecoder()
+    buffer: str = ""
+    position: int = 0
+    started: bool = False
+
+    for chunk in chunks:
+        buffer = buffer[position:] + text_decoder.decode(chunk)
+        position = 0
+
+        while True:
+            while position < len(buffer) and buffer[position] in JSON_WHITESPACE:
+                position = position + 1
+            if position == len(buffer):
+                break
+
+            if not started:
+                if buffer[position] != "[":
+                    raise ValueError("the json body is not an array")
+                started = True
+                position = position + 1
+                continue
+            if buffer[position] == ",":
+                position = position + 1
+                continue
+            if buffer[position] == "]":
+                return
+
+            # an item which ends at the end of the buffer can be cut, like a number
+            try:
+                item, end = json_decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break
+            if end == len(buffer):
+                break
+            yield item
+            position = end
+
+    raise ValueError("the json array is incomplete")
+
+
+def iter_json_object(chunks):
+    """
+    decode the members of a json object one by one while the bytes are read, like iter_json_array
+
+    Keyword arguments:
+    chunks -- iterable of bytes like the chunks of a file
+
+    return -> iterator of (key, decoded value)
+    """
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    json_decoder: json.JSONDecoder = json.JSONDecoder()
+    buffer: str = ""
+    position: int = 0
+    started: bool = False
+    key: str = None
+    colon: bool = False
+
+    for chunk in chunks:
+        buffer = buffer[position:] + text_decoder.decode(chunk)
+        position = 0
+
+        while True:
+            while position < len(buffer) and buffer[position] in JSON_WHITESPACE:
+                position = position + 1
+            if position == len(buffer):
+                break
+
+            if not started:
+                if buffer[position] != "{":
+                    raise ValueError("the json body is not an object")
+                started = True
+                position = position + 1
+                continue
+
+            if key is None:
+                if buffer[position] == ",":
+                    position = position + 1
+                    continue
+                if buffer[position] == "}":
+                    return
+                if buffer[position] != '"':
+                    raise ValueError("the json object has no string key")
+
+                # a key is a string, which can only be decoded when its closing quote was read
+                try:
+                    key, position = json_decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    break
+                continue
+
+            if not colon:
+                if buffer[position] != ":":
+                    raise ValueError("the json object has no colon after a key")
+                colon = True
+                position = position + 1
+                continue
+
+            # a value which ends at the end of the buffer can be cut, like a number
+            try:
+                value, end = json_decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break
+            if end == len(buffer):
+                break
+            yield key, value
+            key = None
+            colon = False
+            position = end
+
+    raise ValueError("the json object is incomplete")
+
+
+def iter_batches(items, batch_size: int):
+    """
+    group items into lists
+
+    Keyword arguments:
+    items -- iterable
+    batch_size -- max items per list
+
+    return -> iterator of lists with up to batch_size items
+    """
+    batch: list = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
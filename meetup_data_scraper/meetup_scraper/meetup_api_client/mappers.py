@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from django.utils import timezone
+
+# marks a FieldMapping without default, so the field is only set when the source key exists
+NO_DEFAULT = object()
+
+
+def to_datetime(milliseconds: int) -> datetime:
+    """
+    return -> aware datetime of a meetup timestamp in milliseconds
+    """
+    return timezone.make_aware(datetime.fromtimestamp(milliseconds / 1000))
+
+
+def to_timedelta(milliseconds: int) -> timedelta:
+    """
+    return -> timedelta of a meetup duration in milliseconds
+    """
+    return timedelta(seconds=milliseconds / 1000)
+
+
+def to_seconds(milliseconds: int) -> float:
+    """
+    return -> seconds of a meetup time offset in milliseconds
+    """
+    return milliseconds / 1000
+
+
+def to_decimal(value: float) -> Decimal:
+    """
+    return -> Decimal with 8 decimal places of a coordinate
+    """
+    return Decimal("{0:.8f}".format(value))
+
+
+def is_set(value) -> bool:
+    """
+    return -> True, for flags which are only in the response when they are set
+    """
+    return True
+
+
+class FieldMapping:
+    """
+    maps one key of a meetup api response to one model field
+    """
+
+    def __init__(
+        self,
+        field: str,
+        source: str = None,
+        converter=None,
+        required: bool = False,
+        default=NO_DEFAULT,
+    ):
+        """
+        Keyword arguments:
+        field -- model field name
+        source -- key of the response, nested keys are separated by dots like "fee.amount" (default field)
+        converter -- function which converts the response value to the field value (default None)
+        required -- the key is always in the response, a missing key raises a KeyError (default False)
+        default -- value when the parent of the key exists, but not the key itself (default NO_DEFAULT)
+        """
+        self.field: str = field
+        self.source: str = source or field
+        self.converter = converter
+        self.required: bool = required
+        self.default = default
+
+
+def compile_mapper(name: str, mappings: [FieldMapping]):
+    """
+    compile field mappings once into a function, which returns the field values of a response as dict without
+    looping over the mappings for every response
+
+    Keyword arguments:
+    name -- name of the compiled function
+    mappings -- field mappings of a model
+
+    return -> function(response: dict) -> {field name: value}
+    """
+    namespace: dict = {}
+    lines: [str] = ["def {}(response):".format(name), "    fields = {}"]
+
+    for number, mapping in enumerate(mappings):
+        keys: [str] = mapping.source.split(".")
+        parent: str = "response" + "".join("[{!r}]".format(key) for key in keys[:-1])
+        value: str = "{}[{!r}]".format(parent, keys[-1])
+        if mapping.converter:
+            namespace["converter_{}".format(number)] = mapping.converter
+            value = "converter_{}({})".format(number, value)
+        assignment: str = "fields[{!r}] = {}".format(mapping.field, value)
+
+        if mapping.required:
+            lines.append("    " + assignment)
+            continue
+
+        # every parent key must exist, before the key is checked
+        indent: str = "    "
+        for depth, key in enumerate(keys[:-1]):
+            key_parent: str = "response" + "".join(
+                "[{!r}]".format(parent_key) for parent_key in keys[:depth]
+            )
+            lines.append("{}if {!r} in {}:".format(indent, key, key_parent))
+            indent = indent + "    "
+
+        lines.append("{}if {!r} in {}:".format(indent, keys[-1], parent))
+        lines.append("{}    {}".format(indent, assignment))
+        if mapping.default is not NO_DEFAULT:
+            namespace["default_{}".format(number)] = mapping.default
+            lines.append("{}else:".format(indent))
+            lines.append(
+                "{}    fields[{!r}] = default_{}".format(indent, mapping.field, number)
+            )
+
+    lines.append("    return fields")
+    exec("\n".join(lines), namespace)
+    return namespace[name]
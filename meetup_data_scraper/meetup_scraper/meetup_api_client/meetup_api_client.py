@@ -1,53 +1,214 @@
 import requests
 
 import time
+from contextlib import contextmanager
 from requests.models import Response
+from django.conf import settings
 from django.utils import timezone
 import pytz
 from meetup_data_scraper.meetup_scraper.models import (
+    CrawlState,
     EventPage,
     GroupPage,
     HomePage,
 )
 from meetup_data_scraper.meetup_scraper.meetup_api_client.exceptions import (
+    CircuitOpenError,
     HttpNoSuccess,
     HttpNotFoundError,
     HttpNotAccessibleError,
     HttpNoXRateLimitHeader,
+    HttpNotModified,
 )
-from .json_parser import get_group_from_response, get_event_from_response
+from .json_parser import (
+    EVENT_FIELDS,
+    EVENT_OPTIONAL_FIELDS,
+    GROUP_FIELDS,
+    GROUP_OPTIONAL_FIELDS,
+    get_group_from_response,
+    get_events_from_response,
+)
+from .cassette import CassetteRecorder, ReplayAdapter
+from .circuit_breaker import CircuitBreaker, CircuitBreakers
+from .identity_map import IdentityMap
+from .json_decoder import get_json_decoder
+from .json_stream import STREAM_CHUNK_SIZE, iter_batches, iter_json_array
+from .rate_limit_backends import (
+    LocalRateLimitBackend,
+    RateLimitBackend,
+    get_rate_limit_backend,
+)
+from .response_cache import CachedResponse, ResponseCache
+from .retry import RetryPolicy
+from .session import create_session
+
+
+class SharedState:
+    """
+    rate limit value which is stored in the state of the rate limit backend
+    """
+
+    def __init__(self, default=None):
+        """
+        Keyword arguments:
+        default -- value when the state has no value yet
+        """
+        super().__init__()
+        self.default = default
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return instance.state.get(self.name, self.default)
+
+    def __set__(self, instance, value):
+        instance.state[self.name] = value
 
 
 class RateLimit:
     """
-    meetup api rate limit, wait for new request if needed
+    meetup api rate limit as token bucket, the bucket is filled evenly over the X-RateLimit window so the
+    requests are spread over the whole window instead of a burst followed by a stall until the reset
+
+    the state of the bucket is kept in a RateLimitBackend, every RateLimit with the same backend
+    draws from one budget, also across processes & hosts with a shared backend
     """
 
-    def __init__(self):
+    # The maximum number of requests that can be made in a window of time
+    limit: int = SharedState(0)
+
+    # The remaining number of requests allowed in the current rate limit window
+    remaining: int = SharedState(0)
+
+    # The number of seconds until the current rate limit window resets
+    reset: int = SharedState(0)
+
+    # unixtime when limits will be reseted
+    reset_time: float = SharedState(None)
+
+    # token bucket, filled with fill_rate tokens per second up to burst tokens
+    tokens: float = SharedState(0)
+    fill_rate: float = SharedState(0)
+    last_refill: float = SharedState(0)
+
+    # longest window seen, used to calculate the quota per second
+    window: int = SharedState(0)
+
+    def __init__(self, burst: int = 1, backend: RateLimitBackend = None):
+        """
+        Keyword arguments:
+        burst -- how many requests can be send at once without waiting (default 1)
+        backend -- storage of the state, when None the RateLimit gets an own in-process storage
+        """
         super().__init__()
 
-        # The maximum number of requests that can be made in a window of time
-        self.limit: int = 0
+        self.burst: int = max(1, burst)
+        self.backend: RateLimitBackend = backend or LocalRateLimitBackend()
 
-        # The remaining number of requests allowed in the current rate limit window
-        self.remaining: int = 0
+        # last state loaded from the backend
+        with self.backend.state() as state:
+            self.state: dict = state
 
-        # The number of seconds until the current rate limit window resets
-        self.reset: int = 0
+        # metrics of this RateLimit
+        self.started: float = time.time()
+        self.requests: int = 0
+        self.throttled_count: int = 0
+        self.throttled_time: float = 0
 
-        # unixtime when limits will be reseted
-        self.reset_time: float = None
+    @contextmanager
+    def shared_state(self):
+        """
+        lock the backend & load its state, so the values can be read & changed by one RateLimit at a time
+        """
+        with self.backend.state() as state:
+            self.state = state
+            yield
 
-    def wait_for_next_request(self):
+    def refill(self, now: float):
         """
-        wait for next request, if needed
+        add the tokens for the time since the last refill
+
+        Keyword arguments:
+        now -- current unixtime
+        """
+        self.tokens = min(
+            self.burst,
+            self.remaining,
+            self.tokens + (now - self.last_refill) * self.fill_rate,
+        )
+        self.last_refill = now
+
+    def seconds_until_next_request(self) -> float:
+        """
+        how long to wait until the next request is allowed
+
+        return -> wait time in seconds, 0 when a request can be send now
         """
         if not self.reset_time:
-            return
+            return 0
+
+        now: float = time.time()
+
+        # the window is over, the next response starts a new one
+        if now >= self.reset_time:
+            return 0
+
+        self.refill(now)
+        if self.tokens >= 1:
+            return 0
+
+        # no requests left in this window, wake up exactly on the reset
+        if self.remaining < 1 or self.fill_rate <= 0:
+            return self.reset_time - now
 
-        if self.remaining < 1:
-            while self.reset_time > time.time():
-                time.sleep(1)
+        return min((1 - self.tokens) / self.fill_rate, self.reset_time - now)
+
+    def take(self):
+        """
+        take one request from the remaining requests of the current window, so requests which
+        are still in flight are counted before their response updates the rate limit
+        """
+        self.requests = self.requests + 1
+
+        if self.reset_time and time.time() < self.reset_time:
+            self.refill(time.time())
+            self.tokens = self.tokens - 1
+            self.remaining = self.remaining - 1
+
+    def record_wait(self, seconds: float):
+        """
+        add a wait to the throttle metrics
+
+        Keyword arguments:
+        seconds -- how long the request was throttled
+        """
+        self.throttled_count = self.throttled_count + 1
+        self.throttled_time = self.throttled_time + seconds
+
+    def reserve(self) -> float:
+        """
+        take the next request if it is allowed now
+
+        return -> 0 when the request was taken, else the wait time in seconds until the next try
+        """
+        with self.shared_state():
+            delay: float = self.seconds_until_next_request()
+            if delay <= 0:
+                self.take()
+            return delay
+
+    def wait_for_next_request(self):
+        """
+        wait for next request, if needed
+        """
+        delay: float = self.reserve()
+        while delay > 0:
+            time.sleep(delay)
+            self.record_wait(delay)
+            delay = self.reserve()
 
     def update_rate_limit(self, response: Response, reset_time: int):
         """
@@ -55,19 +216,156 @@ class RateLimit:
 
         Keyword arguments:
         response -- http response
-        reset_time -- wait time in secounds
+        reset_time -- wait time in seconds
         """
+        with self.shared_state():
+            has_header: bool = self.update_shared_state(
+                response=response, reset_time=reset_time
+            )
+
+        if not has_header:
+            raise HttpNoXRateLimitHeader("There is no XRateLimit Header!")
+
+    def update_shared_state(self, response: Response, reset_time: int) -> bool:
+        """
+        Update the state from the response header, only call it in shared_state
+
+        return -> False when the response has no X-RateLimit header
+        """
+        now: float = time.time()
+        window_over: bool = not self.reset_time or now >= self.reset_time
         try:
             self.limit = int(response.headers.get("X-RateLimit-Limit"))
             self.remaining = int(response.headers.get("X-RateLimit-Remaining"))
             self.reset = int(response.headers.get("X-RateLimit-Reset"))
-            self.reset_time = time.time() + self.reset
+            self.reset_time = now + self.reset
         except TypeError:
             self.limit = 0
             self.remaining = 0
             self.reset = reset_time
-            self.reset_time = time.time() + self.reset
-            raise HttpNoXRateLimitHeader("There is no XRateLimit Header!")
+            self.reset_time = now + self.reset
+            self.tokens = 0
+            self.fill_rate = 0
+            return False
+
+        # a new window started, so the bucket is full again
+        if window_over:
+            self.tokens = self.burst
+
+        # spread the remaining requests evenly over the rest of the window
+        self.window = max(self.window, self.reset)
+        self.fill_rate = self.remaining / self.reset if self.reset > 0 else 0
+        self.tokens = min(self.tokens, self.remaining)
+        self.last_refill = now
+        return True
+
+    def stats(self) -> dict:
+        """
+        throttle metrics since the rate limit was created
+
+        return -> dict with requests, throttled_count, throttled_time, requests_per_second & quota_per_second
+        """
+        elapsed: float = max(time.time() - self.started, 0.001)
+        return {
+            "requests": self.requests,
+            "throttled_count": self.throttled_count,
+            "throttled_time": self.throttled_time,
+            "requests_per_second": self.requests / elapsed,
+            "quota_per_second": self.limit / self.window if self.window else 0,
+        }
+
+    def report(self) -> str:
+        """
+        return -> throttle metrics as human readable string
+        """
+        stats: dict = self.stats()
+        return "{} requests, {} times throttled for {:.1f} seconds, {:.2f} of {:.2f} requests/sec quota used".format(
+            stats["requests"],
+            stats["throttled_count"],
+            stats["throttled_time"],
+            stats["requests_per_second"],
+            stats["quota_per_second"],
+        )
+
+
+def create_retry_policy() -> RetryPolicy:
+    """
+    create a retry policy with the backoff & budget from the settings
+
+    return -> RetryPolicy
+    """
+    return RetryPolicy(
+        base_delay=settings.MEETUP_API_RETRY_BASE_DELAY,
+        max_delay=settings.MEETUP_API_RETRY_MAX_DELAY,
+        budget=settings.MEETUP_API_RETRY_BUDGET,
+    )
+
+
+def create_circuit_breakers() -> CircuitBreakers:
+    """
+    create the circuit breakers of the endpoint families with the thresholds from the settings
+
+    return -> CircuitBreakers
+    """
+    return CircuitBreakers(
+        failure_rate=settings.MEETUP_API_CIRCUIT_FAILURE_RATE,
+        window=settings.MEETUP_API_CIRCUIT_WINDOW,
+        open_time=settings.MEETUP_API_CIRCUIT_OPEN_TIME,
+    )
+
+
+def get_url(base_url: str, url_path: str) -> str:
+    """
+    get the full url of an url path, urls of Link headers are already complete
+
+    Keyword arguments:
+    base_url -- url of the meetup api
+    url_path -- url path without domain or full url
+
+    return -> full url
+    """
+    if "://" in url_path.split("?", 1)[0]:
+        return url_path
+    return "{}{}".format(base_url, url_path)
+
+
+def get_events_url_path(
+    group: GroupPage, last_event: EventPage, max_entries: int
+) -> str:
+    """
+    get the url path of the first page of past events, when there is a last event only events which are no
+    earlier than this event are requested
+
+    Keyword arguments:
+    group -- GroupPage
+    last_event -- last EventPage of the group, can be None
+    max_entries -- events per page
+
+    return -> url path
+    """
+    if last_event:
+        return "{}/events?status=past&no_earlier_than={}&page={}".format(
+            group.urlname, last_event.time.strftime("%Y-%m-%d"), max_entries,
+        )
+    return "{}/events?status=past&page={}".format(group.urlname, max_entries)
+
+
+def add_projection(url_path: str, fields: [str], optional_fields: [str]) -> str:
+    """
+    add the only & fields query parameter to an url path, so the meetup api only sends the parsed fields
+
+    Keyword arguments:
+    url_path -- url path with or without query
+    fields -- top level fields of the response which should be send
+    optional_fields -- fields which the meetup api only sends on request
+
+    return -> url path with projection query
+    """
+    query: str = "only={}".format(",".join(fields))
+    if optional_fields:
+        query = "{}&fields={}".format(query, ",".join(optional_fields))
+    separator: str = "&" if "?" in url_path else "?"
+    return "{}{}{}".format(url_path, separator, query)
 
 
 class MeetupApiClient:
@@ -75,19 +373,165 @@ class MeetupApiClient:
     small meetup api client only for groups & events
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        session: requests.Session = None,
+        retry_policy: RetryPolicy = None,
+        response_cache: ResponseCache = None,
+        full_payload: bool = None,
+        circuit_breakers: CircuitBreakers = None,
+        rate_limit: RateLimit = None,
+    ):
+        """
+        Keyword arguments:
+        session -- http session to share between clients, when None a new pooled session is created
+        retry_policy -- when & how long to wait for retries, when None the policy is created from the settings
+        response_cache -- cache for conditional requests, when None settings.MEETUP_API_RESPONSE_CACHE is used
+        full_payload -- request all fields instead of only the parsed ones, when None
+                        settings.MEETUP_API_FULL_PAYLOAD is used
+        circuit_breakers -- circuit breakers to share between clients, when None they are created from the settings
+        rate_limit -- RateLimit to share between clients, when None a RateLimit on the configured backend is created
+        """
         super().__init__()
-        self.rate_limit = RateLimit()
+        self.rate_limit: RateLimit = rate_limit or RateLimit(
+            burst=settings.MEETUP_API_RATE_LIMIT_BURST,
+            backend=get_rate_limit_backend(),
+        )
 
         # meetup apir url
         self.base_url: str = "https://api.meetup.com/"
 
+        # pooled keep-alive session, reused for every request of this client
+        if not session:
+            session = create_session(pool_size=settings.MEETUP_API_POOL_SIZE)
+        self.session: requests.Session = session
+
+        # (connect, read) timeout in seconds
+        self.timeout: (float, float) = (
+            settings.MEETUP_API_CONNECT_TIMEOUT,
+            settings.MEETUP_API_READ_TIMEOUT,
+        )
+
+        # backoff & retry budget of this client
+        self.retry_policy: RetryPolicy = retry_policy or create_retry_policy()
+
+        # fail fast while an endpoint family mostly fails
+        self.circuit_breakers: CircuitBreakers = (
+            circuit_breakers or create_circuit_breakers()
+        )
+
+        # opt-in persistent response cache
+        if not response_cache and settings.MEETUP_API_RESPONSE_CACHE:
+            response_cache = ResponseCache(path=settings.MEETUP_API_RESPONSE_CACHE)
+        self.response_cache: ResponseCache = response_cache
+
+        # only request the fields which are parsed
+        if full_payload is None:
+            full_payload = settings.MEETUP_API_FULL_PAYLOAD
+        self.full_payload: bool = full_payload
+
+        # response body bytes of the run
+        self.bytes_downloaded: int = 0
+
+        # snippets like venues & members which were already loaded in this run
+        self.identity_map: IdentityMap = IdentityMap(
+            max_size=settings.MEETUP_API_IDENTITY_MAP_SIZE
+        )
+
+        # decodes the raw response bytes, orjson when it is installed
+        self.json_decoder = get_json_decoder(settings.MEETUP_API_JSON_DECODER)
+
+        # decode events pages while downloading & add the events in batches, 0 to load whole pages
+        self.stream_batch_size: int = settings.MEETUP_API_STREAM_BATCH_SIZE
+
+        # record every response to a cassette archive, see record()
+        self.recorder: CassetteRecorder = None
+
         # default homepage, page will created automatically on migrate
         self.home_page: HomePage = None
 
         # set timezone
         timezone.activate(pytz.timezone("UTC"))
 
+    def close(self):
+        """
+        close all pooled connections of the http session, the response cache & the cassette archive
+        """
+        self.session.close()
+        if self.response_cache:
+            self.response_cache.close()
+        if self.recorder:
+            self.recorder.close()
+
+    def record(self, path: str):
+        """
+        append every raw response of this client to a cassette archive
+
+        Keyword arguments:
+        path -- path of the gzip compressed archive
+        """
+        self.recorder = CassetteRecorder(path=path)
+        self.session.hooks["response"].append(self.recorder.record)
+
+    def replay(self, path: str):
+        """
+        serve every request from a cassette archive instead of the meetup api, the replay runs at full speed
+        and does not take requests from the shared rate limit budget
+
+        Keyword arguments:
+        path -- path of an archive written by record()
+        """
+        replay_adapter: ReplayAdapter = ReplayAdapter(path=path)
+        self.session.mount("https://", replay_adapter)
+        self.session.mount("http://", replay_adapter)
+        self.rate_limit = RateLimit(
+            burst=settings.MEETUP_API_RATE_LIMIT_BURST,
+            backend=LocalRateLimitBackend(),
+        )
+
+    def project(self, url_path: str, fields: [str], optional_fields: [str]) -> str:
+        """
+        add the projection query to an url path, unless the client requests full payloads
+
+        Keyword arguments:
+        url_path -- url path with or without query
+        fields -- top level fields of the response which should be send
+        optional_fields -- fields which the meetup api only sends on request
+
+        return -> url path
+        """
+        if self.full_payload:
+            return url_path
+        return add_projection(
+            url_path=url_path, fields=fields, optional_fields=optional_fields
+        )
+
+    def download_report(self) -> str:
+        """
+        return -> downloaded response bytes as human readable string
+        """
+        return "{:.2f} MB ({} payloads)".format(
+            self.bytes_downloaded / 1024 / 1024,
+            "full" if self.full_payload else "projected",
+        )
+
+    def add_metrics(self, api_client):
+        """
+        add the download & identity map metrics of another client, like a worker client of the same run, the
+        shared rate limit, retry policy, circuit breakers & response cache count the requests of every client
+
+        Keyword arguments:
+        api_client -- MeetupApiClient
+        """
+        self.bytes_downloaded = self.bytes_downloaded + api_client.bytes_downloaded
+        self.identity_map.hits = self.identity_map.hits + api_client.identity_map.hits
+        self.identity_map.misses = (
+            self.identity_map.misses + api_client.identity_map.misses
+        )
+        self.identity_map.saved_queries = (
+            self.identity_map.saved_queries + api_client.identity_map.saved_queries
+        )
+
     def get_home_page(self) -> HomePage:
         """
         get the default homepage wich will created on migration
@@ -99,55 +543,232 @@ class MeetupApiClient:
         return self.homePage
 
     def get(
-        self, url_path: str, retry: int = 0, max_retry=3, reset_time: int = 60
+        self,
+        url_path: str,
+        retry: int = 0,
+        max_retry: int = None,
+        reset_time: int = 60,
+        skip_unchanged: bool = False,
     ) -> dict:
         """
-        meetup http request on the url_path
+        meetup http request on the url_path, failed requests are retried by the retry policy
 
         Keyword arguments:
         url_path -- url path without domain example for url https://api.meetup.com/find/groups is the url_path find/groups
-        retry -- how many times try to get the same url
-        max_retry -- max retries bevor raise an error
-        reset_time -- wait time in secounds (default: 60)
+        retry -- how many times the url was already tried
+        max_retry -- max retries bevor raise an error, None to use the max retries of the retry policy
+        reset_time -- wait time in seconds (default: 60)
+        skip_unchanged -- raise HttpNotModified when the cached response is still up to date
 
         return -> json as python dict
         """
-        self.rate_limit.wait_for_next_request()
-
-        url: str = "{}{}".format(self.base_url, url_path)
-        response: Response = requests.get(url)
+        response, links = self.get_with_links(
+            url_path=url_path,
+            retry=retry,
+            max_retry=max_retry,
+            reset_time=reset_time,
+            skip_unchanged=skip_unchanged,
+        )
+        return response
+
+    def get_with_links(
+        self,
+        url_path: str,
+        retry: int = 0,
+        max_retry: int = None,
+        reset_time: int = 60,
+        skip_unchanged: bool = False,
+        stream: bool = False,
+    ) -> (dict, dict):
+        """
+        meetup http request like get, which also returns the parsed Link header for the pagination
 
-        if response.status_code == 404:
-            raise HttpNotFoundError
-        if response.status_code == 410:
-            raise HttpNotAccessibleError
-        if response.status_code != 200:
-            if retry >= max_retry:
-                raise HttpNoSuccess
-            else:
-                return self.get(url_path=url_path, retry=retry + 1)
+        Keyword arguments:
+        url_path -- url path without domain or a full url of a Link header
+        retry -- how many times the url was already tried
+        max_retry -- max retries bevor raise an error, None to use the max retries of the retry policy
+        reset_time -- wait time in seconds (default: 60)
+        skip_unchanged -- raise HttpNotModified when the cached response is still up to date
+        stream -- return an iterator which decodes the items of a json array while they are downloaded, not used
+                  with the response cache or while recording, because they need the whole body (default False)
+
+        return -> (json as python dict, links by rel) example links {"next": {"url": "...", "rel": "next"}}
+        """
+        circuit_breaker: CircuitBreaker = self.circuit_breakers.get_breaker(url_path)
+        circuit_breaker.before_request()
 
         try:
-            self.rate_limit.update_rate_limit(response=response, reset_time=reset_time)
-        except HttpNoXRateLimitHeader:
-            if retry >= max_retry:
-                raise HttpNoXRateLimitHeader("There is no XRateLimit Header!")
+            response, links = self.request(
+                url_path=url_path,
+                circuit_breaker=circuit_breaker,
+                retry=retry,
+                max_retry=max_retry,
+                reset_time=reset_time,
+                skip_unchanged=skip_unchanged,
+                stream=stream,
+            )
+        except (HttpNotFoundError, HttpNotAccessibleError, HttpNotModified):
+            # the server answered
+            circuit_breaker.record_success()
+            raise
+        except Exception:
+            circuit_breaker.record_failure()
+            raise
+
+        circuit_breaker.record_success()
+        return response, links
+
+    def request(
+        self,
+        url_path: str,
+        circuit_breaker: CircuitBreaker,
+        retry: int = 0,
+        max_retry: int = None,
+        reset_time: int = 60,
+        skip_unchanged: bool = False,
+        stream: bool = False,
+    ) -> (dict, dict):
+        """
+        send the request of get_with_links & retry it until it succeeds, the retry policy gives up or the circuit
+        breaker opens
+
+        Keyword arguments:
+        url_path -- url path without domain or a full url of a Link header
+        circuit_breaker -- CircuitBreaker of the endpoint family
+        retry -- how many times the url was already tried
+        max_retry -- max retries bevor raise an error, None to use the max retries of the retry policy
+        reset_time -- wait time in seconds (default: 60)
+        skip_unchanged -- raise HttpNotModified when the cached response is still up to date
+        stream -- return an iterator of the json array items, see get_with_links
+
+        return -> (json as python dict, links by rel)
+        """
+        url: str = get_url(base_url=self.base_url, url_path=url_path)
+        delay: float = 0
+        stream = stream and not self.response_cache and not self.recorder
+
+        # revalidate a cached response with a conditional request
+        cached_response: CachedResponse = None
+        headers: dict = {}
+        if self.response_cache:
+            cached_response = self.response_cache.get(url_path)
+            if cached_response:
+                headers = cached_response.conditional_headers()
+
+        while True:
+            self.rate_limit.wait_for_next_request()
+
+            try:
+                response: Response = self.session.get(
+                    url, headers=headers, timeout=self.timeout, stream=stream
+                )
+            except requests.RequestException:
+                response = None
+                failure: str = "connection"
             else:
-                return self.get(url_path=url_path, retry=retry + 1)
+                if not stream or response.status_code != 200:
+                    self.bytes_downloaded = self.bytes_downloaded + len(
+                        response.content
+                    )
+
+                if response.status_code == 404:
+                    raise HttpNotFoundError
+                if response.status_code == 410:
+                    raise HttpNotAccessibleError
+
+                if response.status_code == 200 or (
+                    response.status_code == 304 and cached_response
+                ):
+                    try:
+                        self.rate_limit.update_rate_limit(
+                            response=response, reset_time=reset_time
+                        )
+                    except HttpNoXRateLimitHeader:
+                        failure = "no_rate_limit_header"
+                    else:
+                        if response.status_code == 304:
+                            self.response_cache.record_hit(cached_response)
+                            if skip_unchanged:
+                                raise HttpNotModified
+                            return (
+                                self.json_decoder(cached_response.body),
+                                response.links or cached_response.links(),
+                            )
+
+                        if stream:
+                            return self.iter_response_items(response), response.links
+                        if self.response_cache:
+                            self.response_cache.record_miss()
+                            self.response_cache.store(url_path, response)
+                        return self.json_decoder(response.content), response.links
+                else:
+                    failure = RetryPolicy.failure_class(response.status_code)
+
+            if not self.retry_policy.should_retry(
+                failure=failure, retry=retry, max_retry=max_retry
+            ):
+                if failure == "no_rate_limit_header":
+                    raise HttpNoXRateLimitHeader("There is no XRateLimit Header!")
+                raise HttpNoSuccess
 
-        return response.json()
+            # release the connection of an unread streamed response
+            if response is not None:
+                response.close()
+
+            delay = self.retry_policy.next_delay(
+                previous_delay=delay, response=response
+            )
+            time.sleep(delay)
+            retry = retry + 1
+
+            # other requests of the endpoint family opened the circuit while waiting
+            if circuit_breaker.is_open():
+                raise CircuitOpenError(
+                    "Circuit breaker of {} requests is open".format(circuit_breaker.name)
+                )
+
+    def iter_response_items(self, response: Response):
+        """
+        decode the items of a streamed json array response one by one & count the downloaded bytes
+
+        Keyword arguments:
+        response -- response of a request with stream=True
+
+        return -> iterator of the decoded items, the connection is released at the end
+        """
+
+        def iter_chunks():
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                self.bytes_downloaded = self.bytes_downloaded + len(chunk)
+                yield chunk
+
+        try:
+            yield from iter_json_array(iter_chunks())
+        finally:
+            response.close()
 
     def get_group(self, group_urlname: str) -> GroupPage:
         """
-        get or create a GroupPage based on the group_urlname and fill / update the object from meetup rest api
+        get or create a GroupPage based on the group_urlname and fill / update the object from meetup rest api, the
+        TRANSIENT_ERRORS are raised so the group can be tried again
 
         Keyword arguments:
         group_urlname -- Meetup group the urlname as string
 
-        return -> GroupPage based on the group_urlname
+        return -> GroupPage based on the group_urlname, None when the group is gone
         """
+        url_path: str = self.project(
+            "{}".format(group_urlname), GROUP_FIELDS, GROUP_OPTIONAL_FIELDS
+        )
+
         try:
-            response: dict = self.get("{}".format(group_urlname))
+            response: dict = self.get(url_path, skip_unchanged=True)
+        except HttpNotModified:
+            # the group is unchanged since the last update
+            try:
+                return GroupPage.objects.get(urlname=group_urlname)
+            except GroupPage.DoesNotExist:
+                response: dict = self.get(url_path)
         except (HttpNotFoundError, HttpNotAccessibleError) as e:
 
             # delete group if exists
@@ -160,25 +781,31 @@ class MeetupApiClient:
             print(e)
             return
 
-        except (HttpNoSuccess, HttpNoXRateLimitHeader) as e:
-            print(e)
-            return
-
         return get_group_from_response(
-            response=response, home_page=self.get_home_page()
+            response=response,
+            home_page=self.get_home_page(),
+            identity_map=self.identity_map,
+            revisions=settings.MEETUP_API_PAGE_REVISIONS,
         )
 
     def update_all_group_events(
-        self, group: GroupPage, max_entries_per_page: int = 200
+        self,
+        group: GroupPage,
+        max_entries_per_page: int = 200,
+        crawl_state: CrawlState = None,
     ) -> [EventPage]:
         """
-        get all past events from meetup rest api & add it as child pages to the group
+        get all past events from meetup rest api & add it as child pages to the group, the first page starts at the
+        day of the last event & every further page is loaded from the Link rel="next" cursor of the page before
 
         Keyword arguments:
         group -- GroupPage
         max_entries_per_page -- how much events get from the meetup rest api per request (default 200, min 10, max 200)
+        crawl_state -- CrawlState of the group, the first page is its event cursor & the cursor of the next page is
+                       saved after every page (default None)
 
-        return -> [EventPage] every new Events wich wasn't in the database
+        return -> [EventPage] every new Events wich wasn't in the database, the TRANSIENT_ERRORS of a page are raised
+                  so the crawl can continue at the cursor of the page
         """
 
         # set max_entries_per_page between 10 to 200
@@ -190,15 +817,72 @@ class MeetupApiClient:
         # return [EventPage], init empty
         events: [EventPage] = []
 
-        # fetch all events
-        while True:
-            group_events: [EventPage] = self.update_group_events(
-                group=group, max_entries=max_entries_per_page
+        if crawl_state and crawl_state.event_cursor:
+            url_path: str = crawl_state.event_cursor
+        else:
+            url_path: str = self.project(
+                get_events_url_path(
+                    group=group,
+                    last_event=group.last_event(),
+                    max_entries=max_entries_per_page,
+                ),
+                EVENT_FIELDS,
+                EVENT_OPTIONAL_FIELDS,
             )
-            events.extend(group_events)
-            if len(group_events) == 0:
+
+        # follow the next cursors, stop if a cursor repeats so a broken Link header can not loop forever
+        requested_urls: set = set()
+        skip_unchanged: bool = True
+        while url_path and url_path not in requested_urls:
+            requested_urls.add(url_path)
+
+            try:
+                response, links = self.get_with_links(
+                    url_path,
+                    skip_unchanged=skip_unchanged,
+                    stream=self.stream_batch_size > 0,
+                )
+            except HttpNotModified:
+                # no new events since the last update
                 break
+            except (HttpNotFoundError, HttpNotAccessibleError) as e:
+                print(e)
+                return events
+
+            # only the first page can be skipped, the next pages depend on it
+            skip_unchanged = False
+
+            # a streamed page is added in batches while it is downloaded
+            batches = iter([response])
+            if self.stream_batch_size > 0:
+                batches = iter_batches(response, self.stream_batch_size)
+            while True:
+                # only the download & decoding of the stream can break off, errors of the ingestion are raised
+                try:
+                    batch: [dict] = next(batches, None)
+                except (requests.RequestException, ValueError) as e:
+                    # the events of the batches before are added
+                    raise HttpNoSuccess(
+                        "The events page broke off: {!r}".format(e)
+                    ) from e
+                if batch is None:
+                    break
+
+                events.extend(
+                    get_events_from_response(
+                        response=batch,
+                        group=group,
+                        revisions=settings.MEETUP_API_PAGE_REVISIONS,
+                        identity_map=self.identity_map,
+                    )
+                )
+
+            url_path = links.get("next", {}).get("url")
+            if crawl_state:
+                crawl_state.set_event_cursor(url_path)
 
+        # the scheduler only counts an update which reached the last page
+        GroupPage.objects.filter(pk=group.pk).update(events_updated=timezone.now())
         return events
 
     def update_group_events(
@@ -221,21 +905,20 @@ class MeetupApiClient:
         events: [EventPage] = []
 
         # when there is a last event -> set on meetup that only events fetch wich are no ealier than this event
+        url_path: str = get_events_url_path(
+            group=group, last_event=last_event, max_entries=max_entries
+        )
 
         try:
-            if last_event:
-                response: dict = self.get(
-                    "{}/events?status=past&no_earlier_than={}&page={}".format(
-                        group.urlname,
-                        last_event.time.strftime("%Y-%m-%d"),
-                        max_entries,
-                    )
-                )
-            else:
-                response: dict = self.get(
-                    "{}/events?status=past&page={}".format(group.urlname, max_entries)
-                )
+            response: dict = self.get(
+                self.project(url_path, EVENT_FIELDS, EVENT_OPTIONAL_FIELDS),
+                skip_unchanged=True,
+            )
+        except HttpNotModified:
+            # no new events since the last update
+            return events
         except (
+            CircuitOpenError,
             HttpNotFoundError,
             HttpNotAccessibleError,
             HttpNoSuccess,
@@ -244,12 +927,10 @@ class MeetupApiClient:
             print(e)
             return events
 
-        # go through every event from response and at them to the database
-        for event_response in response:
-            event: EventPage = get_event_from_response(
-                response=event_response, group=group
-            )
-            if event:
-                events.append(event)
-
-        return events
+        # add every new event from response to the database
+        return get_events_from_response(
+            response=response,
+            group=group,
+            revisions=settings.MEETUP_API_PAGE_REVISIONS,
+            identity_map=self.identity_map,
+        )
@@ -0,0 +1,149 @@
+import fcntl
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class RateLimitBackend:
+    """
+    storage for the rate limit state, every RateLimit using the same storage draws from one budget
+    """
+
+    @contextmanager
+    def state(self) -> dict:
+        """
+        lock the storage & yield the rate limit state, changes on the state are stored on exit
+
+        return -> state dict
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        remove the stored rate limit state
+        """
+        raise NotImplementedError
+
+
+class LocalRateLimitBackend(RateLimitBackend):
+    """
+    keep the rate limit state in memory, shared by every thread of the process
+    """
+
+    def __init__(self, location: str = ""):
+        """
+        Keyword arguments:
+        location -- unused, only for the same signature as the other backends
+        """
+        super().__init__()
+        self.lock: threading.RLock = threading.RLock()
+        self.data: dict = {}
+
+    @contextmanager
+    def state(self) -> dict:
+        with self.lock:
+            yield self.data
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+
+class FileRateLimitBackend(RateLimitBackend):
+    """
+    store the rate limit state in a json file, locked with flock so every process on the host shares it
+    """
+
+    def __init__(self, location: str = ""):
+        """
+        Keyword arguments:
+        location -- path of the json file (default: /tmp/meetup-api-rate-limit.json)
+        """
+        super().__init__()
+        self.path: str = location or "/tmp/meetup-api-rate-limit.json"
+
+        # flock is per file descriptor, so threads of one process need an own lock
+        self.lock: threading.RLock = threading.RLock()
+
+    @contextmanager
+    def state(self) -> dict:
+        with self.lock, open("{}.lock".format(self.path), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                try:
+                    with open(self.path) as state_file:
+                        data: dict = json.load(state_file)
+                except (FileNotFoundError, ValueError):
+                    data: dict = {}
+
+                yield data
+
+                # write & rename, so a crashed process never leaves a broken file
+                with open("{}.tmp".format(self.path), "w") as state_file:
+                    json.dump(data, state_file)
+                os.replace("{}.tmp".format(self.path), self.path)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def clear(self):
+        with self.lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    store the rate limit state in the redis of a django-redis cache, so every host of the cluster shares it
+    """
+
+    def __init__(self, location: str = ""):
+        """
+        Keyword arguments:
+        location -- alias of the django-redis cache in settings.CACHES (default: default)
+        """
+        super().__init__()
+        from django_redis import get_redis_connection
+
+        self.redis = get_redis_connection(location or "default")
+        self.key: str = "meetup-api-rate-limit"
+
+    @contextmanager
+    def state(self) -> dict:
+        with self.redis.lock("{}:lock".format(self.key), timeout=10):
+            stored: bytes = self.redis.get(self.key)
+            data: dict = json.loads(stored) if stored else {}
+
+            yield data
+
+            self.redis.set(self.key, json.dumps(data))
+
+    def clear(self):
+        self.redis.delete(self.key)
+
+
+# backend of the process, created by get_rate_limit_backend
+rate_limit_backend: RateLimitBackend = None
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """
+    get the rate limit backend configured by settings.MEETUP_API_RATE_LIMIT_BACKEND, the same
+    backend is returned for every call so all api clients of the process share one budget
+
+    return -> RateLimitBackend
+    """
+    global rate_limit_backend
+
+    if not rate_limit_backend:
+        backend_class = import_string(settings.MEETUP_API_RATE_LIMIT_BACKEND)
+        rate_limit_backend = backend_class(
+            location=settings.MEETUP_API_RATE_LIMIT_LOCATION
+        )
+
+    return rate_limit_backend
@@ -0,0 +1,180 @@
+import sqlite3
+import threading
+import time
+import zlib
+
+from requests.models import Response
+from requests.utils import parse_header_links
+
+
+class CachedResponse:
+    """
+    response body & validators stored in the ResponseCache
+    """
+
+    def __init__(
+        self, url_path: str, etag: str, last_modified: str, body: bytes, link: str = None
+    ):
+        """
+        Keyword arguments:
+        url_path -- url path of the request
+        etag -- ETag header of the response
+        last_modified -- Last-Modified header of the response
+        body -- uncompressed response body
+        link -- Link header of the response
+        """
+        super().__init__()
+        self.url_path: str = url_path
+        self.etag: str = etag
+        self.last_modified: str = last_modified
+        self.body: bytes = body
+        self.link: str = link
+
+    def conditional_headers(self) -> dict:
+        """
+        return -> request headers to revalidate the response
+        """
+        headers: dict = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def links(self) -> dict:
+        """
+        return -> parsed Link header by rel like requests.Response.links
+        """
+        links: dict = {}
+        if self.link:
+            for link in parse_header_links(self.link):
+                links[link.get("rel") or link.get("url")] = link
+        return links
+
+
+class ResponseCache:
+    """
+    persistent http response cache in a sqlite file, responses are keyed by url_path & stored compressed
+    with their ETag / Last-Modified, so a request can be revalidated with a conditional request
+    """
+
+    def __init__(self, path: str):
+        """
+        Keyword arguments:
+        path -- path of the sqlite file, ":memory:" for a cache which is not stored
+        """
+        super().__init__()
+        self.lock: threading.Lock = threading.Lock()
+        self.connection: sqlite3.Connection = sqlite3.connect(
+            path, check_same_thread=False
+        )
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url_path TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body BLOB NOT NULL,
+                stored REAL NOT NULL,
+                link TEXT
+            )
+            """
+        )
+
+        # caches which were created before the Link header was stored
+        columns: [str] = [
+            row[1] for row in self.connection.execute("PRAGMA table_info(responses)")
+        ]
+        if "link" not in columns:
+            self.connection.execute("ALTER TABLE responses ADD COLUMN link TEXT")
+        self.connection.commit()
+
+        # metrics
+        self.hits: int = 0
+        self.misses: int = 0
+        self.bytes_saved: int = 0
+
+    def get(self, url_path: str) -> CachedResponse:
+        """
+        get the cached response of the url_path
+
+        Keyword arguments:
+        url_path -- url path of the request
+
+        return -> CachedResponse or None when the url_path is not cached
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT etag, last_modified, body, link FROM responses WHERE url_path = ?",
+                (url_path,),
+            ).fetchone()
+
+        if not row:
+            return None
+
+        etag, last_modified, body, link = row
+        return CachedResponse(
+            url_path=url_path,
+            etag=etag,
+            last_modified=last_modified,
+            body=zlib.decompress(body),
+            link=link,
+        )
+
+    def store(self, url_path: str, response: Response):
+        """
+        store a response, when it has an ETag or Last-Modified header
+
+        Keyword arguments:
+        url_path -- url path of the request
+        response -- http response with status 200
+        """
+        etag: str = response.headers.get("ETag")
+        last_modified: str = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    url_path,
+                    etag,
+                    last_modified,
+                    zlib.compress(response.content),
+                    time.time(),
+                    response.headers.get("Link"),
+                ),
+            )
+            self.connection.commit()
+
+    def record_hit(self, cached_response: CachedResponse):
+        """
+        count a response which the server confirmed with 304
+
+        Keyword arguments:
+        cached_response -- revalidated response
+        """
+        self.hits = self.hits + 1
+        self.bytes_saved = self.bytes_saved + len(cached_response.body)
+
+    def record_miss(self):
+        """
+        count a response which had to be downloaded
+        """
+        self.misses = self.misses + 1
+
+    def report(self) -> str:
+        """
+        return -> cache metrics as human readable string
+        """
+        return "{} hits, {} misses, {:.1f} MB saved".format(
+            self.hits, self.misses, self.bytes_saved / 1024 / 1024
+        )
+
+    def close(self):
+        """
+        close the sqlite file
+        """
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,145 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+from requests.models import Response
+
+
+class RetryPolicy:
+    """
+    decide if a failed request is retried & how long to wait before, the wait time grows with decorrelated
+    jitter backoff and a Retry-After header of the server is always respected
+
+    failures are grouped in classes with an own max retries:
+    429 -- Too Many Requests
+    5xx -- server errors
+    4xx -- every other client error except 404 & 410
+    no_rate_limit_header -- 200 response without X-RateLimit header
+    connection -- connection errors & timeouts
+    """
+
+    default_max_retries: dict = {
+        "429": 5,
+        "5xx": 3,
+        "4xx": 1,
+        "no_rate_limit_header": 3,
+        "connection": 3,
+    }
+
+    def __init__(
+        self,
+        max_retries: dict = None,
+        base_delay: float = 1,
+        max_delay: float = 60,
+        budget: int = None,
+    ):
+        """
+        Keyword arguments:
+        max_retries -- max retries per failure class, missing classes use default_max_retries
+        base_delay -- min wait time in seconds (default 1)
+        max_delay -- max wait time in seconds (default 60)
+        budget -- max retries of all requests of a run, None for no limit
+        """
+        super().__init__()
+        self.max_retries: dict = {**self.default_max_retries, **(max_retries or {})}
+        self.base_delay: float = base_delay
+        self.max_delay: float = max(base_delay, max_delay)
+        self.budget: int = budget
+
+        # retries of the run
+        self.retries: int = 0
+
+    @staticmethod
+    def failure_class(status_code: int) -> str:
+        """
+        get the failure class of a http status code
+
+        Keyword arguments:
+        status_code -- http status code
+
+        return -> failure class
+        """
+        if status_code == 429:
+            return "429"
+        if status_code >= 500:
+            return "5xx"
+        return "4xx"
+
+    def should_retry(self, failure: str, retry: int, max_retry: int = None) -> bool:
+        """
+        check if a request should be retried & take the retry from the budget
+
+        Keyword arguments:
+        failure -- failure class
+        retry -- how many times the request was already retried
+        max_retry -- max retries of this request, None to use the max retries of the failure class
+
+        return -> True when the request should be retried
+        """
+        if max_retry is None:
+            max_retry = self.max_retries.get(failure, 0)
+
+        if retry >= max_retry:
+            return False
+
+        if self.budget is not None and self.retries >= self.budget:
+            return False
+
+        self.retries = self.retries + 1
+        return True
+
+    @staticmethod
+    def retry_after(response: Response) -> float:
+        """
+        parse the Retry-After header, as seconds or as http date
+
+        Keyword arguments:
+        response -- http response, can be None
+
+        return -> seconds to wait, None when there is no valid header
+        """
+        if response is None:
+            return None
+
+        value: str = response.headers.get("Retry-After")
+        if not value:
+            return None
+
+        try:
+            return max(0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def next_delay(self, previous_delay: float, response: Response = None) -> float:
+        """
+        get the wait time before the next retry
+
+        Keyword arguments:
+        previous_delay -- wait time before the last retry, 0 on the first retry
+        response -- failed http response, can be None
+
+        return -> wait time in seconds
+        """
+        delay: float = min(
+            self.max_delay,
+            random.uniform(self.base_delay, max(self.base_delay, previous_delay * 3)),
+        )
+
+        retry_after: float = self.retry_after(response)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        return delay
+
+    def report(self) -> str:
+        """
+        return -> used retries as human readable string
+        """
+        if self.budget is None:
+            return "{} retries".format(self.retries)
+        return "{} of {} retries used".format(self.retries, self.budget)
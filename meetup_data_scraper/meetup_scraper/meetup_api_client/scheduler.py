@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta
+from statistics import median
+
+from django.conf import settings
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+from meetup_data_scraper.meetup_scraper.models import EventPage, GroupPage
+
+# how many of the latest events of a group are used for its cadence
+CADENCE_EVENTS: int = 10
+
+# a group which is silent for longer than its cadence is checked at this fraction of the silent time
+DORMANT_FACTOR: float = 0.25
+
+
+def get_event_cadence(event_times: [datetime]) -> timedelta:
+    """
+    get the median gap between events, so a single long break does not change the cadence of a group
+
+    Keyword arguments:
+    event_times -- times of the latest events
+
+    return -> median gap between the events, None for less than 2 events
+    """
+    event_times = sorted(event_times)
+    gaps: [timedelta] = [
+        later - earlier for earlier, later in zip(event_times, event_times[1:])
+    ]
+    if not gaps:
+        return None
+    return median(gaps)
+
+
+def get_update_interval(event_times: [datetime], now: datetime = None) -> timedelta:
+    """
+    get the time between two updates of a group, the interval follows the event cadence & grows while a group has
+    no new events
+
+    Keyword arguments:
+    event_times -- times of the latest events
+    now -- current time (default timezone.now())
+
+    return -> interval between MEETUP_API_SCHEDULE_MIN_INTERVAL & MEETUP_API_SCHEDULE_MAX_INTERVAL days
+    """
+    now = now or timezone.now()
+    interval: timedelta = get_event_cadence(event_times) or timedelta(
+        days=settings.MEETUP_API_SCHEDULE_DEFAULT_INTERVAL
+    )
+    if event_times:
+        interval = max(interval, (now - max(event_times)) * DORMANT_FACTOR)
+
+    return min(
+        max(interval, timedelta(days=settings.MEETUP_API_SCHEDULE_MIN_INTERVAL)),
+        timedelta(days=settings.MEETUP_API_SCHEDULE_MAX_INTERVAL),
+    )
+
+
+def get_latest_event_times(groups: [GroupPage] = None) -> {int: [datetime]}:
+    """
+    get the times of the latest events of the groups with one query, the events are ranked per group by a window
+    function, so only CADENCE_EVENTS rows per group are loaded instead of every event
+
+    Keyword arguments:
+    groups -- groups of the events (default all groups)
+
+    return -> {group pk: [datetime]} up to CADENCE_EVENTS times per group, the latest first
+    """
+    events = EventPage.objects.live().filter(time__isnull=False)
+    if groups is not None:
+        events = events.filter(group__in=groups)
+
+    # django can not filter by a window function, so the ranked events are a subquery of a raw query
+    ranked_events = events.annotate(
+        event_rank=Window(
+            expression=RowNumber(),
+            partition_by=[F("group")],
+            order_by=F("time").desc(),
+        )
+    ).values_list("meetuppage_ptr_id", "group_id", "time", "event_rank")
+    sql, params = ranked_events.order_by().query.sql_with_params()
+    latest_events = EventPage.objects.raw(
+        "SELECT * FROM ({}) ranked_events WHERE event_rank <= %s "
+        "ORDER BY group_id, event_rank".format(sql),
+        (*params, CADENCE_EVENTS),
+    )
+
+    event_times: {int: [datetime]} = {}
+    for event in latest_events:
+        event_times.setdefault(event.group_id, []).append(event.time)
+    return event_times
+
+
+def get_due_groups(groups: [GroupPage] = None, now: datetime = None) -> [GroupPage]:
+    """
+    get the groups which are due for an update, ordered by priority: groups which were never updated first & then by
+    how many intervals a group is overdue
+
+    Keyword arguments:
+    groups -- groups to schedule (default all groups)
+    now -- current time (default timezone.now())
+
+    return -> [GroupPage] due groups
+    """
+    now = now or timezone.now()
+    if groups is None:
+        groups = GroupPage.objects.all()
+    latest_event_times: {int: [datetime]} = get_latest_event_times(groups)
+
+    priorities: [(float, int, GroupPage)] = []
+    for group in groups:
+        if not group.events_updated:
+            priorities.append((float("inf"), group.pk, group))
+            continue
+
+        event_times: [datetime] = latest_event_times.get(group.pk, [])
+        interval: timedelta = get_update_interval(event_times, now=now)
+        if group.events_updated + interval <= now:
+            priorities.append(
+                ((now - group.events_updated) / interval, group.pk, group)
+            )
+
+    return [
+        group
+        for priority, pk, group in sorted(
+            priorities, key=lambda priority: (-priority[0], priority[1])
+        )
+    ]
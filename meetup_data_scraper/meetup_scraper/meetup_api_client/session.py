@@ -0,0 +1,28 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_session(pool_size: int = 10) -> requests.Session:
+    """
+    create a http session with a pool of keep-alive connections
+
+    Keyword arguments:
+    pool_size -- how many connections are kept open per host (default 10)
+
+    return -> requests Session wich reuse connections & accept gzip responses
+    """
+
+    session: requests.Session = requests.Session()
+
+    adapter: HTTPAdapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    # keep connection open & let the server send compressed responses
+    session.headers.update(
+        {"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"}
+    )
+
+    return session
@@ -0,0 +1,28 @@
+# Generated by Django 2.2.8 on 2026-10-18 07:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetup_scraper', '0003_auto_20191218_1630'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='grouppage',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='metacategory',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='venue',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=40, null=True),
+        ),
+    ]
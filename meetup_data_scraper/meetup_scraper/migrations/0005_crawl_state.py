@@ -0,0 +1,28 @@
+# Generated by Django 2.2.8 on 2026-10-18 07:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetup_scraper', '0004_content_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrawlState',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('crawl', models.CharField(max_length=100)),
+                ('urlname', models.CharField(max_length=255)),
+                ('status', models.CharField(choices=[('pending', 'pending'), ('done', 'done'), ('gone', 'gone'), ('failed', 'failed')], default='pending', max_length=10)),
+                ('event_cursor', models.TextField(blank=True, null=True)),
+                ('attempts', models.IntegerField(default=0)),
+                ('updated', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'unique_together': {('crawl', 'urlname')},
+            },
+        ),
+    ]
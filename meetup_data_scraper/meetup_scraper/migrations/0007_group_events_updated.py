@@ -0,0 +1,18 @@
+# Generated by Django 2.2.8 on 2026-10-18 07:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetup_scraper', '0006_crawl_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='grouppage',
+            name='events_updated',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 2.2.8 on 2026-10-18 07:38
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_event_group(apps, schema_editor):
+    # Get models
+    GroupPage = apps.get_model("meetup_scraper.GroupPage")
+    MeetupPage = apps.get_model("meetup_scraper.MeetupPage")
+
+    # Set the group of the events, which are the child pages of a group
+    for group_id, path, depth in GroupPage.objects.values_list("pk", "path", "depth"):
+        MeetupPage.objects.filter(path__startswith=path, depth=depth + 1).update(
+            group_id=group_id
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetup_scraper', '0007_group_events_updated'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meetuppage',
+            name='group',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='meetup_scraper.GroupPage'),
+        ),
+        migrations.AddIndex(
+            model_name='meetuppage',
+            index=models.Index(fields=['group', 'time'], name='meetup_page_group_time_idx'),
+        ),
+        migrations.RunPython(backfill_event_group, migrations.RunPython.noop),
+    ]
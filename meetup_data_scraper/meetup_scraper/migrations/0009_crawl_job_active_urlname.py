@@ -0,0 +1,33 @@
+# Generated by Django 2.2.8 on 2026-10-18 08:19
+
+from django.db import migrations, models
+
+
+def fail_duplicate_jobs(apps, schema_editor):
+    # Get models
+    CrawlJob = apps.get_model("meetup_scraper.CrawlJob")
+
+    # Keep the oldest active job of a group, the duplicates would break the constraint
+    active_jobs = CrawlJob.objects.filter(status__in=["queued", "running"])
+    kept_jobs = set()
+    for pk, crawl, urlname in active_jobs.order_by("id").values_list(
+        "pk", "crawl", "urlname"
+    ):
+        if (crawl, urlname) in kept_jobs:
+            CrawlJob.objects.filter(pk=pk).update(status="failed", error="duplicate")
+        kept_jobs.add((crawl, urlname))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetup_scraper', '0008_event_group'),
+    ]
+
+    operations = [
+        migrations.RunPython(fail_duplicate_jobs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='crawljob',
+            constraint=models.UniqueConstraint(condition=models.Q(status__in=['queued', 'running']), fields=('crawl', 'urlname'), name='crawl_job_active_urlname_uniq'),
+        ),
+    ]
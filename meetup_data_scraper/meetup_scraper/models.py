@@ -28,6 +28,8 @@ class Venue(index.Indexed, models.Model):
     name = models.CharField(max_length=255, blank=True, null=True)
     phone = models.CharField(max_length=255, blank=True, null=True)
     zip_code = models.CharField(max_length=255, blank=True, null=True)
+    # hash of the last parsed meetup api response, to skip unchanged updates
+    content_hash = models.CharField(max_length=40, blank=True, null=True)
 
     # admin interface panels
     panels = [
@@ -119,7 +121,21 @@ class MeetupPage(Page):
     lon = models.DecimalField(max_digits=20, decimal_places=8, blank=True, null=True)
     link = models.URLField()
     time = models.DateTimeField(blank=True, null=True)
+    # group of an event, denormalized from the page tree on the table of time, so the events of a group are one
+    # index range ordered by time
+    group = models.ForeignKey(
+        "GroupPage",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="+",
+        db_index=False,
+    )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["group", "time"], name="meetup_page_group_time_idx")
+        ]
 
     content_panels = Page.content_panels + [
         FieldPanel("name"),
@@ -377,6 +393,16 @@ class EventPage(MeetupPage):
     parent_page_types = ["meetup_scraper.GroupPage"]  # allow parent page types
     subpage_types = []  # no child pages allow
 
+    def save(self, *args, **kwargs):
+        # events which are not created by the json parser get the group of their parent page
+        if not self.group_id and self.path:
+            self.group_id = (
+                GroupPage.objects.filter(path=self.path[: -self.steplen])
+                .values_list("pk", flat=True)
+                .first()
+            )
+        return super().save(*args, **kwargs)
+
 
 @register_snippet
 class EventHost(index.Indexed, models.Model):
@@ -477,6 +503,8 @@ class MetaCategory(index.Indexed, models.Model):
     photo = models.ForeignKey(Photo, on_delete=models.SET_NULL, blank=True, null=True)
     shortname = models.CharField(max_length=255)
     sort_name = models.CharField(max_length=255)
+    # hash of the last parsed meetup api response, to skip unchanged updates
+    content_hash = models.CharField(max_length=40, blank=True, null=True)
 
     # admin interface panels
     panels = [
@@ -600,6 +628,10 @@ class GroupPage(MeetupPage):
     visibility = models.CharField(max_length=255)
     welcome_message = models.TextField(blank=True, null=True)
     who = models.CharField(max_length=255, blank=True, null=True)
+    # hash of the last parsed meetup api response, to skip unchanged updates
+    content_hash = models.CharField(max_length=40, blank=True, null=True)
+    # last time the events were loaded, to schedule the next update
+    events_updated = models.DateTimeField(blank=True, null=True)
 
     # admin interface panels
     content_panels = MeetupPage.content_panels + [
@@ -711,8 +743,8 @@ class GroupPage(MeetupPage):
         return -> [EventPage]
         """
 
-        # Get list of live event pages that are descendants of this page
-        events: [EventPage] = EventPage.objects.live().descendant_of(self)
+        # Get list of live event pages of this group, by the indexed group & time
+        events: [EventPage] = EventPage.objects.live().filter(group=self)
 
         # Order by date
         return events.order_by("-time")
@@ -728,3 +760,99 @@ class GroupPage(MeetupPage):
             return self.events()[:1].get()
         except EventPage.DoesNotExist:
             return None
+
+
+class CrawlState(models.Model):
+    """
+    crawl progress of a group, so an interrupted get_groups or update_groups run can be resumed
+    """
+
+    PENDING = "pending"
+    DONE = "done"
+    GONE = "gone"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "pending"),
+        (DONE, "done"),
+        (GONE, "gone"),
+        (FAILED, "failed"),
+    ]
+
+    # name of the command which crawls the group
+    crawl = models.CharField(max_length=100)
+    urlname = models.CharField(max_length=255)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    # url of the next events page, when the run was interrupted while the events were loaded
+    event_cursor = models.TextField(blank=True, null=True)
+    attempts = models.IntegerField(default=0)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ["crawl", "urlname"]
+
+    def start(self):
+        """
+        count an attempt to crawl the group, the status stays pending until the group is finished
+        """
+        self.attempts = self.attempts + 1
+        self.status = self.PENDING
+        self.save(update_fields=["attempts", "status", "updated"])
+
+    def set_event_cursor(self, event_cursor: str):
+        """
+        Keyword arguments:
+        event_cursor -- url of the next events page, None when there is no next page
+        """
+        self.event_cursor = event_cursor
+        self.save(update_fields=["event_cursor", "updated"])
+
+    def finish(self, status: str):
+        """
+        Keyword arguments:
+        status -- DONE, GONE or FAILED
+        """
+        self.status = status
+        if status != self.FAILED:
+            self.event_cursor = None
+        self.save(update_fields=["status", "event_cursor", "updated"])
+
+
+class CrawlJob(models.Model):
+    """
+    group in the work queue of the crawl_worker command, a running job is leased by one worker until its heartbeat
+    is older than the lease timeout
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (QUEUED, "queued"),
+        (RUNNING, "running"),
+        (DONE, "done"),
+        (FAILED, "failed"),
+    ]
+
+    # name of the command which queued the group, get_groups or update_groups
+    crawl = models.CharField(max_length=100)
+    urlname = models.CharField(max_length=255)
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=QUEUED, db_index=True
+    )
+    attempts = models.IntegerField(default=0)
+    worker = models.CharField(max_length=255, blank=True, null=True)
+    heartbeat = models.DateTimeField(blank=True, null=True)
+    error = models.TextField(blank=True, null=True)
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            # a group is queued or running only once per crawl, duplicates are skipped by enqueue_jobs
+            models.UniqueConstraint(
+                fields=["crawl", "urlname"],
+                condition=models.Q(status__in=["queued", "running"]),
+                name="crawl_job_active_urlname_uniq",
+            )
+        ]
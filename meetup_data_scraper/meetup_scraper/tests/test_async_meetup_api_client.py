@@ -0,0 +1,113 @@
+import asyncio
+import pytest
+import threading
+from meetup_data_scraper.meetup_scraper.meetup_api_client.async_meetup_api_client import (
+    AsyncMeetupApiClient,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
+    RateLimit,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.exceptions import (
+    HttpNoSuccess,
+    HttpNotFoundError,
+    HttpNotAccessibleError,
+)
+from meetup_data_scraper.meetup_scraper.models import EventPage, GroupPage
+from pytest_httpserver import HTTPServer
+from .factories import GroupPageFactory
+
+rate_limit_headers: dict = {
+    "X-RateLimit-Limit": "30",
+    "X-RateLimit-Remaining": "30",
+    "X-RateLimit-Reset": "10",
+}
+
+
+def test_get(httpserver: HTTPServer):
+    for group_id in range(5):
+        httpserver.expect_request("/group-{}".format(group_id)).respond_with_json(
+            {"id": group_id}, headers=rate_limit_headers
+        )
+    httpserver.expect_request("/not-exist").respond_with_data("", status=404)
+    httpserver.expect_request("/gone").respond_with_data("", status=410)
+    httpserver.expect_request("/error").respond_with_data("", status=500)
+
+    rate_limit: RateLimit = RateLimit()
+
+    async def get_all() -> [dict]:
+        async with AsyncMeetupApiClient(
+            concurrency=2, rate_limit=rate_limit
+        ) as api_client:
+            api_client.base_url = httpserver.url_for("/")
+            responses: [dict] = await asyncio.gather(
+                *[api_client.get("group-{}".format(group_id)) for group_id in range(5)]
+            )
+
+            with pytest.raises(HttpNotFoundError):
+                await api_client.get("not-exist")
+            with pytest.raises(HttpNotAccessibleError):
+                await api_client.get("gone")
+            with pytest.raises(HttpNoSuccess):
+                await api_client.get("error", max_retry=1)
+
+            return responses
+
+    responses: [dict] = asyncio.run(get_all())
+
+    # responses are in request order & the shared rate limit got updated
+    assert [response["id"] for response in responses] == list(range(5))
+    assert rate_limit.limit == 30
+
+
+@pytest.mark.django_db(transaction=True)
+def test_update_all_group_events(httpserver: HTTPServer):
+    group: GroupPage = GroupPageFactory()
+    events_path: str = "/{}/events".format(group.urlname)
+    httpserver.expect_oneshot_request(events_path).respond_with_data("", status=404)
+    httpserver.expect_request(events_path).respond_with_json(
+        [
+            {
+                "id": "async-1",
+                "name": "event 1",
+                "time": 1577880000000,
+                "link": "https://localhost/",
+            }
+        ],
+        headers=rate_limit_headers,
+    )
+
+    async def update_all_group_events() -> [EventPage]:
+        async with AsyncMeetupApiClient(
+            rate_limit=RateLimit(), full_payload=True
+        ) as api_client:
+            api_client.base_url = httpserver.url_for("/")
+            return await api_client.update_all_group_events(group=group)
+
+    # only an update which reached the last page is saved for the scheduler
+    assert asyncio.run(update_all_group_events()) == []
+    assert GroupPage.objects.get(pk=group.pk).events_updated is None
+
+    events: [EventPage] = asyncio.run(update_all_group_events())
+    assert [event.meetup_id for event in events] == ["async-1"]
+    assert GroupPage.objects.get(pk=group.pk).events_updated is not None
+
+
+def test_wait_for_next_request():
+    rate_limit: RateLimit = RateLimit()
+    reserve = rate_limit.reserve
+    threads: [threading.Thread] = []
+
+    def record_reserve() -> float:
+        threads.append(threading.current_thread())
+        return reserve()
+
+    rate_limit.reserve = record_reserve
+
+    async def wait_for_next_request():
+        async with AsyncMeetupApiClient(rate_limit=rate_limit) as api_client:
+            await api_client.wait_for_next_request()
+
+    # the shared rate limit can block, so it is not reserved in the thread of the event loop
+    asyncio.run(wait_for_next_request())
+    assert len(threads) == 1
+    assert threads[0] is not threading.main_thread()
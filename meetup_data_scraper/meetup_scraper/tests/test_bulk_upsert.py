@@ -0,0 +1,42 @@
+import pytest
+from meetup_data_scraper.meetup_scraper.meetup_api_client.bulk_upsert import (
+    bulk_upsert,
+)
+from meetup_data_scraper.meetup_scraper.models import Member, Photo, Venue
+
+
+@pytest.mark.parametrize("native", [True, False])
+@pytest.mark.django_db()
+def test_bulk_upsert(native: bool):
+    Venue.objects.create(meetup_id=1, name="old name", city="Berlin")
+
+    venues: dict = bulk_upsert(
+        Venue,
+        [
+            {"meetup_id": 1, "name": "new name"},
+            {"meetup_id": 2, "name": "venue 2"},
+            {"meetup_id": 2, "city": "Hamburg"},
+            {"meetup_id": 3},
+        ],
+        native=native,
+    )
+
+    assert sorted(venues) == [1, 2, 3]
+    assert Venue.objects.count() == 3
+
+    # only the fields of the rows are updated
+    assert Venue.objects.get(meetup_id=1).name == "new name"
+    assert Venue.objects.get(meetup_id=1).city == "Berlin"
+
+    # rows of the same object are merged
+    assert venues[2].name == "venue 2"
+    assert venues[2].city == "Hamburg"
+
+    # foreign keys are saved by the related object
+    photo: Photo = Photo.objects.create(meetup_id=10)
+    members: dict = bulk_upsert(
+        Member, [{"meetup_id": 20, "name": "member", "photo": photo}], native=native
+    )
+    assert members[20].photo == photo
+
+    assert bulk_upsert(Venue, [], native=native) == {}
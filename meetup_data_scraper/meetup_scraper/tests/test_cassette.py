@@ -0,0 +1,99 @@
+import gzip
+import json
+import pytest
+import requests
+import requests_mock
+from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
+    MeetupApiClient,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.cassette import (
+    CassetteRecorder,
+    ReplayAdapter,
+    get_cassette_key,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.exceptions import (
+    HttpNoSuccess,
+)
+
+rate_limit_headers: dict = {
+    "X-RateLimit-Limit": "30",
+    "X-RateLimit-Remaining": "1",
+    "X-RateLimit-Reset": "10",
+}
+
+
+def test_get_cassette_key():
+    assert get_cassette_key("https://api.meetup.com/Meetup-API-Testing") == (
+        "Meetup-API-Testing"
+    )
+    assert get_cassette_key("http://127.0.0.1:8000/find/groups?page=1") == (
+        "find/groups?page=1"
+    )
+
+
+def test_record_and_replay(tmp_path, mock_api_client):
+    path: str = str(tmp_path / "cassette.jsonl.gz")
+
+    # record
+    api_client, adapter = mock_api_client()
+    adapter.register_uri(
+        "GET",
+        "mock://api.meetup.com/Meetup-API-Testing",
+        [
+            {"status_code": 200, "json": {"id": 1}, "headers": rate_limit_headers},
+            {"status_code": 200, "json": {"id": 2}, "headers": rate_limit_headers},
+        ],
+    )
+    api_client.record(path)
+    assert api_client.get("Meetup-API-Testing") == {"id": 1}
+    assert api_client.get("Meetup-API-Testing") == {"id": 2}
+    assert api_client.recorder.responses == 2
+    api_client.close()
+
+    # replay on any host, in the recorded order & the last response is repeated
+    api_client = MeetupApiClient()
+    api_client.replay(path)
+    assert api_client.get("Meetup-API-Testing") == {"id": 1}
+    assert api_client.get("Meetup-API-Testing") == {"id": 2}
+    assert api_client.get("Meetup-API-Testing") == {"id": 2}
+
+    # the replay does not wait for the recorded rate limit
+    assert api_client.rate_limit.throttled_count == 0
+
+    # requests which are not in the cassette fail like connection errors
+    with pytest.raises(HttpNoSuccess):
+        api_client.get("not-recorded", max_retry=0)
+
+
+def test_replay_raw_body(tmp_path):
+    path: str = str(tmp_path / "cassette.jsonl.gz")
+    body: bytes = '{"name": "Café"}'.encode("latin-1")
+
+    # a body which is no valid utf-8 is replayed byte by byte
+    session: requests.Session = requests.Session()
+    with requests_mock.Mocker(session=session) as mocker:
+        mocker.get("mock://api.meetup.com/latin-1", content=body)
+        recorder: CassetteRecorder = CassetteRecorder(path)
+        recorder.record(session.get("mock://api.meetup.com/latin-1"))
+        recorder.close()
+
+    # archives of older versions have a text body
+    with gzip.open(path, "at", encoding="utf-8") as archive:
+        archive.write(
+            json.dumps(
+                {
+                    "key": "utf-8",
+                    "status": 200,
+                    "reason": "OK",
+                    "headers": {},
+                    "body": '{"name": "Café"}',
+                }
+            )
+        )
+
+    session = requests.Session()
+    session.mount("https://", ReplayAdapter(path))
+    assert session.get("https://api.meetup.com/latin-1").content == body
+    assert session.get("https://api.meetup.com/utf-8").content == (
+        '{"name": "Café"}'.encode("utf-8")
+    )
@@ -0,0 +1,79 @@
+import time
+import pytest
+from meetup_data_scraper.meetup_scraper.meetup_api_client.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakers,
+    get_endpoint_family,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.exceptions import (
+    CircuitOpenError,
+    HttpNoSuccess,
+)
+
+
+def test_get_endpoint_family():
+    assert get_endpoint_family("Meetup-API-Testing") == "group"
+    assert get_endpoint_family("Meetup-API-Testing/events?status=past") == "events"
+    assert (
+        get_endpoint_family("https://api.meetup.com/Meetup-API-Testing/events?page=1")
+        == "events"
+    )
+    assert get_endpoint_family("find/groups?page=1") == "find"
+
+
+def test_circuit_breaker():
+    circuit_breaker: CircuitBreaker = CircuitBreaker(
+        name="group", failure_rate=0.5, window=4, open_time=0.1
+    )
+
+    # at least half of the window is needed to open
+    circuit_breaker.before_request()
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == "closed"
+    circuit_breaker.before_request()
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == "open"
+
+    # fail fast while open
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.before_request()
+    assert circuit_breaker.fast_failures == 1
+
+    # one probe after the open time, a failed probe opens the circuit again
+    time.sleep(0.1)
+    circuit_breaker.before_request()
+    assert circuit_breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.before_request()
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == "open"
+    assert circuit_breaker.opened == 2
+
+    # a successful probe closes the circuit
+    time.sleep(0.1)
+    circuit_breaker.before_request()
+    circuit_breaker.record_success()
+    assert circuit_breaker.state == "closed"
+    circuit_breaker.before_request()
+
+
+def test_get_with_circuit_breaker(mock_api_client):
+    api_client, adapter = mock_api_client(
+        circuit_breakers=CircuitBreakers(failure_rate=0.5, window=2, open_time=60)
+    )
+    adapter.register_uri("GET", "mock://api.meetup.com/group", status_code=500)
+
+    with pytest.raises(HttpNoSuccess):
+        api_client.get("group", max_retry=0)
+    assert adapter.call_count == 1
+
+    # the open circuit does not send requests of the endpoint family
+    with pytest.raises(CircuitOpenError):
+        api_client.get("group")
+    assert adapter.call_count == 1
+
+    # an open circuit is not a failed request
+    assert not issubclass(CircuitOpenError, HttpNoSuccess)
+
+    # other endpoint families are not affected
+    assert api_client.circuit_breakers.get_breaker("group/events").state == "closed"
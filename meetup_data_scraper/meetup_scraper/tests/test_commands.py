@@ -0,0 +1,232 @@
+import asyncio
+import json
+import pytest
+import requests_mock
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from meetup_data_scraper.meetup_scraper.management.commands import crawl_worker
+from meetup_data_scraper.meetup_scraper.management.commands.get_groups import (
+    get_groups_async,
+    get_groups_with_workers,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.crawl_queue import (
+    JobHeartbeat,
+    enqueue_jobs,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.exceptions import (
+    HttpNoSuccess,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
+    MeetupApiClient,
+)
+from meetup_data_scraper.meetup_scraper.models import CrawlJob, CrawlState, GroupPage
+from meetup_data_scraper.meetup_scraper.tests.factories import GroupPageFactory
+from pytest_httpserver import HTTPServer
+from wagtail.core.models import PageRevision
+
+
+@pytest.mark.django_db()
+def test_prune_revisions():
+    group_1: GroupPage = GroupPageFactory()
+    group_2: GroupPage = GroupPageFactory()
+    for group in [group_1, group_2, group_1, group_1]:
+        group.save_revision().publish()
+    latest_revision: PageRevision = group_1.get_latest_revision()
+
+    call_command("prune_revisions", keep=1, dry_run=True)
+    assert PageRevision.objects.count() == 4
+
+    call_command("prune_revisions", keep=1, batch_size=1)
+    assert list(PageRevision.objects.filter(page=group_1)) == [latest_revision]
+    assert PageRevision.objects.filter(page=group_2).count() == 1
+
+    call_command("prune_revisions")
+    assert PageRevision.objects.count() == 0
+    assert GroupPage.objects.get(pk=group_1.pk).live is True
+
+
+def test_get_groups_workers_options():
+    with pytest.raises(CommandError):
+        call_command("get_groups", workers=2, concurrency=2)
+    with pytest.raises(CommandError):
+        call_command("get_groups", workers=2, replay="/tmp/cassette.json")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_groups_with_workers():
+    api_client: MeetupApiClient = MeetupApiClient()
+    with requests_mock.Mocker() as mocker:
+        mocker.get(requests_mock.ANY, status_code=404, text="not found")
+
+        # every worker has an own api client, the metrics are added to the api client of the command
+        results: list = get_groups_with_workers(
+            group_urlnames=["not-exist-1", "not-exist-2", "not-exist-3"],
+            workers=2,
+            api_client=api_client,
+        )
+
+    assert results == [(None, []), (None, []), (None, [])]
+    assert mocker.call_count == 3
+    assert api_client.bytes_downloaded == 3 * len("not found")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_groups_async(httpserver: HTTPServer):
+    httpserver.expect_request("/not-exist-1").respond_with_data("not found", status=404)
+    httpserver.expect_request("/not-exist-2").respond_with_data("not found", status=404)
+    api_client: MeetupApiClient = MeetupApiClient()
+    api_client.base_url = httpserver.url_for("/")
+
+    # the downloaded bytes of the async api client are added to the api client of the command
+    results: list = asyncio.run(
+        get_groups_async(
+            group_urlnames=["not-exist-1", "not-exist-2"],
+            concurrency=2,
+            api_client=api_client,
+        )
+    )
+    assert results == [(None, []), (None, [])]
+    assert api_client.bytes_downloaded == 2 * len("not found")
+
+
+@pytest.mark.django_db()
+def test_get_groups_resume(tmp_path):
+    with open(tmp_path / "groups.json", "w") as json_file:
+        json.dump(
+            {"1": {"urlname": "not-exist-1"}, "2": {"urlname": "not-exist-2"}},
+            json_file,
+        )
+
+    with requests_mock.Mocker() as mocker:
+        mocker.get(requests_mock.ANY, status_code=404, text="not found")
+        call_command("get_groups", json_path=str(tmp_path))
+        assert mocker.call_count == 2
+
+        crawl_state: CrawlState = CrawlState.objects.get(
+            crawl="get_groups", urlname="not-exist-1"
+        )
+        assert crawl_state.status == CrawlState.GONE
+        assert crawl_state.attempts == 1
+
+        # finished groups are skipped
+        CrawlState.objects.filter(urlname="not-exist-2").update(
+            status=CrawlState.PENDING
+        )
+        call_command("get_groups", json_path=str(tmp_path), resume=True)
+        assert mocker.call_count == 3
+        assert CrawlState.objects.get(urlname="not-exist-2").attempts == 2
+
+        # without resume every group is loaded again
+        call_command("get_groups", json_path=str(tmp_path))
+        assert mocker.call_count == 5
+        assert CrawlState.objects.get(urlname="not-exist-2").attempts == 1
+
+
+@pytest.mark.django_db()
+def test_get_groups_failed(tmp_path, settings):
+    settings.MEETUP_API_RETRY_BUDGET = 0
+    with open(tmp_path / "groups.json", "w") as json_file:
+        json.dump(
+            {"1": {"urlname": "not-exist-1"}, "2": {"urlname": "unavailable-1"}},
+            json_file,
+        )
+
+    with requests_mock.Mocker() as mocker:
+        mocker.get(requests_mock.ANY, status_code=404, text="not found")
+        mocker.get(
+            requests_mock.ANY,
+            additional_matcher=lambda request: "unavailable-1" in request.url,
+            status_code=503,
+        )
+
+        # only a 404 or 410 is gone, the group of a 503 failed & is loaded again by the next run
+        call_command("get_groups", json_path=str(tmp_path))
+        crawl_states: dict = {
+            crawl_state.urlname: crawl_state.status
+            for crawl_state in CrawlState.objects.all()
+        }
+        assert crawl_states == {
+            "not-exist-1": CrawlState.GONE,
+            "unavailable-1": CrawlState.FAILED,
+        }
+
+        call_command("get_groups", json_path=str(tmp_path), resume=True)
+        assert mocker.call_count == 3
+        assert CrawlState.objects.get(urlname="unavailable-1").attempts == 2
+
+        # the workers return the error of a failed group
+        results: list = get_groups_with_workers(
+            group_urlnames=["not-exist-1", "unavailable-1"],
+            workers=2,
+            api_client=MeetupApiClient(),
+        )
+        assert results[0] == (None, [])
+        assert isinstance(results[1], HttpNoSuccess)
+
+
+@pytest.mark.django_db()
+def test_update_groups_failed(settings):
+    settings.MEETUP_API_RETRY_BUDGET = 0
+    group: GroupPage = GroupPageFactory()
+
+    with requests_mock.Mocker() as mocker:
+        mocker.get(requests_mock.ANY, status_code=503)
+        call_command("update_groups", all=True)
+
+    # the events of the group are updated again by the next run with --resume, the first page failed so there is
+    # no cursor of a next page
+    crawl_state: CrawlState = CrawlState.objects.get(
+        crawl="update_groups", urlname=group.urlname
+    )
+    assert crawl_state.status == CrawlState.FAILED
+    assert crawl_state.event_cursor is None
+
+
+@pytest.mark.django_db()
+def test_crawl_worker(tmp_path):
+    with open(tmp_path / "groups.json", "w") as json_file:
+        json.dump(
+            {"1": {"urlname": "not-exist-1"}, "2": {"urlname": "not-exist-2"}},
+            json_file,
+        )
+
+    with requests_mock.Mocker() as mocker:
+        mocker.get(requests_mock.ANY, status_code=404, text="not found")
+
+        # queued groups are only loaded by the worker
+        call_command("get_groups", json_path=str(tmp_path), enqueue=True)
+        assert mocker.call_count == 0
+        assert CrawlJob.objects.filter(status=CrawlJob.QUEUED).count() == 2
+
+        call_command("crawl_worker", worker="worker-1", max_jobs=1)
+        assert mocker.call_count == 1
+        call_command("crawl_worker", worker="worker-1")
+        assert mocker.call_count == 2
+
+    assert CrawlJob.objects.filter(status=CrawlJob.DONE).count() == 2
+    assert CrawlState.objects.filter(status=CrawlState.GONE).count() == 2
+
+
+class LostJobHeartbeat(JobHeartbeat):
+    """
+    heartbeat of a job, which was queued again for another worker while it was crawled
+    """
+
+    def __enter__(self):
+        self.lost = True
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+@pytest.mark.django_db()
+def test_crawl_worker_lost_lease(monkeypatch):
+    monkeypatch.setattr(crawl_worker, "JobHeartbeat", LostJobHeartbeat)
+    enqueue_jobs("update_groups", ["not-exist"])
+
+    # the worker does not finish a job, which belongs to another worker
+    call_command("crawl_worker", worker="worker-1")
+    job: CrawlJob = CrawlJob.objects.get()
+    assert job.status == CrawlJob.RUNNING
+    assert job.worker == "worker-1"
@@ -0,0 +1,62 @@
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from meetup_data_scraper.meetup_scraper.meetup_api_client.crawl_queue import (
+    claim_job,
+    enqueue_jobs,
+    finish_job,
+    requeue_expired_jobs,
+    send_heartbeat,
+)
+from meetup_data_scraper.meetup_scraper.models import CrawlJob
+
+
+@pytest.mark.django_db()
+def test_crawl_queue():
+    # queued groups are not added twice
+    assert enqueue_jobs("get_groups", ["group-1", "group-2", "group-1"]) == 2
+    assert enqueue_jobs("get_groups", ["group-1", "group-3"]) == 1
+    assert enqueue_jobs("update_groups", ["group-1"]) == 1
+
+    # the oldest job is claimed first
+    job: CrawlJob = claim_job(worker="worker-1")
+    assert job.urlname == "group-1"
+    assert job.status == CrawlJob.RUNNING
+    assert job.attempts == 1
+    assert claim_job(worker="worker-2").urlname == "group-2"
+
+    # an expired lease is queued again & the old worker can not finish it
+    CrawlJob.objects.filter(pk=job.pk).update(
+        heartbeat=timezone.now() - timedelta(seconds=60)
+    )
+    assert requeue_expired_jobs(lease_timeout=30, max_attempts=3) == 1
+    assert send_heartbeat(job) is False
+    assert finish_job(job) is False
+    job = claim_job(worker="worker-3")
+    assert job.urlname == "group-1"
+    assert job.attempts == 2
+    assert send_heartbeat(job) is True
+
+    # failed jobs are queued again until they have no attempts left
+    assert finish_job(job, error="error", max_attempts=3) is True
+    assert CrawlJob.objects.get(pk=job.pk).status == CrawlJob.QUEUED
+    job = claim_job(worker="worker-3")
+    assert finish_job(job, error="error", max_attempts=3) is True
+    assert CrawlJob.objects.get(pk=job.pk).status == CrawlJob.FAILED
+
+    job = claim_job(worker="worker-3")
+    assert job.urlname == "group-3"
+    assert finish_job(job) is True
+    assert CrawlJob.objects.get(pk=job.pk).status == CrawlJob.DONE
+
+    claim_job(worker="worker-3")
+    assert claim_job(worker="worker-3") is None
+
+    # finished groups are queued again, while the running group is skipped
+    assert enqueue_jobs("get_groups", ["group-1", "group-2", "group-3"]) == 2
+    assert (
+        CrawlJob.objects.filter(
+            crawl="get_groups", urlname="group-2", status=CrawlJob.QUEUED
+        ).count()
+        == 0
+    )
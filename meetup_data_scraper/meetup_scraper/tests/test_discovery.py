@@ -0,0 +1,91 @@
+import pytest
+import re
+import requests_mock
+from django.core.management import call_command
+from meetup_data_scraper.meetup_scraper.meetup_api_client.discovery import (
+    GridCell,
+    GroupDiscovery,
+    get_find_groups_url_path,
+    get_grid_cells,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
+    MeetupApiClient,
+)
+from meetup_data_scraper.meetup_scraper.models import CrawlJob
+
+
+def test_get_grid_cells():
+    cells: [GridCell] = get_grid_cells(lat=52.5, lon=13.4, radius=50, size=30)
+    assert len(cells) == 16
+    assert cells[0].size == 25
+    assert cells[0].lat > cells[-1].lat
+    assert cells[0].lon < cells[-1].lon
+
+    # the quarters of a cell have the half size around the center
+    quarters: [GridCell] = cells[0].split()
+    assert [quarter.size for quarter in quarters] == [12.5] * 4
+    assert sum(quarter.lat for quarter in quarters) / 4 == pytest.approx(cells[0].lat)
+    assert sum(quarter.lon for quarter in quarters) / 4 == pytest.approx(cells[0].lon)
+
+    assert GridCell(0, 0, 1000).radius == 100
+    assert get_find_groups_url_path(GridCell(1, 2, 2), category=34, offset=1) == (
+        "find/groups?lat=1.000000&lon=2.000000&radius=1.41&page=200&offset=1"
+        "&only=id,urlname&category=34"
+    )
+
+
+def get_find_groups_response(request, context) -> [dict]:
+    """
+    stub of find/groups, a big cell has 2 full pages & a small cell one group, which is also in other cells
+    """
+    context.headers = {
+        "X-RateLimit-Limit": "30",
+        "X-RateLimit-Remaining": "30",
+        "X-RateLimit-Reset": "10",
+    }
+    if float(request.qs["radius"][0]) > 10:
+        offset: int = int(request.qs["offset"][0])
+        return [
+            {"id": offset * 2 + number, "urlname": "group-{}".format(offset * 2 + number)}
+            for number in range(2)
+        ]
+    return [{"id": 100, "urlname": "small-group"}]
+
+
+@pytest.mark.django_db()
+def test_discover_groups():
+    with requests_mock.Mocker() as mocker:
+        mocker.get(re.compile("find/groups"), json=get_find_groups_response)
+        api_client: MeetupApiClient = MeetupApiClient()
+        discovery: GroupDiscovery = GroupDiscovery(
+            api_client=api_client,
+            cells=[GridCell(52.5, 13.4, 20)],
+            page_size=2,
+            max_pages=2,
+            min_size=5,
+        )
+
+        # the saturated cell is split into 4 cells, which find the same group
+        assert [group["id"] for group in discovery.iter_groups()] == [0, 1, 2, 3, 100]
+        assert discovery.searched_cells == 5
+        assert discovery.split_cells == 1
+        assert discovery.duplicates == 3
+        assert mocker.call_count == 6
+
+        call_command(
+            "discover_groups",
+            lat=52.5,
+            lon=13.4,
+            radius=10,
+            cell_size=20,
+            page_size=2,
+            max_pages=2,
+            min_cell_size=5,
+        )
+    assert sorted(CrawlJob.objects.values_list("urlname", flat=True)) == [
+        "group-0",
+        "group-1",
+        "group-2",
+        "group-3",
+        "small-group",
+    ]
@@ -0,0 +1,31 @@
+import json
+from meetup_data_scraper.meetup_scraper.meetup_api_client.group_files import (
+    get_group_files,
+    iter_group_urlnames,
+)
+
+
+def test_iter_group_urlnames(tmp_path):
+    with open(tmp_path / "a.json", "w") as json_file:
+        json.dump({"0": {"urlname": "group-1"}, "1": {"urlname": "group-2"}}, json_file)
+    with open(tmp_path / "b.ndjson", "w") as ndjson_file:
+        ndjson_file.write('{"urlname": "group-2"}\n\n{"urlname": "group-3"}\n')
+    with open(tmp_path / "c.csv", "w") as csv_file:
+        csv_file.write("name,urlname\nGroup 4,group-4\nGroup 1,group-1\n")
+    with open(tmp_path / "d.txt", "w") as text_file:
+        text_file.write("group-5")
+
+    group_files: [str] = get_group_files(str(tmp_path))
+    assert [file_path.split("/")[-1] for file_path in group_files] == [
+        "a.json",
+        "b.ndjson",
+        "c.csv",
+    ]
+
+    # urlnames of many files are only returned once
+    assert list(iter_group_urlnames(group_files)) == [
+        "group-1",
+        "group-2",
+        "group-3",
+        "group-4",
+    ]
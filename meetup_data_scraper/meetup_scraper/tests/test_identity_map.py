@@ -0,0 +1,70 @@
+import pytest
+from meetup_data_scraper.meetup_scraper.meetup_api_client.identity_map import (
+    IdentityMap,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.json_parser import (
+    get_member_from_response,
+    get_venue_from_response,
+)
+from meetup_data_scraper.meetup_scraper.models import Member, Photo, Venue
+from .meetup_api_demo_response import get_member_response, get_venue_response
+
+
+@pytest.mark.django_db()
+def test_identity_map():
+    identity_map: IdentityMap = IdentityMap(max_size=2)
+
+    photo_1, created = identity_map.get_or_create(Photo, meetup_id=1)
+    assert created is True
+    assert identity_map.get_or_create(Photo, meetup_id="1") == (photo_1, False)
+    assert identity_map.hits == 1
+    assert identity_map.misses == 1
+
+    # the least recently used object is evicted
+    identity_map.get_or_create(Photo, meetup_id=2)
+    identity_map.get_or_create(Photo, meetup_id=1)
+    identity_map.get_or_create(Photo, meetup_id=3)
+    assert (Photo, "1") in identity_map.instances
+    assert (Photo, "2") not in identity_map.instances
+
+    # objects which does not exists are not cached
+    assert identity_map.get(Member, meetup_id=1) is None
+    assert len(identity_map.instances) == 2
+
+    # only changed fields are saved
+    assert identity_map.update(photo_1, {"photo_link": "http://localhost/"}) is True
+    assert identity_map.update(photo_1, {"photo_link": "http://localhost/"}) is False
+    assert Photo.objects.get(meetup_id=1).photo_link == "http://localhost/"
+
+
+@pytest.mark.django_db()
+def test_parser_with_identity_map(django_assert_num_queries):
+    identity_map: IdentityMap = IdentityMap()
+    venue_response: dict = get_venue_response()
+    member_response: dict = get_member_response(content=True)
+
+    venue: Venue = get_venue_from_response(
+        response=venue_response, identity_map=identity_map
+    )
+    member: Member = get_member_from_response(
+        response=member_response, identity_map=identity_map
+    )
+
+    # the same unchanged objects again need no query
+    with django_assert_num_queries(0):
+        assert (
+            get_venue_from_response(response=venue_response, identity_map=identity_map)
+            is venue
+        )
+        assert (
+            get_member_from_response(
+                response=member_response, identity_map=identity_map
+            )
+            is member
+        )
+
+    # a changed field is written
+    venue_response["name"] = "new name"
+    get_venue_from_response(response=venue_response, identity_map=identity_map)
+    assert Venue.objects.get(meetup_id=venue_response["id"]).name == "new name"
+    assert identity_map.saved_queries > 0
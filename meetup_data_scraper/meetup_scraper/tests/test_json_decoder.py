@@ -0,0 +1,20 @@
+import pytest
+from meetup_data_scraper.meetup_scraper.meetup_api_client.json_decoder import (
+    JSON_DECODERS,
+    get_json_decoder,
+    stdlib_loads,
+)
+
+
+def test_get_json_decoder():
+    body: bytes = '[{"id": 1, "name": "Caf\\u00e9 ä"}]'.encode("utf-8")
+
+    assert get_json_decoder("json") is stdlib_loads
+    for name in JSON_DECODERS:
+        assert get_json_decoder(name)(body) == [{"id": 1, "name": "Café ä"}]
+
+    # orjson is preferred when it is installed
+    assert get_json_decoder() is JSON_DECODERS.get("orjson", stdlib_loads)
+
+    with pytest.raises(ValueError):
+        get_json_decoder("simplejson")
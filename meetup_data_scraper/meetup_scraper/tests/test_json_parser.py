@@ -1,6 +1,8 @@
 import pytest
 from meetup_data_scraper.meetup_scraper.meetup_api_client.json_parser import (
+    add_group_page,
     get_event_from_response,
+    get_events_from_response,
     get_group_from_response,
     get_photo_from_response,
     get_member_from_response,
@@ -10,6 +12,9 @@ from meetup_data_scraper.meetup_scraper.meetup_api_client.json_parser import (
     get_meta_category_from_response,
     get_venue_from_response,
 )
+from meetup_data_scraper.meetup_scraper.meetup_api_client.identity_map import (
+    IdentityMap,
+)
 from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
     MeetupApiClient,
 )
@@ -17,6 +22,7 @@ from meetup_data_scraper.meetup_scraper.models import (
     Category,
     EventPage,
     GroupPage,
+    HomePage,
     Member,
     MetaCategory,
     Photo,
@@ -25,7 +31,9 @@ from meetup_data_scraper.meetup_scraper.models import (
     EventHost,
 )
 from .meetup_api_demo_response import get_group_response, get_photo_response
+from django.forms.models import model_to_dict
 from django.utils import timezone
+from wagtail.core.models import Page
 import pytz
 from datetime import datetime, timedelta
 from meetup_data_scraper.meetup_scraper.tests.meetup_api_demo_response import (
@@ -137,6 +145,103 @@ def test_get_event_from_response():
     assert get_event_from_response(response=event_without_id, group=group) is None
 
 
+@pytest.mark.django_db()
+def test_get_events_from_response():
+    timezone.activate(pytz.timezone("UTC"))
+
+    group: GroupPage = GroupPageFactory()
+    events_response: [dict] = [
+        get_event_response(meetup_id="1", content=False),
+        get_event_response(meetup_id="2", content=True),
+        get_event_response(meetup_id="2", content=True),
+    ]
+
+    # fields which depend on the insert time & the page ids
+    exclude_fields: [str] = [
+        "id",
+        "page_ptr",
+        "meetuppage_ptr",
+        "event_page",
+        "first_published_at",
+        "last_published_at",
+        "latest_revision_created_at",
+        "live_revision",
+    ]
+
+    def get_events_data(events: [EventPage]) -> [dict]:
+        events_data: [dict] = []
+        for event in events:
+            event = EventPage.objects.get(pk=event.pk)
+            event_data: dict = model_to_dict(event, exclude=exclude_fields)
+            event_data["event_hosts"] = [
+                model_to_dict(event_host, exclude=exclude_fields)
+                for event_host in event.event_hosts.all()
+            ]
+            events_data.append(event_data)
+        return events_data
+
+    # the per event path
+    events: [EventPage] = []
+    for event_response in events_response:
+        event: EventPage = get_event_from_response(response=event_response, group=group)
+        if event:
+            events.append(event)
+    per_event_data: [dict] = get_events_data(events)
+    for event in events:
+        event.delete()
+
+    # the batch path has the same result, every event is only added once
+    group = GroupPage.objects.get(pk=group.pk)
+    events = get_events_from_response(response=events_response, group=group)
+    assert len(events) == 2
+    assert get_events_data(events) == per_event_data
+    assert group.numchild == 2
+    assert GroupPage.objects.get(pk=group.pk).get_children().count() == 2
+    evil_chars, bad_steplen, orphans, wrong_depth, wrong_numchild = (
+        Page.find_problems()
+    )
+    assert orphans == [] and wrong_depth == []
+    assert group.pk not in wrong_numchild
+
+    # existing events are skipped & new events are added after the last child
+    events = get_events_from_response(
+        response=events_response + [get_event_response(meetup_id="5")],
+        group=group,
+        revisions=True,
+    )
+    assert [event.meetup_id for event in events] == ["5"]
+    assert EventPage.objects.get(pk=events[0].pk).live_revision is not None
+    assert events[0].get_prev_sibling().specific.meetup_id == "2"
+
+
+@pytest.mark.django_db()
+def test_get_events_from_response_upsert():
+    group: GroupPage = GroupPageFactory()
+    event_host_response: dict = get_event_host_response(content=True)
+    event_host_response["photo"] = get_photo_response(meetup_id=2, content=True)
+    Member.objects.create(meetup_id=event_host_response["id"], name="existing")
+
+    events_response: [dict] = []
+    for meetup_id in ["1", "2"]:
+        event_response: dict = get_event_response(meetup_id=meetup_id, content=True)
+        event_response["event_hosts"] = [event_host_response]
+        events_response.append(event_response)
+
+    # the venues, members & photos are upserted before the events are parsed, so the parser finds them in the cache
+    identity_map: IdentityMap = IdentityMap()
+    events: [EventPage] = get_events_from_response(
+        response=events_response, group=group, identity_map=identity_map
+    )
+    assert len(events) == 2
+    assert identity_map.misses == 0
+
+    # the existing member is kept & the photo is written with its fields
+    event_host: EventHost = EventPage.objects.get(pk=events[0].pk).event_hosts.get()
+    assert event_host.member.name == "existing"
+    assert event_host.photo.photo_link == event_host_response["photo"]["photo_link"]
+    assert Photo.objects.count() == 1
+
+
 @pytest.mark.django_db()
 def test_get_group_from_response():
     api_client: MeetupApiClient = MeetupApiClient()
@@ -168,6 +273,8 @@ def test_get_group_from_response():
 
     # assert group_1
     assert isinstance(group_1, GroupPage)
+    assert group_1.live is True
+    assert group_1.revisions.count() == 0
     assert group_1.title == group_1_response["name"]
     assert group_1.slug == str(group_1_response["id"])
     assert group_1.meetup_id == group_1_response["id"]
@@ -265,6 +372,90 @@ def test_get_group_from_response():
     assert group_3.nomination_acceptable is False
 
 
+@pytest.mark.django_db()
+def test_get_group_from_response_unchanged(django_assert_num_queries):
+    api_client: MeetupApiClient = MeetupApiClient()
+    home_page: HomePage = api_client.get_home_page()
+    group_response: dict = get_group_response(
+        meetup_id=54657, urlname="group_unchanged", content=True
+    )
+
+    group: GroupPage = get_group_from_response(
+        response=group_response, home_page=home_page, revisions=True
+    )
+    assert group.content_hash is not None
+    assert group.revisions.count() == 1
+
+    # an unchanged response only loads the group
+    with django_assert_num_queries(1):
+        get_group_from_response(
+            response=group_response, home_page=home_page, revisions=True
+        )
+    assert group.revisions.count() == 1
+
+    # a changed response is saved with a new revision
+    group_response["members"] = group_response["members"] + 1
+    group = get_group_from_response(
+        response=group_response, home_page=home_page, revisions=True
+    )
+    assert group.revisions.count() == 2
+    assert GroupPage.objects.get(pk=group.pk).members == group_response["members"]
+    assert [topic.meetup_id for topic in group.topics.all()] == [
+        topic["id"] for topic in group_response["topics"]
+    ]
+
+    # unchanged meta categories & venues are not saved again
+    meta_category: MetaCategory = MetaCategory.objects.get(
+        meetup_id=group_response["meta_category"]["id"]
+    )
+    assert meta_category.content_hash is not None
+    with django_assert_num_queries(1):
+        get_meta_category_from_response(response=group_response["meta_category"])
+
+    venue_response: dict = get_venue_response(meetup_id=125, content=True)
+    get_venue_from_response(response=venue_response)
+    with django_assert_num_queries(1):
+        get_venue_from_response(response=venue_response)
+
+
+def get_unsaved_group(slug: str, urlname: str = None) -> GroupPage:
+    """
+    create an unsaved group page with the required fields
+    """
+    return GroupPage(
+        title=slug,
+        slug=slug,
+        urlname=urlname or slug,
+        meetup_id=54658,
+        name=slug,
+        link="https://localhost/",
+        members=0,
+        status="active",
+        timezone="UTC",
+        visibility="public",
+    )
+
+
+@pytest.mark.django_db()
+def test_add_group_page():
+    home_page: HomePage = MeetupApiClient().get_home_page()
+    group: GroupPage = add_group_page(
+        home_page=home_page,
+        group=get_unsaved_group("group_add"),
+    )
+    assert group.get_parent().pk == home_page.pk
+
+    # a group which another crawler added meanwhile is not added twice
+    assert (
+        add_group_page(
+            home_page=home_page,
+            group=get_unsaved_group("group_add_2", urlname="group_add"),
+        ).pk
+        == group.pk
+    )
+    assert GroupPage.objects.filter(urlname="group_add").count() == 1
+
+
 @pytest.mark.django_db()
 def test_get_photo_from_response():
     # set photo response
@@ -0,0 +1,114 @@
+import json
+import pytest
+from meetup_data_scraper.meetup_scraper.meetup_api_client.json_stream import (
+    iter_batches,
+    iter_json_array,
+    iter_json_object,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client import meetup_api_client
+from meetup_data_scraper.meetup_scraper.meetup_api_client.exceptions import (
+    HttpNoSuccess,
+)
+from meetup_data_scraper.meetup_scraper.models import EventPage, GroupPage
+from meetup_data_scraper.meetup_scraper.tests.factories import GroupPageFactory
+
+
+def test_iter_json_array():
+    items: list = [{"id": 1, "name": "Café [ä]"}, {"id": 2, "nested": [1, {}]}, 123]
+    body: bytes = json.dumps(items, ensure_ascii=False, indent=2).encode("utf-8")
+
+    # every chunk size, also chunks which split utf-8 characters & numbers
+    for chunk_size in [1, 2, 3, 7, len(body)]:
+        chunks: [bytes] = [
+            body[start : start + chunk_size]
+            for start in range(0, len(body), chunk_size)
+        ]
+        assert list(iter_json_array(chunks)) == items
+
+    assert list(iter_json_array([b" [ ] "])) == []
+
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"id": 1}']))
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"id": 1}, {"id"']))
+
+
+def test_iter_json_object():
+    members: dict = {"0": {"urlname": "Café-{1}"}, "1": {"urlname": "b"}, "2": 123}
+    body: bytes = json.dumps(members, ensure_ascii=False, indent=4).encode("utf-8")
+
+    for chunk_size in [1, 2, 3, 7, len(body)]:
+        chunks: [bytes] = [
+            body[start : start + chunk_size]
+            for start in range(0, len(body), chunk_size)
+        ]
+        assert list(iter_json_object(chunks)) == list(members.items())
+
+    assert list(iter_json_object([b" { } "])) == []
+
+    with pytest.raises(ValueError):
+        list(iter_json_object([b"[1]"]))
+    with pytest.raises(ValueError):
+        list(iter_json_object([b'{"0": {"urlname"']))
+
+
+def test_iter_batches():
+    assert list(iter_batches(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(iter_batches([], 2)) == []
+
+
+@pytest.mark.django_db()
+def test_update_all_group_events_streamed(mock_api_client, monkeypatch):
+    api_client, adapter = mock_api_client(full_payload=True)
+    api_client.stream_batch_size = 2
+    group: GroupPage = GroupPageFactory()
+
+    events_response: [dict] = [
+        {
+            "id": "stream-{}".format(event_id),
+            "name": "event {}".format(event_id),
+            "time": 1577880000000 + event_id,
+            "link": "https://localhost/",
+        }
+        for event_id in range(5)
+    ]
+    adapter.register_uri(
+        "GET",
+        "mock://api.meetup.com/{}/events?status=past&page=10".format(group.urlname),
+        json=events_response,
+        headers={
+            "X-RateLimit-Limit": "30",
+            "X-RateLimit-Remaining": "30",
+            "X-RateLimit-Reset": "10",
+        },
+    )
+
+    events: [EventPage] = api_client.update_all_group_events(
+        group=group, max_entries_per_page=10
+    )
+    assert [event.meetup_id for event in events] == [
+        event["id"] for event in events_response
+    ]
+    assert api_client.bytes_downloaded == len(json.dumps(events_response))
+
+    # a broken off stream can be retried, an error of the ingestion is raised as it is
+    group.last_event().delete()
+    adapter.register_uri(
+        "GET",
+        "mock://api.meetup.com/{}/events".format(group.urlname),
+        text=json.dumps(events_response)[:-20],
+        headers={
+            "X-RateLimit-Limit": "30",
+            "X-RateLimit-Remaining": "30",
+            "X-RateLimit-Reset": "10",
+        },
+    )
+    with pytest.raises(HttpNoSuccess):
+        api_client.update_all_group_events(group=group, max_entries_per_page=10)
+
+    def parse_error(*args, **kwargs):
+        raise ValueError("parser error")
+
+    monkeypatch.setattr(meetup_api_client, "get_events_from_response", parse_error)
+    with pytest.raises(ValueError, match="parser error"):
+        api_client.update_all_group_events(group=group, max_entries_per_page=10)
@@ -0,0 +1,51 @@
+import pytest
+from datetime import timedelta
+from decimal import Decimal
+from meetup_data_scraper.meetup_scraper.meetup_api_client.mappers import (
+    FieldMapping,
+    compile_mapper,
+    is_set,
+    to_decimal,
+    to_timedelta,
+)
+
+
+def test_compile_mapper():
+    map_test = compile_mapper(
+        "map_test",
+        [
+            FieldMapping("meetup_id", "id", converter=str, required=True),
+            FieldMapping("name"),
+            FieldMapping("lat", converter=to_decimal),
+            FieldMapping("duration", converter=to_timedelta),
+            FieldMapping("fee_amount", "fee.amount"),
+            FieldMapping("fee_default", "fee.currency.default", default=False),
+            FieldMapping("featured", converter=is_set, default=False),
+        ],
+    )
+    assert map_test.__name__ == "map_test"
+
+    # only keys of the response are mapped
+    assert map_test({"id": 1}) == {"meetup_id": "1", "featured": False}
+    assert map_test(
+        {
+            "id": 2,
+            "name": "name",
+            "lat": 52.52,
+            "duration": 7200000,
+            "fee": {"amount": 5.0, "currency": {}},
+            "featured": False,
+        }
+    ) == {
+        "meetup_id": "2",
+        "name": "name",
+        "lat": Decimal("52.52000000"),
+        "duration": timedelta(hours=2),
+        "fee_amount": 5.0,
+        "fee_default": False,
+        "featured": True,
+    }
+
+    # required keys raise a KeyError
+    with pytest.raises(KeyError):
+        map_test({"name": "name"})
@@ -2,6 +2,12 @@ import pytest
 from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
     RateLimit,
     MeetupApiClient,
+    add_projection,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.retry import RetryPolicy
+from meetup_data_scraper.meetup_scraper.meetup_api_client.json_parser import (
+    GROUP_FIELDS,
+    GROUP_OPTIONAL_FIELDS,
 )
 from meetup_data_scraper.meetup_scraper.meetup_api_client.exceptions import (
     HttpNoSuccess,
@@ -9,7 +15,12 @@ from meetup_data_scraper.meetup_scraper.meetup_api_client.exceptions import (
     HttpNotAccessibleError,
     HttpNoXRateLimitHeader,
 )
-from meetup_data_scraper.meetup_scraper.models import HomePage, GroupPage, EventPage
+from meetup_data_scraper.meetup_scraper.models import (
+    CrawlState,
+    HomePage,
+    GroupPage,
+    EventPage,
+)
 import time
 import requests
 import requests_mock
@@ -64,6 +75,62 @@ def test_update_rate_limit():
     assert rate_limit.reset_time <= time.time() + default_header_value
 
 
+def get_rate_limit_response(limit: int, remaining: int, reset: int):
+    """
+    create a fake http response with X-RateLimit headers
+    """
+    session = requests.Session()
+    adapter = requests_mock.Adapter()
+    session.mount("mock", adapter)
+    adapter.register_uri(
+        "GET",
+        "mock://test.com",
+        text="data",
+        headers={
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(reset),
+        },
+    )
+    return session.get("mock://test.com")
+
+
+def test_rate_limit_token_bucket():
+    # 10 requests in 2 seconds -> one request every 0.2 seconds
+    rate_limit: RateLimit = RateLimit()
+    rate_limit.update_rate_limit(
+        response=get_rate_limit_response(limit=10, remaining=10, reset=2),
+        reset_time=2,
+    )
+    assert rate_limit.fill_rate == 5
+
+    timestamp: float = time.time()
+    for _ in range(4):
+        rate_limit.wait_for_next_request()
+    elapsed: float = time.time() - timestamp
+
+    # first request is send at once, the others are spread over the window
+    assert 0.55 <= elapsed < 1.2
+    assert rate_limit.throttled_count == 3
+    assert rate_limit.requests == 4
+    assert rate_limit.remaining == 6
+
+    # without remaining requests wake up exactly on the reset
+    rate_limit.update_rate_limit(
+        response=get_rate_limit_response(limit=10, remaining=0, reset=1),
+        reset_time=2,
+    )
+    timestamp = time.time()
+    rate_limit.wait_for_next_request()
+    assert 0.9 <= time.time() - timestamp < 1.5
+
+    stats: dict = rate_limit.stats()
+    assert stats["requests"] == 5
+    assert stats["throttled_time"] >= 1.5
+    assert stats["quota_per_second"] == 5
+    assert "5 requests" in rate_limit.report()
+
+
 @pytest.mark.django_db()
 def test_get_home_page():
     api_client: MeetupApiClient = MeetupApiClient()
@@ -135,16 +202,16 @@ def test_get_group(httpserver: HTTPServer):
         "/{}".format(sandbox_group.urlname)
     ).respond_with_data("OK")
     api_client.base_url = httpserver.url_for("/")
-    none_group = api_client.get_group(sandbox_group.urlname)
-    assert none_group is None
+    with pytest.raises(HttpNoXRateLimitHeader):
+        api_client.get_group(sandbox_group.urlname)
     sandbox_group_datbase = GroupPage.objects.filter(urlname=sandbox_group.urlname)
     assert sandbox_group_datbase.exists() is True
 
     # test for HttpNoSuccess execption
     httpserver.expect_oneshot_request("/HttpNoSuccess").respond_with_data("OK")
     api_client.base_url = httpserver.url_for("/HttpNoSuccess")
-    none_group = api_client.get_group(sandbox_group.urlname)
-    assert none_group is None
+    with pytest.raises(HttpNoSuccess):
+        api_client.get_group(sandbox_group.urlname)
     sandbox_group_datbase = GroupPage.objects.filter(urlname=sandbox_group.urlname)
     assert sandbox_group_datbase.exists() is True
 
@@ -247,3 +314,150 @@ def test_update_group_events(httpserver: HTTPServer):
         group=sandbox_group, max_entries=1
     )
     assert len(event_5) == 0
+
+
+def test_get_with_pooled_session(mock_api_client):
+    # mock the meetup api on the session of the client
+    api_client, adapter = mock_api_client()
+    assert isinstance(api_client.session, requests.Session)
+    adapter.register_uri(
+        "GET",
+        "mock://api.meetup.com/Meetup-API-Testing",
+        json={"id": meetup_groups["sandbox"]["meetup_id"]},
+        headers={
+            "X-RateLimit-Limit": "30",
+            "X-RateLimit-Remaining": "30",
+            "X-RateLimit-Reset": "10",
+        },
+    )
+
+    # every request has to use the same session with timeouts
+    for _ in range(2):
+        json: dict = api_client.get(meetup_groups["sandbox"]["urlname"])
+        assert json["id"] == meetup_groups["sandbox"]["meetup_id"]
+    assert adapter.call_count == 2
+    assert adapter.last_request.timeout == api_client.timeout
+
+    # a shared session is not replaced
+    session: requests.Session = requests.Session()
+    assert MeetupApiClient(session=session).session is session
+
+
+@pytest.mark.django_db()
+def test_get_group_with_projection(mock_api_client):
+    api_client, adapter = mock_api_client(full_payload=False)
+    adapter.register_uri(
+        "GET",
+        "mock://api.meetup.com/Meetup-API-Testing",
+        status_code=404,
+        text="not found",
+    )
+
+    # only the parsed fields are requested
+    assert api_client.get_group("Meetup-API-Testing") is None
+    query: dict = adapter.last_request.qs
+    assert query["only"][0].split(",") == GROUP_FIELDS
+    assert query["fields"][0].split(",") == GROUP_OPTIONAL_FIELDS
+    assert api_client.bytes_downloaded == len("not found")
+
+    # the full payload has no projection
+    api_client.full_payload = True
+    api_client.get_group("Meetup-API-Testing")
+    assert adapter.last_request.qs == {}
+
+    assert add_projection("group/events?page=1", ["id"], []) == (
+        "group/events?page=1&only=id"
+    )
+
+
+@pytest.mark.django_db()
+def test_update_all_group_events_with_link_pagination(mock_api_client):
+    api_client, adapter = mock_api_client(full_payload=True)
+    group: GroupPage = GroupPageFactory()
+    rate_limit_headers: dict = {
+        "X-RateLimit-Limit": "30",
+        "X-RateLimit-Remaining": "30",
+        "X-RateLimit-Reset": "10",
+    }
+
+    def get_event(event_id: int) -> dict:
+        return {
+            "id": "pagination-{}".format(event_id),
+            "name": "event {}".format(event_id),
+            "time": 1577880000000 + event_id,
+            "link": "https://localhost/",
+        }
+
+    next_url: str = "mock://api.meetup.com/{}/events?scroll=cursor-2".format(
+        group.urlname
+    )
+    adapter.register_uri(
+        "GET",
+        "mock://api.meetup.com/{}/events?status=past&page=10".format(group.urlname),
+        json=[get_event(1), get_event(2)],
+        headers={**rate_limit_headers, "Link": '<{}>; rel="next"'.format(next_url)},
+    )
+    adapter.register_uri(
+        "GET",
+        next_url,
+        json=[get_event(3)],
+        headers=rate_limit_headers,
+    )
+
+    # every page is requested once & the last page has no next link
+    events: [EventPage] = api_client.update_all_group_events(
+        group=group, max_entries_per_page=10
+    )
+    assert [event.meetup_id for event in events] == [
+        "pagination-1",
+        "pagination-2",
+        "pagination-3",
+    ]
+    assert adapter.call_count == 2
+    assert adapter.last_request.url == next_url
+
+    # the update reached the last page
+    assert GroupPage.objects.get(pk=group.pk).events_updated is not None
+
+
+@pytest.mark.django_db()
+def test_update_all_group_events_with_crawl_state(mock_api_client):
+    api_client, adapter = mock_api_client(full_payload=True)
+    group: GroupPage = GroupPageFactory()
+    crawl_state: CrawlState = CrawlState.objects.create(
+        crawl="update_groups",
+        urlname=group.urlname,
+        event_cursor="mock://api.meetup.com/{}/events?scroll=cursor-2".format(
+            group.urlname
+        ),
+    )
+    next_url: str = "mock://api.meetup.com/{}/events?scroll=cursor-3".format(
+        group.urlname
+    )
+    adapter.register_uri(
+        "GET",
+        crawl_state.event_cursor,
+        json=[],
+        headers={
+            "X-RateLimit-Limit": "30",
+            "X-RateLimit-Remaining": "30",
+            "X-RateLimit-Reset": "10",
+            "Link": '<{}>; rel="next"'.format(next_url),
+        },
+    )
+    adapter.register_uri("GET", next_url, status_code=404, text="not found")
+
+    # the crawl starts at the event cursor & the cursor of the failed page is kept
+    api_client.update_all_group_events(group=group, crawl_state=crawl_state)
+    assert adapter.request_history[0].url == (
+        "mock://api.meetup.com/{}/events?scroll=cursor-2".format(group.urlname)
+    )
+    assert CrawlState.objects.get(pk=crawl_state.pk).event_cursor == next_url
+    assert GroupPage.objects.get(pk=group.pk).events_updated is None
+
+    # a failed page is raised & its cursor is kept for the next attempt
+    api_client.retry_policy = RetryPolicy(budget=0)
+    adapter.register_uri("GET", next_url, status_code=503)
+    with pytest.raises(HttpNoSuccess):
+        api_client.update_all_group_events(group=group, crawl_state=crawl_state)
+    assert CrawlState.objects.get(pk=crawl_state.pk).event_cursor == next_url
@@ -12,12 +12,15 @@ from meetup_data_scraper.meetup_scraper.models import (
     EventPage,
     SimplePage,
     HomePage,
+    MeetupPage,
     Venue,
 )
 from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
     MeetupApiClient,
 )
 import datetime
+from django.apps import apps
+from importlib import import_module
 from meetup_data_scraper.meetup_scraper.tests.meetup_api_demo_response import (
     get_venue_response,
 )
@@ -157,6 +160,23 @@ def test_group_page_events():
     assert len(sandbox_group.events()) == 3
 
 
+@pytest.mark.django_db()
+def test_event_page_group_backfill():
+    sandbox_group: GroupPage = GroupPageFactory()
+    event: EventPage = EventPage1Factory()
+
+    # events get the group of their parent page
+    assert event.group_id == sandbox_group.pk
+
+    # the migration sets the group of events without group
+    MeetupPage.objects.filter(pk=event.pk).update(group=None)
+    assert sandbox_group.last_event() is None
+    import_module(
+        "meetup_data_scraper.meetup_scraper.migrations.0008_event_group"
+    ).backfill_event_group(apps, None)
+    assert sandbox_group.last_event() == event
+
+
 @pytest.mark.django_db()
 def test_home_page_child_pages():
     # get home page
@@ -0,0 +1,60 @@
+from meetup_data_scraper.meetup_scraper.meetup_api_client.meetup_api_client import (
+    MeetupApiClient,
+    RateLimit,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.rate_limit_backends import (
+    FileRateLimitBackend,
+    LocalRateLimitBackend,
+    get_rate_limit_backend,
+)
+from .test_meetup_api_client import get_rate_limit_response
+
+
+def test_local_rate_limit_backend():
+    backend: LocalRateLimitBackend = LocalRateLimitBackend()
+    rate_limit_1: RateLimit = RateLimit(backend=backend)
+    rate_limit_2: RateLimit = RateLimit(backend=backend)
+
+    rate_limit_1.update_rate_limit(
+        response=get_rate_limit_response(limit=30, remaining=20, reset=10),
+        reset_time=2,
+    )
+    assert rate_limit_2.limit == 30
+    assert rate_limit_2.remaining == 20
+
+    # a request of one rate limit is taken from the budget of both
+    rate_limit_2.wait_for_next_request()
+    assert rate_limit_1.remaining == 19
+    assert rate_limit_1.requests == 0
+    assert rate_limit_2.requests == 1
+
+    backend.clear()
+    assert RateLimit(backend=backend).reset_time is None
+
+
+def test_file_rate_limit_backend(tmp_path):
+    path: str = str(tmp_path / "rate-limit.json")
+
+    # every backend instance works like a process with its own file handle
+    rate_limit_1: RateLimit = RateLimit(backend=FileRateLimitBackend(location=path))
+    rate_limit_2: RateLimit = RateLimit(backend=FileRateLimitBackend(location=path))
+
+    rate_limit_1.update_rate_limit(
+        response=get_rate_limit_response(limit=30, remaining=20, reset=10),
+        reset_time=2,
+    )
+    rate_limit_2.wait_for_next_request()
+
+    with rate_limit_1.shared_state():
+        assert rate_limit_1.limit == 30
+        assert rate_limit_1.remaining == 19
+
+    FileRateLimitBackend(location=path).clear()
+    with rate_limit_1.shared_state():
+        assert rate_limit_1.reset_time is None
+
+
+def test_get_rate_limit_backend():
+    # every api client of the process share the same budget
+    assert get_rate_limit_backend() is get_rate_limit_backend()
+    assert MeetupApiClient().rate_limit.backend is MeetupApiClient().rate_limit.backend
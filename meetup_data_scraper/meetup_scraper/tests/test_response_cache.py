@@ -0,0 +1,86 @@
+import pytest
+from meetup_data_scraper.meetup_scraper.meetup_api_client.response_cache import (
+    CachedResponse,
+    ResponseCache,
+)
+from meetup_data_scraper.meetup_scraper.meetup_api_client.exceptions import (
+    HttpNotModified,
+)
+from .test_retry import get_response
+
+rate_limit_headers: dict = {
+    "X-RateLimit-Limit": "30",
+    "X-RateLimit-Remaining": "30",
+    "X-RateLimit-Reset": "10",
+}
+
+
+def test_response_cache(tmp_path):
+    path: str = str(tmp_path / "cache.sqlite3")
+    response_cache: ResponseCache = ResponseCache(path=path)
+
+    # responses without validators are not cached
+    response_cache.store("no-validator", get_response({}))
+    assert response_cache.get("no-validator") is None
+
+    response_cache.store("group", get_response({"ETag": '"abc"'}))
+    response_cache.store(
+        "group/events",
+        get_response({"ETag": '"def"', "Link": '<https://next>; rel="next"'}),
+    )
+    response_cache.close()
+
+    # the cache is persistent
+    response_cache = ResponseCache(path=path)
+    cached_response: CachedResponse = response_cache.get("group")
+    assert cached_response.body == b"data"
+    assert cached_response.conditional_headers() == {"If-None-Match": '"abc"'}
+    assert cached_response.links() == {}
+
+    # the Link header is kept for the pagination of revalidated pages
+    assert response_cache.get("group/events").links()["next"]["url"] == "https://next"
+
+    response_cache.record_hit(cached_response)
+    response_cache.record_miss()
+    assert response_cache.hits == 1
+    assert response_cache.misses == 1
+    assert response_cache.bytes_saved == 4
+
+
+def test_get_with_response_cache(mock_api_client):
+    api_client, adapter = mock_api_client(response_cache=ResponseCache(path=":memory:"))
+    adapter.register_uri(
+        "GET",
+        "mock://api.meetup.com/Meetup-API-Testing",
+        [
+            {
+                "status_code": 200,
+                "json": {"id": 1},
+                "headers": {
+                    **rate_limit_headers,
+                    "ETag": '"v1"',
+                    "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+                },
+            },
+            {"status_code": 304, "headers": rate_limit_headers},
+        ],
+    )
+
+    # first request is downloaded
+    assert api_client.get("Meetup-API-Testing") == {"id": 1}
+    assert "If-None-Match" not in adapter.last_request.headers
+
+    # then it is revalidated
+    assert api_client.get("Meetup-API-Testing") == {"id": 1}
+    assert adapter.last_request.headers["If-None-Match"] == '"v1"'
+    assert (
+        adapter.last_request.headers["If-Modified-Since"]
+        == "Wed, 21 Oct 2015 07:28:00 GMT"
+    )
+
+    with pytest.raises(HttpNotModified):
+        api_client.get("Meetup-API-Testing", skip_unchanged=True)
+
+    assert api_client.response_cache.misses == 1
+    assert api_client.response_cache.hits == 2
+    assert api_client.response_cache.bytes_saved == 2 * len(b'{"id": 1}')
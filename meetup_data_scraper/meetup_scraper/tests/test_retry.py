@@ -0,0 +1,98 @@
+import time
+import requests
+import requests_mock
+from email.utils import formatdate
+from meetup_data_scraper.meetup_scraper.meetup_api_client.retry import RetryPolicy
+
+
+def get_response(headers: dict) -> requests.Response:
+    """
+    create a fake http response with headers
+    """
+    session = requests.Session()
+    adapter = requests_mock.Adapter()
+    session.mount("mock", adapter)
+    adapter.register_uri("GET", "mock://test.com", text="data", headers=headers)
+    return session.get("mock://test.com")
+
+
+def test_failure_class():
+    assert RetryPolicy.failure_class(429) == "429"
+    assert RetryPolicy.failure_class(500) == "5xx"
+    assert RetryPolicy.failure_class(503) == "5xx"
+    assert RetryPolicy.failure_class(400) == "4xx"
+
+
+def test_should_retry():
+    retry_policy: RetryPolicy = RetryPolicy(max_retries={"5xx": 2}, budget=3)
+
+    # max retries per failure class
+    assert retry_policy.should_retry(failure="5xx", retry=0) is True
+    assert retry_policy.should_retry(failure="5xx", retry=1) is True
+    assert retry_policy.should_retry(failure="5xx", retry=2) is False
+    assert retry_policy.should_retry(failure="unknown", retry=0) is False
+
+    # max retries of the request
+    assert retry_policy.should_retry(failure="5xx", retry=2, max_retry=3) is True
+
+    # the budget of the run is used up
+    assert retry_policy.should_retry(failure="429", retry=0) is False
+    assert retry_policy.retries == 3
+    assert retry_policy.report() == "3 of 3 retries used"
+
+
+def test_retry_after():
+    assert RetryPolicy.retry_after(None) is None
+    assert RetryPolicy.retry_after(get_response({})) is None
+    assert RetryPolicy.retry_after(get_response({"Retry-After": "120"})) == 120
+    assert RetryPolicy.retry_after(get_response({"Retry-After": "invalid"})) is None
+
+    retry_after: float = RetryPolicy.retry_after(
+        get_response({"Retry-After": formatdate(time.time() + 30, usegmt=True)})
+    )
+    assert 28 <= retry_after <= 30
+
+
+def test_next_delay():
+    retry_policy: RetryPolicy = RetryPolicy(base_delay=1, max_delay=10)
+
+    delay: float = 0
+    for _ in range(20):
+        previous_delay: float = delay
+        delay = retry_policy.next_delay(previous_delay=delay)
+        assert 1 <= delay <= max(1, min(10, previous_delay * 3))
+
+    # Retry-After is respected even above max_delay
+    delay = retry_policy.next_delay(
+        previous_delay=0, response=get_response({"Retry-After": "30"})
+    )
+    assert delay == 30
+
+
+def test_get_retries_with_backoff(mock_api_client):
+    api_client, adapter = mock_api_client(
+        retry_policy=RetryPolicy(base_delay=0.01, max_delay=0.05)
+    )
+
+    # 2 failures, then success
+    adapter.register_uri(
+        "GET",
+        "mock://api.meetup.com/Meetup-API-Testing",
+        [
+            {"status_code": 503},
+            {"status_code": 429, "headers": {"Retry-After": "0"}},
+            {
+                "status_code": 200,
+                "json": {"id": 1},
+                "headers": {
+                    "X-RateLimit-Limit": "30",
+                    "X-RateLimit-Remaining": "30",
+                    "X-RateLimit-Reset": "10",
+                },
+            },
+        ],
+    )
+
+    assert api_client.get("Meetup-API-Testing") == {"id": 1}
+    assert adapter.call_count == 3
+    assert api_client.retry_policy.retries == 2
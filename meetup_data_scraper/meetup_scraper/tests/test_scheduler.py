@@ -0,0 +1,113 @@
+import pytest
+from datetime import datetime, timedelta
+from django.utils import timezone
+from meetup_data_scraper.meetup_scraper.meetup_api_client.scheduler import (
+    CADENCE_EVENTS,
+    get_due_groups,
+    get_event_cadence,
+    get_latest_event_times,
+    get_update_interval,
+)
+from meetup_data_scraper.meetup_scraper.models import EventPage, GroupPage, HomePage
+
+
+def test_get_update_interval(settings):
+    settings.MEETUP_API_SCHEDULE_MIN_INTERVAL = 1
+    settings.MEETUP_API_SCHEDULE_MAX_INTERVAL = 90
+    settings.MEETUP_API_SCHEDULE_DEFAULT_INTERVAL = 7
+    now: datetime = timezone.now()
+    weekly: [datetime] = [now - timedelta(days=7 * week) for week in range(5)]
+
+    # one long break does not change the median gap
+    assert get_event_cadence(weekly + [now - timedelta(days=365)]) == timedelta(
+        days=7
+    )
+    assert get_event_cadence([now]) is None
+
+    assert get_update_interval(weekly, now=now) == timedelta(days=7)
+    assert get_update_interval([], now=now) == timedelta(days=7)
+    assert get_update_interval(
+        [now - timedelta(hours=hour) for hour in range(5)], now=now
+    ) == timedelta(days=1)
+
+    # the interval of a silent group grows up to the max interval
+    assert get_update_interval(
+        [time - timedelta(days=40) for time in weekly], now=now
+    ) == timedelta(days=10)
+    assert get_update_interval(
+        [time - timedelta(days=5 * 365) for time in weekly], now=now
+    ) == timedelta(days=90)
+
+
+def create_group(urlname: str, meetup_id: int, event_days: [int]) -> GroupPage:
+    """
+    create a group with events, which were the given days ago
+    """
+    home_page: HomePage = HomePage.objects.all()[:1].get()
+    group: GroupPage = home_page.add_child(
+        instance=GroupPage(
+            title=urlname,
+            slug=urlname,
+            urlname=urlname,
+            meetup_id=meetup_id,
+            name=urlname,
+            link="https://localhost/",
+            members=0,
+            status="active",
+            timezone="UTC",
+            visibility="public",
+        )
+    )
+    for days in event_days:
+        event_id: str = "{}-{}".format(urlname, days)
+        group.add_child(
+            instance=EventPage(
+                title=event_id,
+                slug=event_id,
+                meetup_id=event_id,
+                name=event_id,
+                link="https://localhost/",
+                time=timezone.now() - timedelta(days=days),
+            )
+        )
+    return group
+
+
+@pytest.mark.django_db()
+def test_get_due_groups(django_assert_num_queries):
+    now: datetime = timezone.now()
+    never_updated: GroupPage = create_group("never-updated", 1, [])
+    weekly: GroupPage = create_group("weekly", 2, [0, 7, 14, 21])
+    dormant: GroupPage = create_group(
+        "dormant", 3, [5 * 365, 5 * 365 + 7, 5 * 365 + 14]
+    )
+    GroupPage.objects.filter(pk__in=[weekly.pk, dormant.pk]).update(
+        events_updated=now - timedelta(days=14)
+    )
+
+    # never updated groups are first, the dormant group is not due
+    assert get_due_groups(now=now) == [never_updated, weekly]
+
+    # the most overdue group is first
+    GroupPage.objects.filter(pk=dormant.pk).update(
+        events_updated=now - timedelta(days=200)
+    )
+    assert get_due_groups(now=now) == [never_updated, dormant, weekly]
+
+    # the event times of all groups are loaded by one query, the latest first
+    with django_assert_num_queries(2):
+        get_due_groups(now=now)
+    latest_event_times: dict = get_latest_event_times([weekly, never_updated])
+    assert list(latest_event_times) == [weekly.pk]
+    assert latest_event_times[weekly.pk] == sorted(
+        latest_event_times[weekly.pk], reverse=True
+    )
+    assert len(latest_event_times[weekly.pk]) == 4
+
+    # only the latest CADENCE_EVENTS events of a group are loaded
+    busy: GroupPage = create_group("busy", 4, list(range(CADENCE_EVENTS + 5)))
+    assert get_latest_event_times([busy])[busy.pk] == list(
+        EventPage.objects.filter(group=busy)
+        .order_by("-time")
+        .values_list("time", flat=True)[:CADENCE_EVENTS]
+    )